@@ -0,0 +1,42 @@
+"""
+Compares fetching users one request at a time with fetching them in JSON batches, from msgraph.fake.FakeGraph
+
+Each request served by the stand-in is delayed by --latency milliseconds, a stand-in
+for the round trip to the API endpoint which batching amortizes.
+
+Usage:
+    python benchmarks/batching.py [--number 200] [--latency 5]
+"""
+import argparse
+import common
+from msgraph import batch, fake, user
+
+
+def run(report, number=200, latency=5.0):
+    graph = fake.FakeGraph(latency=latency / 1000.0)
+    rows = graph.add_many('users', [dict(displayName='User %i' % index, userPrincipalName='user%i@example.com' % index) for index in range(number)])
+    api_instance = graph.api()
+    ids = [row['id'] for row in rows]
+
+    def sequential():
+        for id in ids:
+            user.User.get(api_instance, user=id)
+
+    def batched():
+        with batch.Batch(api_instance) as queue:
+            requests = [queue.request('users/%s' % id) for id in ids]
+        for request in requests:
+            user.User.from_api(request.result())
+
+    elapsed = common.best_of(sequential)
+    report.add('%i users, one request each, %.0f ms latency' % (number, latency), number / elapsed, 'items/s')
+    elapsed = common.best_of(batched)
+    report.add('%i users, batches of %i, %.0f ms latency' % (number, batch.Batch.limit, latency), number / elapsed, 'items/s')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark of JSON batching')
+    parser.add_argument('--number', dest='number', type=int, default=200, help='Users fetched per measurement')
+    parser.add_argument('--latency', dest='latency', type=float, default=5.0, help='Milliseconds each request to the stand-in is delayed')
+    args = parser.parse_args()
+    run(common.Report(), number=args.number, latency=args.latency)
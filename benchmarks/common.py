@@ -0,0 +1,68 @@
+"""
+Timing and reporting shared by the benchmarks
+
+Results are printed as they are measured, and can be saved as JSON to compare a
+later run (or another release) against.  Rates (units ending in /s) are better
+when higher, every other unit is better when lower.
+"""
+import collections
+import json
+import os
+import platform
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+import msgraph
+
+
+def best_of(function, repeat=3):
+    """
+    Runs function repeat times
+
+    Returns:
+        float:  The fewest seconds a single run took
+    """
+    timings = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started_at)
+    return min(timings)
+
+
+class Report(object):
+    """
+    The results of a run of benchmarks, keyed by name
+    """
+
+    def __init__(self):
+        self.results = collections.OrderedDict()
+
+    def add(self, name, value, unit):
+        self.results[name] = dict(value=value, unit=unit)
+        print('%-55s %14.3f %s' % (name, value, unit))
+        sys.stdout.flush()
+
+    def save(self, path):
+        data = dict(
+            version=msgraph.__version__,
+            python=platform.python_version(),
+            platform=platform.platform(),
+            created_at=time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+            results=self.results
+        )
+        with open(path, 'w') as output_file:
+            json.dump(data, output_file, indent=2)
+
+    def compare(self, path):
+        with open(path) as input_file:
+            baseline = json.load(input_file)
+        print('\nCompared to %s (version %s, created %s):' % (path, baseline.get('version'), baseline.get('created_at')))
+        for name, result in self.results.items():
+            previous = baseline['results'].get(name)
+            if not previous or not previous['value'] or previous['unit'] != result['unit']:
+                continue
+            change = (result['value'] - previous['value']) / previous['value'] * 100
+            better = change > 0 if result['unit'].endswith('/s') else change < 0
+            print('%-55s %+9.1f%% %s' % (name, change, 'better' if better else 'worse'))
@@ -0,0 +1,98 @@
+"""
+Measures building DriveItem, Event and User instances from representative API payloads
+
+Usage:
+    python benchmarks/from_api.py [--number 20000]
+"""
+import argparse
+import common
+from msgraph import calendar, files, user
+
+
+drive_item = {
+    '@microsoft.graph.downloadUrl': 'https://contoso.sharepoint.com/_layouts/15/download.aspx?UniqueId=0123',
+    'createdDateTime': '2019-03-14T15:09:26Z',
+    'eTag': '"{0C4B8E8B-2B71-4F15-9DA8-6B5E6E8A1234},3"',
+    'id': '01BYE5RZ4LRZFSYH5FENF7UTLVZ2VZSL7N',
+    'lastModifiedDateTime': '2019-03-14T15:09:26.535897Z',
+    'name': 'Quarterly report.docx',
+    'webUrl': 'https://contoso.sharepoint.com/Documents/Quarterly%20report.docx',
+    'cTag': '"c:{0C4B8E8B-2B71-4F15-9DA8-6B5E6E8A1234},2"',
+    'size': 28371,
+    'createdBy': {'user': {'email': 'user@contoso.com', 'id': '48d31887-5fad-4d73-a9f5-3c356e68a038', 'displayName': 'Megan Bowen'}},
+    'lastModifiedBy': {'user': {'email': 'user@contoso.com', 'id': '48d31887-5fad-4d73-a9f5-3c356e68a038', 'displayName': 'Megan Bowen'}},
+    'parentReference': {'driveId': 'b!-RIj2DuyvEyV1T4NlOaMHk8XkS_I8MdFlUCq1BlcjgmhRfAj3-Z8RY2VpuvV_tpd', 'driveType': 'business', 'id': '01BYE5RZ56Y2GOVW7725BZO354PWSELRRZ', 'path': '/drive/root:/Documents'},
+    'file': {'mimeType': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document', 'hashes': {'quickXorHash': 'WxwbQ4nc5yCg6fO0ln3GeKUJ4Ao='}},
+    'fileSystemInfo': {'createdDateTime': '2019-03-14T15:09:26Z', 'lastModifiedDateTime': '2019-03-14T15:09:26Z'}
+}
+
+event = {
+    'id': 'AAMkAGIAAAoZDOFAAA=',
+    'createdDateTime': '2019-03-14T15:09:26.5358979Z',
+    'lastModifiedDateTime': '2019-03-14T15:09:26.5358979Z',
+    'changeKey': 'ZlnW4RIAV06KYYwlrfNZvQAAKGWwbw==',
+    'categories': [],
+    'originalStartTimeZone': 'Pacific Standard Time',
+    'originalEndTimeZone': 'Pacific Standard Time',
+    'iCalUId': '040000008200E00074C5B7101A82E00800000000D3A5C6BC',
+    'reminderMinutesBeforeStart': 15,
+    'isReminderOn': True,
+    'hasAttachments': False,
+    'subject': 'Weekly planning',
+    'bodyPreview': 'Agenda for the week',
+    'importance': 'normal',
+    'sensitivity': 'normal',
+    'isAllDay': False,
+    'isCancelled': False,
+    'isOrganizer': True,
+    'responseRequested': True,
+    'showAs': 'busy',
+    'type': 'singleInstance',
+    'webLink': 'https://outlook.office365.com/owa/?itemid=AAMkAGIAAAoZDOFAAA%3D',
+    'responseStatus': {'response': 'organizer', 'time': '0001-01-01T00:00:00Z'},
+    'body': {'contentType': 'html', 'content': '<html><body>Agenda for the week</body></html>'},
+    'start': {'dateTime': '2019-03-18T09:00:00.0000000', 'timeZone': 'UTC'},
+    'end': {'dateTime': '2019-03-18T10:00:00.0000000', 'timeZone': 'UTC'},
+    'location': {'displayName': 'Conf Room 1', 'locationType': 'default', 'uniqueId': 'Conf Room 1', 'uniqueIdType': 'private'},
+    'locations': [{'displayName': 'Conf Room 1', 'locationType': 'default', 'uniqueId': 'Conf Room 1', 'uniqueIdType': 'private'}],
+    'attendees': [
+        {'type': 'required', 'status': {'response': 'accepted', 'time': '2019-03-14T15:10:00Z'}, 'emailAddress': {'name': 'Megan Bowen', 'address': 'megan@contoso.com'}},
+        {'type': 'optional', 'status': {'response': 'none', 'time': '0001-01-01T00:00:00Z'}, 'emailAddress': {'name': 'Alex Wilber', 'address': 'alex@contoso.com'}}
+    ],
+    'organizer': {'emailAddress': {'name': 'Megan Bowen', 'address': 'megan@contoso.com'}}
+}
+
+user_data = {
+    'id': '48d31887-5fad-4d73-a9f5-3c356e68a038',
+    'businessPhones': ['+1 412 555 0109'],
+    'displayName': 'Megan Bowen',
+    'givenName': 'Megan',
+    'jobTitle': 'Auditor',
+    'mail': 'megan@contoso.com',
+    'mobilePhone': None,
+    'officeLocation': '12/1110',
+    'preferredLanguage': 'en-US',
+    'surname': 'Bowen',
+    'userPrincipalName': 'megan@contoso.com'
+}
+
+payloads = [
+    ('DriveItem.from_api', files.DriveItem.from_api, drive_item),
+    ('Event.from_api', calendar.Event.from_api, event),
+    ('User.from_api', user.User.from_api, user_data),
+]
+
+
+def run(report, number=20000):
+    for name, factory, payload in payloads:
+        # from_api may mutate nested values (such as the recurrence), so each instance gets its own copy
+        rows = [dict(payload) for _ in range(number)]
+        elapsed = common.best_of(lambda: [factory(row) for row in rows])
+        report.add('%s (%i rows)' % (name, number), elapsed / number * 1e6, 'us/instance')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark of building instances from API payloads')
+    parser.add_argument('--number', dest='number', type=int, default=20000, help='Instances built per measurement')
+    args = parser.parse_args()
+    run(common.Report(), number=args.number)
@@ -0,0 +1,42 @@
+"""
+Measures following @odata.nextLink through large collections of users served by msgraph.fake.FakeGraph
+
+The collection is served in-process by default, or over a local HTTP server with
+--http to include the cost of sockets and of requests.
+
+Usage:
+    python benchmarks/paging.py [--counts 10000,100000,1000000] [--page-size 999] [--http]
+"""
+import argparse
+import common
+from msgraph import fake, paging, user
+
+
+def run(report, counts=(10000, 100000), page_size=999, http=False):
+    for count in counts:
+        graph = fake.FakeGraph(page_size=page_size)
+        graph.add_many('users', (dict(id='%08i' % index, displayName='User %i' % index, userPrincipalName='user%i@example.com' % index, mail='user%i@example.com' % index) for index in range(count)))
+        transport = 'http' if http else 'in-process'
+        if http:
+            graph.serve()
+            api_instance = graph.api(transport=None)
+        else:
+            api_instance = graph.api()
+        try:
+            raw = common.best_of(lambda: list(paging.paginate(api_instance, 'users', lambda row: row)), repeat=1)
+            report.add('paging %i users, raw rows, %s' % (count, transport), count / raw, 'items/s')
+            instances = common.best_of(lambda: user.User.get(api_instance, as_list=True), repeat=1)
+            report.add('paging %i users, User instances, %s' % (count, transport), count / instances, 'items/s')
+            prefetched = common.best_of(lambda: list(user.User.get(api_instance, prefetch=True)), repeat=1)
+            report.add('paging %i users, prefetched, %s' % (count, transport), count / prefetched, 'items/s')
+        finally:
+            graph.shutdown()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark of paging through collections')
+    parser.add_argument('--counts', dest='counts', default='10000,100000', help='Comma separated sizes of the collection')
+    parser.add_argument('--page-size', dest='page_size', type=int, default=999, help='Rows in each page')
+    parser.add_argument('--http', dest='http', action='store_true', help='Serve the collection over a local HTTP server')
+    args = parser.parse_args()
+    run(common.Report(), counts=[int(count) for count in args.counts.split(',')], page_size=args.page_size, http=args.http)
@@ -0,0 +1,56 @@
+"""
+Compares msgraph.base.Base.parse_date_time with the strptime-based parser it replaced
+
+Usage:
+    python benchmarks/parse_date_time.py [--number 100000]
+"""
+import argparse
+import timeit
+from datetime import datetime
+import common
+from msgraph import base
+
+
+samples = ['2019-03-14T15:09:26.535897Z', '2019-03-14T15:09:26Z', '2019-03-14T15:09:26.5358979', '2019-03-14 15:09:26', '2019-03-14']
+
+
+def strptime_parse_date_time(text):
+    formats = [base.Base.extended_datetime_format, base.Base.full_datetime_format, base.Base.datetime_format, base.Base.standard_datetime_format, base.Base.iso_format, base.Base.date_format]
+    for format in formats:
+        try:
+            return datetime.strptime(text, format)
+        except Exception:
+            pass
+    return None
+
+
+def unique_timestamps(count):
+    return ['2019-03-14T15:%02i:%02i.%07iZ' % (index // 60 % 60, index % 60, index) for index in range(count)]
+
+
+def measure(function, values, number):
+    def run():
+        for value in values:
+            function(value)
+    elapsed = min(timeit.repeat(run, number=1, repeat=3))
+    return elapsed / len(values) * 1e6
+
+
+def run(report, number=100000):
+    repeated = (samples * (number // len(samples) + 1))[:number]
+    unique = unique_timestamps(number)
+    rows = [
+        ('strptime, repeated values', strptime_parse_date_time, repeated),
+        ('parse_date_time, repeated values', base.Base.parse_date_time, repeated),
+        ('strptime, unique values', strptime_parse_date_time, unique),
+        ('parse_date_time, unique values', base.Base.parse_date_time, unique),
+    ]
+    for name, function, values in rows:
+        report.add(name, measure(function, values, number), 'us/timestamp')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark of msgraph.base.Base.parse_date_time')
+    parser.add_argument('--number', dest='number', type=int, default=100000, help='Timestamps parsed per measurement')
+    args = parser.parse_args()
+    run(common.Report(), number=args.number)
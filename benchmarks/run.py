@@ -0,0 +1,44 @@
+"""
+Runs every benchmark offline, optionally saving the results and comparing them to a previous run
+
+Usage:
+    python benchmarks/run.py [--quick] [--output results.json] [--baseline previous.json] [--only paging,transfer,threads]
+"""
+import argparse
+import collections
+import common
+import batching
+import from_api
+import paging
+import parse_date_time
+import threads
+import transfer
+
+
+benchmarks = collections.OrderedDict([
+    ('from_api', (from_api.run, dict(number=20000), dict(number=2000))),
+    ('parse_date_time', (parse_date_time.run, dict(number=100000), dict(number=10000))),
+    ('paging', (paging.run, dict(counts=(10000, 100000)), dict(counts=(10000,)))),
+    ('batching', (batching.run, dict(number=200), dict(number=40))),
+    ('transfer', (transfer.run, dict(size=64), dict(size=8))),
+    ('threads', (threads.run, dict(threads=100, number=5000), dict(threads=32, number=500))),
+])
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Runs the benchmarks of msgraph')
+    parser.add_argument('--quick', dest='quick', action='store_true', help='Use smaller workloads, for a quick check rather than tracking')
+    parser.add_argument('--only', dest='only', default=','.join(benchmarks), help='Comma separated benchmarks to run, any of %s' % ', '.join(benchmarks))
+    parser.add_argument('--output', dest='output', help='Save the results as JSON to this path')
+    parser.add_argument('--baseline', dest='baseline', help='Compare the results to those saved by a previous run')
+    args = parser.parse_args()
+
+    report = common.Report()
+    for name in args.only.split(','):
+        function, options, quick_options = benchmarks[name]
+        print('\n%s' % name)
+        function(report, **(quick_options if args.quick else options))
+    if args.output:
+        report.save(args.output)
+    if args.baseline:
+        report.compare(args.baseline)
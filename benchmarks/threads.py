@@ -0,0 +1,125 @@
+"""
+Stress test of a GraphAPI shared by a pool of threads, served over HTTP by msgraph.fake.FakeGraph
+
+Every thread fetches users by ID and checks that it received the user it asked
+for, while the access token is renewed in the background and swapped with
+set_access_token from another thread.  Every request must carry a token which
+was issued, and no request may fail.  The throughput of a single shared instance
+(with a shared session, then with a session per thread) is compared to that of
+an instance per thread, each authenticating (for --auth-latency milliseconds) on
+its first request.
+
+Usage:
+    python benchmarks/threads.py [--threads 100] [--number 5000] [--latency 2] [--auth-latency 200]
+"""
+import argparse
+import itertools
+import threading
+import time
+import common
+from concurrent import futures
+from msgraph import api, fake, user
+
+
+class CheckedGraph(fake.FakeGraph):
+    """
+    A FakeGraph which records the Authorization header of every request
+    """
+
+    def __init__(self, **kwargs):
+        super(CheckedGraph, self).__init__(**kwargs)
+        self.authorizations = set()
+
+    def handle(self, method, url, headers, body):
+        self.authorizations.add(headers.get('Authorization'))
+        return super(CheckedGraph, self).handle(method, url, headers, body)
+
+
+class Authority(object):
+    """
+    Issues short-lived access tokens, counting the authentications
+    """
+
+    def __init__(self, latency, lifetime):
+        self.latency = latency
+        self.lifetime = lifetime
+        self.issued = set()
+        self._counter = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def authenticate(self, latency=None):
+        time.sleep(self.latency if latency is None else latency)
+        token = api.Token(str(self.lifetime), None, 'fake', 'Bearer', 'token-%i' % next(self._counter))
+        with self._lock:
+            self.issued.add(str(token))
+        return token
+
+
+def fetch(api_for_thread, ids, threads):
+    def get(id):
+        found = user.User.get(api_for_thread(), user=id)
+        if found.id != id:
+            raise AssertionError('Asked for user %s, received user %s' % (id, found.id))
+
+    with futures.ThreadPoolExecutor(max_workers=threads) as executor:
+        for result in executor.map(get, ids):
+            pass
+
+
+def run(report, threads=100, number=5000, latency=2.0, auth_latency=200.0):
+    graph = CheckedGraph(latency=latency / 1000.0)
+    rows = graph.add_many('users', [dict(displayName='User %i' % index, userPrincipalName='user%i@example.com' % index) for index in range(1000)])
+    ids = [rows[index % len(rows)]['id'] for index in range(number)]
+    graph.serve()
+    try:
+        for session_per_thread in (False, True):
+            authority = Authority(auth_latency / 1000.0, lifetime=2.0)
+            provider = api.TokenProvider(authority.authenticate, renew_before=1.0)
+            api_instance = graph.api(transport=None, token_provider=provider, pool_maxsize=threads, session_per_thread=session_per_thread)
+            swapping = threading.Event()
+
+            def swap():
+                while not swapping.wait(0.05):
+                    api_instance.set_access_token(authority.authenticate(latency=0))
+
+            swapper = threading.Thread(target=swap, daemon=True)
+            swapper.start()
+            try:
+                elapsed = common.best_of(lambda: fetch(lambda: api_instance, ids, threads), repeat=1)
+            finally:
+                swapping.set()
+                swapper.join()
+                provider.close()
+            unknown = graph.authorizations - authority.issued
+            if unknown:
+                raise AssertionError('Requests were sent with tokens which were never issued: %r' % sorted(unknown))
+            stats = api_instance.pool_stats()
+            label = 'a session per thread' if session_per_thread else 'a shared session'
+            report.add('%i threads, one shared instance, %s' % (threads, label), number / elapsed, 'requests/s')
+            report.add('%i threads, one shared instance, %s, tokens used' % (threads, label), len(graph.authorizations), 'tokens')
+            report.add('%i threads, one shared instance, %s, saturated' % (threads, label), stats['saturated'], 'requests')
+            graph.authorizations.clear()
+
+        authority = Authority(auth_latency / 1000.0, lifetime=3600.0)
+        local = threading.local()
+
+        def api_for_thread():
+            if getattr(local, 'api', None) is None:
+                local.api = graph.api(transport=None, token_provider=api.TokenProvider(authority.authenticate, background=False))
+            return local.api
+
+        elapsed = common.best_of(lambda: fetch(api_for_thread, ids, threads), repeat=1)
+        report.add('%i threads, an instance per thread' % threads, number / elapsed, 'requests/s')
+        report.add('%i threads, an instance per thread, authentications' % threads, len(authority.issued), 'calls')
+    finally:
+        graph.shutdown()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Stress test of a GraphAPI shared between threads')
+    parser.add_argument('--threads', dest='threads', type=int, default=100, help='Threads sharing the instance')
+    parser.add_argument('--number', dest='number', type=int, default=5000, help='Users fetched per measurement')
+    parser.add_argument('--latency', dest='latency', type=float, default=2.0, help='Milliseconds each request to the stand-in is delayed')
+    parser.add_argument('--auth-latency', dest='auth_latency', type=float, default=200.0, help='Milliseconds each authentication takes')
+    args = parser.parse_args()
+    run(common.Report(), threads=args.threads, number=args.number, latency=args.latency, auth_latency=args.auth_latency)
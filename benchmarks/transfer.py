@@ -0,0 +1,46 @@
+"""
+Measures the throughput of uploads and downloads of a drive served by msgraph.fake.FakeGraph
+
+Content is served over a local HTTP server, so the numbers include the cost of
+sockets, of requests and of reading and writing the files.
+
+Usage:
+    python benchmarks/transfer.py [--size 64] [--chunk-size 10]
+"""
+import argparse
+import os
+import tempfile
+import common
+from msgraph import fake, files
+
+
+def run(report, size=64, chunk_size=10):
+    content = os.urandom(size * 1024 * 1024)
+    graph = fake.FakeGraph()
+    graph.add('users', displayName='Megan Bowen', userPrincipalName='megan@contoso.com')
+    graph.serve()
+    api_instance = graph.api(transport=None)
+    folder = graph.drive('me').add_folder('benchmarks')
+    directory = tempfile.mkdtemp()
+    destination = os.path.join(directory, 'download.bin')
+    try:
+        elapsed = common.best_of(lambda: files.DriveItem.upload_large(api_instance, content, parent=folder['id'], file_name='upload.bin', chunk_size=chunk_size * 1024 * 1024))
+        report.add('upload session, %i MiB in %i MiB chunks' % (size, chunk_size), size / elapsed, 'MiB/s')
+        item = files.DriveItem.get_by_path(api_instance, 'benchmarks/upload.bin')
+        elapsed = common.best_of(lambda: item.download(api_instance, destination))
+        report.add('streamed download, %i MiB' % size, size / elapsed, 'MiB/s')
+        elapsed = common.best_of(lambda: item.download(api_instance, destination, parallel=True, segment_size=8 * 1024 * 1024))
+        report.add('ranged download, %i MiB in 8 MiB segments' % size, size / elapsed, 'MiB/s')
+    finally:
+        graph.shutdown()
+        if os.path.exists(destination):
+            os.remove(destination)
+        os.rmdir(directory)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark of uploads and downloads')
+    parser.add_argument('--size', dest='size', type=int, default=64, help='MiB of content transferred')
+    parser.add_argument('--chunk-size', dest='chunk_size', type=int, default=10, help='MiB sent by each request of the upload session')
+    args = parser.parse_args()
+    run(common.Report(), size=args.size, chunk_size=args.chunk_size)
@@ -0,0 +1,301 @@
+import asyncio
+import functools
+import json
+import logging
+from msgraph import api, coalesce, exception, metrics, paging, retry
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncGraphAPI(object):
+    """
+    An asyncio wrapper for the Microsoft Graph API
+
+    Mirrors msgraph.api.GraphAPI, but AsyncGraphAPI.request is a coroutine sending
+    requests through a single aiohttp.ClientSession, so many requests can be
+    awaited concurrently from a single event loop.  Requires the aiohttp package.
+
+    Attributes:
+        authority_host_uri (str):  The service to login through
+        tenant (str): The tenant ID of the instance
+        resource_uri (str): The host of the API service
+        client_id (str):  The client ID
+        client_certificate (str): The contents of the authenticating SSL certificate
+        client_thumbprint (str): The thumbprint corresponding to the client_certificate
+        retry (msgraph.retry.RetryScheduler):  Decides if and when throttled or failed requests are retried, None to never retry
+        token_provider (msgraph.api.TokenProvider):  Renews the access token before it expires, None to use the access token as-is
+        connection_limit (int):  The maximum number of simultaneous connections to the API endpoint
+        timeout (tuple):  The number of seconds to wait to connect to the API endpoint, and between two bytes of its response, None to wait forever, default: (10, 300)
+        hooks (list):  Called with a msgraph.metrics.RequestEvent after each call to the API endpoint, such as a msgraph.metrics.MetricsRegistry
+        single_flight (msgraph.coalesce.SingleFlight):  Shares a single request between identical GET requests awaited concurrently, None to send every request
+        rate_limiter (msgraph.ratelimit.RateLimiter):  Paces the requests sent below the throttling limits of the API endpoint, None to never pace requests
+
+    Example:
+        from msgraph import aio, user
+
+        async def main():
+            async with await aio.AsyncGraphAPI.from_certificate(authority_host_uri, tenant, resource_uri, client_id, client_certificate, client_thumbprint) as api_instance:
+                users = await asyncio.gather(*[user.User.get_async(api_instance, name) for name in user_principal_names])
+    """
+
+    def __init__(self, authority_host_uri, tenant, resource_uri, client_id, access_token, **kwargs):
+        if aiohttp is None:
+            raise ImportError('AsyncGraphAPI requires the aiohttp package')
+        self.authority_host_uri = authority_host_uri
+        self.tenant = tenant
+        self.resource_uri = resource_uri
+        self.client_id = client_id
+        self._static_token = access_token
+        self.client_certificate = kwargs.get('client_certificate')
+        self.certificate_thumbprint = kwargs.get('certificate_thumbprint')
+        self.token_provider = kwargs.get('token_provider')
+        self.retry = kwargs.get('retry', retry.RetryScheduler(budget=retry.RetryBudget(), gate=retry.BackoffGate.for_tenant(tenant)))
+        self.connection_limit = kwargs.get('connection_limit', 100)
+        self.timeout = kwargs.get('timeout', (10.0, 300.0))
+        self.hooks = list(kwargs.get('hooks') or [])
+        self.single_flight = kwargs.get('single_flight')
+        self.rate_limiter = kwargs.get('rate_limiter')
+        self._session = None
+
+    def __repr__(self):
+        return '<%s %s authority_host_uri=%r, tenant ID=%r, resource URI=%r, client ID=%r>' % (self.__class__.__name__, id(self), self.authority_host_uri, self.tenant, self.resource_uri, self.client_id)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """
+        Stops renewing the access token in the background, and closes the connections to the API endpoint
+        """
+        if self.token_provider:
+            self.token_provider.close()
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _get_session(self):
+        if self._session is None:
+            connector = aiohttp.TCPConnector(limit=self.connection_limit)
+            timeout = aiohttp.ClientTimeout(total=None)
+            if self.timeout is not None:
+                timeout = aiohttp.ClientTimeout(total=None, sock_connect=self.timeout[0], sock_read=self.timeout[1])
+            self._session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+        return self._session
+
+    async def _get_token(self):
+        if self.token_provider is None:
+            return self._static_token
+        if self.token_provider.expired():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, getattr, self.token_provider, 'token')
+        return self.token_provider.token
+
+    def set_access_token(self, token):
+        """
+        Swaps the access token sent with requests, see msgraph.api.GraphAPI.set_access_token
+
+        Parameters:
+            token (msgraph.api.Token):  The new access token
+        """
+        if self.token_provider:
+            self.token_provider.replace(token)
+        else:
+            self._static_token = token
+
+    async def request(self, uri, **kwargs):
+        """
+        Makes a requested to the API endpoint
+
+        Parameters:
+            uri (str):  The specific endpoint which to send/receive data from
+
+        Keyword Arguments:
+            version (str):  The version of the API to use
+            data (object):  The payload to send to the API endpoint
+            json (obj):  The JSON payload to send the API endpoint
+            method (str):  The type of HTTP Method to call the API endpoint with
+            headers (dict):  Additional headers to send to the API endpoint
+            content_type (str):  The content type of the payload, default: application/json
+            authenticate (bool):  Send the access token, disable for pre-authenticated URLs such as upload sessions, default: True
+            params (dict):  The query parameters to send to the API endpoint
+
+        Returns:
+            object: The JSON response from the API
+
+        Raises:
+            MicrosoftException: The API call was not completed successsfully
+        """
+        if self.single_flight is not None and kwargs.get('method', 'GET').upper() == 'GET':
+            key = coalesce.SingleFlight.key(uri, **kwargs)
+            return await self.single_flight.do_async(key, functools.partial(self._observe, uri, **kwargs))
+        return await self._observe(uri, **kwargs)
+
+    async def _observe(self, uri, **kwargs):
+        if not self.hooks:
+            return await self._request(uri, None, **kwargs)
+        event = metrics.RequestEvent(kwargs.get('method', 'GET'))
+        try:
+            data = await self._request(uri, event, **kwargs)
+            if isinstance(data, dict) and isinstance(data.get('value'), list):
+                event.items = len(data['value'])
+            return data
+        except exception.MicrosoftException as e:
+            event.error = e
+            raise
+        finally:
+            event.finish(self.resource_uri)
+            metrics.emit(self.hooks, event)
+
+    async def _request(self, uri, event, **kwargs):
+        version = kwargs.pop('version', 'v1.0')
+        method = kwargs.pop('method', 'GET')
+        authenticate = kwargs.pop('authenticate', True)
+        if uri.startswith('https://') or uri.startswith('http://'):
+            url = uri
+        else:
+            url = '%s/%s/%s' % (self.resource_uri, '%s' % version, uri)
+        if event:
+            event.url = url
+        content_type = kwargs.pop('content_type', 'application/json')
+        headers = {
+            'Content-Type': content_type
+        }
+        token = None
+        if authenticate:
+            token = await self._get_token()
+            headers['Authorization'] = str(token)
+        method_specific_headers = kwargs.pop('headers', dict())
+        headers.update(method_specific_headers)
+        params = kwargs.pop('params', None)
+        if params:
+            kwargs['params'] = dict((key, str(value)) for key, value in params.items())
+        logger.info("Calling %s(%s)", url, method)
+        try:
+            status, content, data = await self._send(method, url, headers, event, **kwargs)
+            if status == 401 and authenticate and self.token_provider:
+                logger.warning('%s %r was not authorized, renewing access token', method, url)
+                loop = asyncio.get_running_loop()
+                token = await loop.run_in_executor(None, self.token_provider.refresh, token)
+                headers['Authorization'] = str(token)
+                status, content, data = await self._send(method, url, headers, event, **kwargs)
+        except Exception as e:
+            message = '%r %r request unsuccessful: %r' % (url, method, e)
+            logger.error(message, exc_info=1)
+            code = getattr(e, 'code', None)
+            raise exception.MicrosoftException(code, message)
+        if event:
+            event.bytes_received = len(content)
+        if data is None:
+            return content
+        logger.debug('%s - %r: %r', method, url, data)
+        if 'error' in data:
+            error = data['error']
+            code = error['code']
+            message = error['message']
+            logger.error(error)
+            raise exception.MicrosoftException(code, message)
+        return data
+
+    async def _send(self, method, url, headers, event=None, **kwargs):
+        session = self._get_session()
+        body_size = 0
+        if event:
+            body = kwargs.get('data')
+            if body is None and kwargs.get('json') is not None:
+                # aiohttp encodes the json keyword argument with json.dumps
+                body = json.dumps(kwargs['json'])
+            body_size = metrics.body_size(body)
+        attempt = 0
+        while True:
+            if self.retry:
+                if self.retry.gate:
+                    remaining = self.retry.gate.remaining()
+                    while remaining > 0:
+                        await asyncio.sleep(remaining)
+                        remaining = self.retry.gate.remaining()
+                if self.retry.budget:
+                    self.retry.budget.deposit()
+            if self.rate_limiter:
+                await self.rate_limiter.wait_async(url, kwargs.get('json'))
+            async with session.request(method, url, headers=headers, **kwargs) as response:
+                if event:
+                    event.sent(response.status, body_size)
+                if self.rate_limiter and response.status in (429, 503):
+                    self.rate_limiter.throttled(url)
+                delay = self.retry.delay(response.status, response.headers, attempt, method) if self.retry else None
+                if delay is None:
+                    content = await response.read()
+                    try:
+                        data = await response.json(content_type=None)
+                    except Exception:
+                        data = None
+                    return response.status, content, data
+            logger.warning('%s %r returned %s, retrying in %.2f seconds', method, url, response.status, delay)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    @classmethod
+    async def from_certificate(cls, authority_host_uri, tenant, resource_uri, client_id, client_certificate, certificate_thumbprint, **kwargs):
+        """
+        Creates an authenticated instance using an SSL certificate
+
+        Parameters:
+            authority_host_uri (str):  The service to login through
+            tenant (str): The tenant ID of the instance
+            resource_uri (str): The host of the API service
+            client_id (str):  The client ID
+            client_certificate (str): The contents of the authenticating SSL certificate
+            client_thumbprint (str): The thumbprint corresponding to the client_certificate
+
+        Keyword Arguments:
+            retry (msgraph.retry.RetryScheduler):  Decides if and when throttled or failed requests are retried, None to never retry
+            connection_limit (int):  The maximum number of simultaneous connections to the API endpoint, default: 100
+            renew_before (float):  The number of seconds before the access token expires at which it is renewed, default: 300
+            token_provider (msgraph.api.TokenProvider):  Renews the access token, None to never renew it
+
+        Returns:
+            AsyncGraphAPI:  The authenticated API instance
+
+        Raises:
+            MicrosoftAuthenticationException: failed to authenticate using the provided parameters
+            Exception: An unknown error occurred
+        """
+        loop = asyncio.get_running_loop()
+        authenticate = functools.partial(api.GraphAPI._authenticate_via_certificate, authority_host_uri, tenant, resource_uri, client_id, client_certificate, certificate_thumbprint)
+        access_token = await loop.run_in_executor(None, authenticate)
+        renew_before = kwargs.pop('renew_before', 300)
+        if 'token_provider' not in kwargs:
+            kwargs['token_provider'] = api.TokenProvider(authenticate, access_token, renew_before=renew_before)
+        return cls(authority_host_uri, tenant, resource_uri, client_id, access_token, client_certificate=client_certificate, certificate_thumbprint=certificate_thumbprint, **kwargs)
+
+
+async def collect(api, uri, factory, **kwargs):
+    """
+    Fetches every page of a collection from the API endpoint
+
+    Parameters:
+        api (AsyncGraphAPI):  The endpoint from which to fetch data
+        uri (str):  The endpoint of the collection
+        factory (callable):  Builds an instance from each row of the collection
+
+    Keyword Arguments:
+        params (dict):  The query parameters of the first page
+        version (str):  The version of the API to use
+        max_items (int):  The maximum number of instances to fetch, default: None
+
+    Returns:
+        list:  The instances built from every row of the collection
+    """
+    output = []
+    async for page in paging.AsyncPageIterator(api, uri, factory, **kwargs).pages():
+        output += page
+    return output
@@ -1,7 +1,13 @@
+import functools
 import logging
-import adal
-import requests
-from . import exception
+import threading
+import time
+from . import batch, cache, coalesce, exception, metrics, retry, transport
+
+try:
+    import adal
+except ImportError:  # pragma: no cover
+    adal = None
 
 
 logger = logging.getLogger(__name__)
@@ -52,6 +58,130 @@ class Token(object):
         return cls(expires_in, expires_on, resource, token_type, access_token)
 
 
+class TokenProvider(object):
+    """
+    Keeps the Token used to authenticate with the API endpoint valid
+
+    The token is renewed by a background timer `renew_before` seconds before it
+    expires, so requests only wait for authentication when the token has actually
+    expired (for example, after a failed renewal).  Concurrent refreshes are
+    coalesced into a single call to the authenticating function.  A Token and its
+    expiry are swapped together, so a thread never pairs a Token with the expiry
+    of another.
+
+    Attributes:
+        renew_before (float):  The number of seconds before the expiry of the token at which it is renewed
+        retry_interval (float):  The number of seconds to wait before retrying a failed background renewal
+        background (bool):  Renew the token on a background timer, rather than on the first request after it expires
+
+    Example:
+        provider = api.TokenProvider(lambda: api.GraphAPI._authenticate_via_certificate(authority_host_uri, tenant, resource_uri, client_id, client_certificate, client_thumbprint))
+        endpoint = api.GraphAPI(authority_host_uri, tenant, resource_uri, client_id, None, token_provider=provider)
+    """
+
+    def __init__(self, authenticate, token=None, **kwargs):
+        self.renew_before = kwargs.get('renew_before', 300)
+        self.retry_interval = kwargs.get('retry_interval', 30)
+        self.background = kwargs.get('background', True)
+        self._authenticate = authenticate
+        self._lock = threading.Lock()
+        self._timer = None
+        self._closed = False
+        self._current = (None, 0.0)
+        if token is not None:
+            self._set_token(token)
+
+    def __repr__(self):
+        return '<%s %s expires_in=%.0f, renew_before=%r, background=%r>' % (self.__class__.__name__, id(self), self._current[1] - time.time(), self.renew_before, self.background)
+
+    @property
+    def token(self):
+        """
+        The current Token, refreshed first if it has expired
+
+        Raises:
+            MicrosoftAuthenticationException: failed to renew the expired token
+        """
+        token, expires_at = self._current
+        if token is None or time.time() >= expires_at:
+            token = self.refresh(token)
+        return token
+
+    def expired(self):
+        """
+        Indicates if the current Token has expired, and must be refreshed before it can be used
+
+        Returns:
+            bool:  True if there is no valid Token, False otherwise
+        """
+        token, expires_at = self._current
+        return token is None or time.time() >= expires_at
+
+    def refresh(self, stale=None):
+        """
+        Acquires a new Token, unless the given stale Token has already been replaced
+
+        Parameters:
+            stale (Token, optional):  The Token which the caller found to be invalid
+
+        Returns:
+            Token:  The renewed Token
+
+        Raises:
+            MicrosoftAuthenticationException: failed to authenticate
+        """
+        with self._lock:
+            if self._current[0] is not stale and not self.expired():
+                return self._current[0]
+            token = self._authenticate()
+            self._set_token(token)
+            logger.info('Renewed access token for %r', token.resource)
+            return token
+
+    def replace(self, token):
+        """
+        Swaps in a Token acquired elsewhere, while other threads keep sending requests
+
+        Parameters:
+            token (Token):  The new Token
+        """
+        with self._lock:
+            self._set_token(token)
+
+    def close(self):
+        """
+        Stops renewing the Token in the background, an expired Token is still renewed when it is next used
+        """
+        self._closed = True
+        self._cancel()
+
+    def _cancel(self):
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+
+    def _set_token(self, token):
+        expires_at = time.time() + float(token.expires_in)
+        self._current = (token, expires_at)
+        if self.background:
+            self._schedule(max(0.0, expires_at - time.time() - self.renew_before))
+
+    def _schedule(self, delay):
+        self._cancel()
+        if self._closed:
+            return
+        self._timer = threading.Timer(delay, self._renew)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _renew(self):
+        try:
+            self.refresh(self._current[0])
+        except Exception:
+            logger.error('Failed to renew access token, retrying in %s seconds', self.retry_interval, exc_info=True)
+            self._schedule(self.retry_interval)
+
+
 class GraphAPI(object):
     """
     A wrapper for the Microsoft Graph API
@@ -65,6 +195,24 @@ class GraphAPI(object):
         client_id (str):  The client ID
         client_certificate (str): The contents of the authenticating SSL certificate
         client_thumbprint (str): The thumbprint corresponding to the client_certificate
+        retry (msgraph.retry.RetryScheduler):  Decides if and when throttled or failed requests are retried, None to never retry
+        token_provider (TokenProvider):  Renews the access token before it expires, None to use the access token as-is
+        hooks (list):  Called with a msgraph.metrics.RequestEvent after each call to the API endpoint, such as a msgraph.metrics.MetricsRegistry
+        cache (msgraph.cache.ResponseCache):  Remembers the responses of GET requests and revalidates them with If-None-Match, None to never cache responses
+        single_flight (msgraph.coalesce.SingleFlight):  Shares a single request between identical GET requests made concurrently, None to send every request
+        rate_limiter (msgraph.ratelimit.RateLimiter):  Paces the requests sent below the throttling limits of the API endpoint, None to never pace requests
+        transport (requests.Session):  Sends each HTTP request, any object with the request method of requests.Session, such as msgraph.transport.ReplayTransport, default: a session created by msgraph.transport.create_session with the pool_connections, pool_maxsize, pool_block, keep_alive, proxies, verify and cert keyword arguments
+        timeout (tuple):  The number of seconds to wait to connect to the API endpoint, and between two bytes of its response, None to wait forever, default: (10, 300)
+
+    An instance is safe to share between threads, so a pool of workers can share a
+    single authenticated instance rather than authenticating one per thread.  The
+    TokenProvider renews the access token once for every thread, and
+    set_access_token swaps it while requests are in flight.  The connections of the
+    transport are pooled: set pool_maxsize to the number of threads, and pass
+    session_per_thread=True to give each thread its own requests.Session sharing
+    those connections (see msgraph.transport.ThreadLocalSession).  The retry
+    scheduler, cache, single_flight, rate_limiter and hooks are shared as well, and
+    must be thread-safe, as are those of the msgraph package.
 
     Example:
         import api
@@ -83,14 +231,63 @@ class GraphAPI(object):
         self.tenant = tenant
         self.resource_uri = resource_uri
         self.client_id = client_id
-        self._access_token = access_token
+        self._static_token = access_token
         self.client_certificate = kwargs.get('client_certificate')
+        self.certificate_thumbprint = kwargs.get('certificate_thumbprint')
         self.certificate_footprint = kwargs.get('certificate_footprint')
-        self._session = requests.Session()
+        self.token_provider = kwargs.get('token_provider')
+        self.retry = kwargs.get('retry', retry.RetryScheduler(budget=retry.RetryBudget(), gate=retry.BackoffGate.for_tenant(tenant)))
+        if kwargs.get('transport'):
+            self.transport = kwargs['transport']
+        elif kwargs.get('session_per_thread'):
+            self.transport = transport.ThreadLocalSession(**kwargs)
+        else:
+            self.transport = transport.create_session(**kwargs)
+        self.timeout = kwargs.get('timeout', (10.0, 300.0))
+        self.hooks = list(kwargs.get('hooks') or [])
+        self.cache = kwargs.get('cache')
+        self.single_flight = kwargs.get('single_flight')
+        self.rate_limiter = kwargs.get('rate_limiter')
 
     def __repr__(self):
         return '<%s %s authority_host_uri=%r, tenant ID=%r, resource URI=%r, client ID=%r>' % (self.__class__.__name__, id(self), self.authority_host_uri, self.tenant, self.resource_uri, self.client_id)
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Stops renewing the access token in the background, and closes the connections of the transport
+        """
+        if self.token_provider:
+            self.token_provider.close()
+        close = getattr(self.transport, 'close', None)
+        if close is not None:
+            close()
+
+    @property
+    def _access_token(self):
+        if self.token_provider:
+            return self.token_provider.token
+        return self._static_token
+
+    def set_access_token(self, token):
+        """
+        Swaps the access token sent with requests, which is safe while other threads are sending requests
+
+        Requests already sent keep the token they were sent with.
+
+        Parameters:
+            token (Token):  The new access token
+        """
+        if self.token_provider:
+            self.token_provider.replace(token)
+        else:
+            self._static_token = token
+
     def request(self, uri, **kwargs):
         """
         Makes a requested to the API endpoint
@@ -103,35 +300,110 @@ class GraphAPI(object):
             data (object):  The payload to send to the API endpoint
             json (obj):  The JSON payload to send the API endpoint
             method (str):  The type of HTTP Method to call the API endpoint with
+            headers (dict):  Additional headers to send to the API endpoint
+            content_type (str):  The content type of the payload, default: application/json
+            authenticate (bool):  Send the access token, disable for pre-authenticated URLs such as upload sessions, default: True
+            stream (bool):  Return the requests.Response without reading its body, which the caller must close, default: False
 
         Returns:
-            object: The JSON response from the API
+            object: The JSON response from the API, or the requests.Response when streaming
 
         Raises:
             MicrosoftException: The API call was not completed successsfully
         """
+        if self.single_flight is not None and kwargs.get('method', 'GET').upper() == 'GET' and not kwargs.get('stream'):
+            key = coalesce.SingleFlight.key(uri, **kwargs)
+            return self.single_flight.do(key, functools.partial(self._observe, uri, **kwargs))
+        return self._observe(uri, **kwargs)
+
+    def _observe(self, uri, **kwargs):
+        if not self.hooks:
+            return self._request(uri, None, **kwargs)
+        event = metrics.RequestEvent(kwargs.get('method', 'GET'))
+        try:
+            data = self._request(uri, event, **kwargs)
+            if isinstance(data, dict) and isinstance(data.get('value'), list):
+                event.items = len(data['value'])
+            return data
+        except exception.MicrosoftException as e:
+            event.error = e
+            raise
+        finally:
+            event.finish(self.resource_uri)
+            metrics.emit(self.hooks, event)
+
+    def _request(self, uri, event, **kwargs):
         version = kwargs.pop('version', 'v1.0')
         method = kwargs.pop('method', 'GET')
-        if self.resource_uri not in uri:
-            url = '%s/%s/%s' % (self.resource_uri, '%s' % version, uri)
-        else:
+        authenticate = kwargs.pop('authenticate', True)
+        if uri.startswith('https://') or uri.startswith('http://'):
             url = uri
-        token = str(self._access_token)
+        else:
+            url = '%s/%s/%s' % (self.resource_uri, '%s' % version, uri)
+        if event:
+            event.url = url
         content_type = kwargs.pop('content_type', 'application/json')
         headers = {
-            'Authorization': token,
             'Content-Type': content_type
         }
+        token = None
+        if authenticate:
+            token = self._access_token
+            headers['Authorization'] = str(token)
         method_specific_headers = kwargs.pop('headers', dict())
         headers.update(method_specific_headers)
+        cache_key = entry = None
+        if self.cache is not None and method.upper() == 'GET' and authenticate and url != uri and not kwargs.get('stream') and 'If-None-Match' not in headers:
+            # pre-authenticated and absolute URLs, such as upload sessions and continuation pages, are never cached
+            if cache.cacheable(uri, kwargs.get('params')):
+                cache_key = self.cache.key(url, kwargs.get('params'), cache.token_scope(self.tenant, token))
+                entry = self.cache.get(cache_key)
+                if entry is not None and entry.fresh():
+                    logger.debug('Using the cached response of %r', url)
+                    if event:
+                        event.cached = True
+                    return entry.data()
+                if entry is not None and entry.etag:
+                    headers['If-None-Match'] = entry.etag
+        try:
+            return self._exchange(method, url, headers, event, authenticate, token, cache_key, entry, **kwargs)
+        finally:
+            # forget the responses a write may have changed once it was answered, or failed
+            if self.cache is not None and method.upper() != 'GET':
+                self.cache.invalidate(url, kwargs.get('json'))
+
+    def _exchange(self, method, url, headers, event, authenticate, token, cache_key, entry, **kwargs):
         logger.info("Calling %s(%s)", url, method)
         try:
-            response = self._session.request(method, url, headers=headers, **kwargs)
+            response = self._send(method, url, headers, event, **kwargs)
+            if response.status_code == 401 and authenticate and self.token_provider:
+                logger.warning('%s %r was not authorized, renewing access token', method, url)
+                response.close()
+                headers['Authorization'] = str(self.token_provider.refresh(token))
+                response = self._send(method, url, headers, event, **kwargs)
         except Exception as e:
-            message = '%r %r request unsuccessful: %r' % (url, method, e.message)
+            message = '%r %r request unsuccessful: %r' % (url, method, e)
             logger.error(message, exc_info=1)
             code = getattr(e, 'code', None)
             raise exception.MicrosoftException(code, message)
+        if event:
+            event.bytes_received = int(response.headers.get('Content-Length') or 0) if kwargs.get('stream') else len(response.content)
+        if entry is not None and response.status_code == 304:
+            logger.debug('The cached response of %r was not modified', url)
+            if event:
+                event.cached = True
+            self.cache.refresh(cache_key)
+            return entry.data()
+        if kwargs.get('stream'):
+            if response.status_code < 400:
+                return response
+            with response:
+                try:
+                    data = response.json()
+                except Exception:
+                    data = None
+            if not isinstance(data, dict) or 'error' not in data:
+                data = dict(error=dict(code=response.status_code, message='%s %r returned %s' % (method, url, response.status_code)))
         else:
             try:
                 data = response.json()
@@ -144,10 +416,64 @@ class GraphAPI(object):
             message = error['message']
             logger.error(error)
             raise exception.MicrosoftException(code, message)
+        if cache_key is not None:
+            self.cache.put(cache_key, cache.response_etag(response.headers, data), response.content)
         return data
 
+    def _send(self, method, url, headers, event=None, **kwargs):
+        if self.timeout is not None:
+            kwargs.setdefault('timeout', self.timeout)
+        attempt = 0
+        while True:
+            if self.retry:
+                self.retry.before_request()
+            if self.rate_limiter:
+                self.rate_limiter.wait(url, kwargs.get('json'))
+            response = self.transport.request(method, url, headers=headers, **kwargs)
+            if event:
+                event.sent(response.status_code, metrics.body_size(getattr(response.request, 'body', None)))
+            if self.rate_limiter and response.status_code in (429, 503):
+                self.rate_limiter.throttled(url)
+            delay = self.retry.delay(response.status_code, response.headers, attempt, method) if self.retry else None
+            if delay is None:
+                return response
+            logger.warning('%s %r returned %s, retrying in %.2f seconds', method, url, response.status_code, delay)
+            response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def pool_stats(self):
+        """
+        Reports the usage of the connection pools of the transport, to tell whether pool_maxsize is too small for the threads sharing this instance
+
+        Returns:
+            dict|None:  The statistics of the msgraph.transport.PoolAdapter of the transport, None if the transport does not pool connections through one
+        """
+        get_adapter = getattr(self.transport, 'get_adapter', None)
+        if get_adapter is None:
+            return None
+        adapter = get_adapter(self.resource_uri)
+        if not isinstance(adapter, transport.PoolAdapter):
+            return None
+        return adapter.stats()
+
+    def batch(self, **kwargs):
+        """
+        Creates a Batch which groups requests to the API endpoint into JSON batches
+
+        Keyword Arguments:
+            version (str):  The version of the API to use, default: v1.0
+            max_size (int):  The maximum number of requests in each batch, default: 20
+
+        Returns:
+            msgraph.batch.Batch:  The Batch sending requests to this API endpoint
+        """
+        return batch.Batch(self, **kwargs)
+
     @staticmethod
     def _authenticate_via_certificate(authority_host_uri, tenant, resource_uri, client_id, client_certificate, certificate_thumbprint):
+        if adal is None:
+            raise ImportError('Authenticating with a certificate requires the adal package')
         authority_uri = '%s/%s' % (authority_host_uri, tenant)
         try:
             context = adal.AuthenticationContext(authority_uri, api_version=None)
@@ -168,7 +494,7 @@ class GraphAPI(object):
             return access_token
 
     @classmethod
-    def from_certificate(cls, authority_host_uri, tenant, resource_uri, client_id, client_certificate, certificate_thumbprint):
+    def from_certificate(cls, authority_host_uri, tenant, resource_uri, client_id, client_certificate, certificate_thumbprint, **kwargs):
         """
         Creates an authenticated instance using an SSL certificate
 
@@ -180,6 +506,11 @@ class GraphAPI(object):
             client_certificate (str): The contents of the authenticating SSL certificate
             client_thumbprint (str): The thumbprint corresponding to the client_certificate
 
+        Keyword Arguments:
+            retry (msgraph.retry.RetryScheduler):  Decides if and when throttled or failed requests are retried, None to never retry
+            renew_before (float):  The number of seconds before the access token expires at which it is renewed, default: 300
+            token_provider (TokenProvider):  Renews the access token, None to never renew it
+
         Returns:
             GraphAPI:  The authenticated API instance
 
@@ -187,5 +518,9 @@ class GraphAPI(object):
             MicrosoftAuthenticationException: failed to authenticate using the provided parameters
             Exception: An unknown error occurred
         """
-        access_token = cls._authenticate_via_certificate(authority_host_uri, tenant, resource_uri, client_id, client_certificate, certificate_thumbprint)
-        return cls(authority_host_uri, tenant, resource_uri, client_id, access_token, client_certificate=client_certificate, certificate_thumbprint=certificate_thumbprint)
+        authenticate = functools.partial(cls._authenticate_via_certificate, authority_host_uri, tenant, resource_uri, client_id, client_certificate, certificate_thumbprint)
+        access_token = authenticate()
+        renew_before = kwargs.pop('renew_before', 300)
+        if 'token_provider' not in kwargs:
+            kwargs['token_provider'] = TokenProvider(authenticate, access_token, renew_before=renew_before)
+        return cls(authority_host_uri, tenant, resource_uri, client_id, access_token, client_certificate=client_certificate, certificate_thumbprint=certificate_thumbprint, **kwargs)
@@ -1,7 +1,45 @@
+import re
 from datetime import datetime
 
+try:
+    from functools import lru_cache
+except ImportError:  # pragma: no cover
+    lru_cache = None
+
+
+date_time_pattern = re.compile(r'(\d{4})-(\d{2})-(\d{2})(?:[T ](\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,7}))?Z?)?$')
+
+
+def _parse_date_time(text):
+    match = date_time_pattern.match(text)
+    if match is None:
+        return None
+    year, month, day, hour, minute, second, fraction = match.groups()
+    if hour is None:
+        hour = minute = second = 0
+    microsecond = int(fraction[:6].ljust(6, '0')) if fraction else 0
+    try:
+        return datetime(int(year), int(month), int(day), int(hour), int(minute), int(second), microsecond)
+    except ValueError:
+        return None
+
+
+if lru_cache:
+    _parse_date_time = lru_cache(maxsize=4096)(_parse_date_time)
+
 
 class Base(object):
+    """
+    The base class of the Microsoft Graph models
+
+    Models which declare api_fields can be built lazily with lazy_from_api, wrapping
+    the raw data returned from the API instead of copying every attribute up front.
+    Each attribute is then decoded from the raw data the first time it is accessed.
+
+    Attributes:
+        api_fields (dict):  Maps attribute names to a tuple of the Graph property name and a converter (or None)
+    """
+    api_fields = None
     date_format = '%Y-%m-%d'
     time_format = '%H:%M:%S'
     datetime_format = date_format + 'T%s' % time_format
@@ -12,13 +50,109 @@ class Base(object):
 
     @classmethod
     def parse_date_time(cls, text):
-        instance = None
-        formats = [cls.extended_datetime_format, cls.full_datetime_format, cls.datetime_format, cls.standard_datetime_format, cls.iso_format, cls.date_format]
-        for format in formats:
-            try:
-                instance = datetime.strptime(text, format)
-            except Exception:
-                pass
-            else:
-                break
+        """
+        Parses the timestamps returned by the API endpoint
+
+        Handles dates, and date-times separated by either a "T" or a space, with an
+        optional fractional second of up to 7 digits and an optional "Z" suffix.  The
+        most recently parsed timestamps are cached, as listings often repeat them.
+
+        Parameters:
+            text (str):  The timestamp to parse
+
+        Returns:
+            datetime|None:  The parsed timestamp, None if the text is not a recognized timestamp (or not a str, such as a missing property)
+        """
+        if not isinstance(text, str):
+            return None
+        return _parse_date_time(text)
+
+    def __getattr__(self, name):
+        raw = self.__dict__.get('_raw')
+        fields = self.__class__.api_fields
+        if raw is None or not fields or name not in fields:
+            raise AttributeError('%r object has no attribute %r' % (self.__class__.__name__, name))
+        key, converter = fields[name]
+        value = raw.get(key)
+        if converter is not None and value is not None:
+            value = converter(value)
+        setattr(self, name, value)
+        return value
+
+    @classmethod
+    def lazy_from_api(cls, data):
+        """
+        Builds an instance which decodes its attributes from the raw data on first access
+
+        Parameters:
+            data (dict):  raw data returned from the API
+
+        Returns:
+            Base:  the instance wrapping the provided data
+        """
+        if not cls.api_fields:
+            return cls.from_api(data)
+        instance = cls.__new__(cls)
+        instance._raw = data
         return instance
+
+    @classmethod
+    def select(cls, fields):
+        """
+        Builds the $select query parameter projecting the given attributes
+
+        Attribute names are mapped to their Graph property names through api_fields,
+        any other name is assumed to already be a Graph property name.
+
+        Parameters:
+            fields (list|str):  The attribute (or Graph property) names to fetch, either a list or comma separated
+
+        Returns:
+            str:  The comma separated Graph property names
+        """
+        if isinstance(fields, str):
+            fields = fields.split(',')
+        mapping = cls.api_fields or dict()
+        names = []
+        for field in fields:
+            field = field.strip()
+            name = mapping[field][0] if field in mapping else field
+            if not name.startswith('@') and name not in names:
+                names.append(name)
+        return ','.join(names)
+
+    @classmethod
+    def select_params(cls, params=None, **kwargs):
+        """
+        Adds the $select projection of the fields keyword argument to the query parameters
+
+        Parameters:
+            params (dict, optional):  The query parameters of the request
+
+        Keyword Arguments:
+            fields (list|str):  The attributes to fetch, default: every attribute
+
+        Returns:
+            dict|None:  The query parameters, including $select if fields were provided
+        """
+        fields = kwargs.get('fields')
+        if not fields:
+            return params
+        params = dict(params or dict())
+        params['$select'] = cls.select(fields)
+        return params
+
+    @classmethod
+    def factory(cls, **kwargs):
+        """
+        Selects the function used to build instances from the rows of a collection
+
+        Keyword Arguments:
+            lazy (bool):  Decode the attributes of each instance on first access, default: False
+
+        Returns:
+            callable:  Either lazy_from_api or from_api
+        """
+        if kwargs.get('lazy'):
+            return cls.lazy_from_api
+        return cls.from_api
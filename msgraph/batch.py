@@ -0,0 +1,319 @@
+import base64
+import itertools
+import logging
+import time
+from urllib.parse import urlencode
+from msgraph import exception
+
+
+logger = logging.getLogger(__name__)
+
+
+class BatchRequest(object):
+    """
+    A single request queued in a JSON batch
+
+    Attributes:
+        id (str):  The identifier of the request within the batch
+        method (str):  The HTTP method of the request
+        url (str):  The URL of the request, relative to the API version
+        body (object):  The payload of the request
+        headers (dict):  The headers of the request
+        depends_on (list):  IDs of the requests that must complete before this request is executed
+        status (int):  The HTTP status code of the response, None until the batch is executed
+        response_headers (dict):  The headers of the response, None until the batch is executed
+    """
+    __slots__ = ('id', 'method', 'url', 'body', 'headers', 'depends_on', 'status', 'response_headers', '_batch', '_data', '_exception', '_done', '_callbacks')
+
+    def __init__(self, batch, id, method, url, body, headers, depends_on):
+        self.id = id
+        self.method = method
+        self.url = url
+        self.body = body
+        self.headers = headers
+        self.depends_on = depends_on
+        self.status = None
+        self.response_headers = None
+        self._batch = batch
+        self._data = None
+        self._exception = None
+        self._done = False
+        self._callbacks = []
+
+    def __str__(self):
+        return self.id
+
+    def __repr__(self):
+        return '<%s %s id=%r, method=%r, url=%r, status=%r>' % (self.__class__.__name__, id(self), self.id, self.method, self.url, self.status)
+
+    def done(self):
+        """
+        Indicates if the response to the request has been received
+
+        Returns:
+            bool:  True if the request has been executed, False otherwise
+        """
+        return self._done
+
+    def result(self):
+        """
+        Fetches the response of the request, executing the pending batch if necessary
+
+        Returns:
+            object:  The JSON response of the request
+
+        Raises:
+            MicrosoftException:  The request was not completed successfully
+        """
+        if not self._done:
+            self._batch.execute()
+        if self._exception:
+            raise self._exception
+        return self._data
+
+    def exception(self):
+        """
+        Fetches the exception raised by the request, executing the pending batch if necessary
+
+        Returns:
+            MicrosoftException|None:  The exception of the request, None if the request was successful
+        """
+        if not self._done:
+            self._batch.execute()
+        return self._exception
+
+    def add_done_callback(self, callback):
+        """
+        Registers a function to call with the BatchRequest once its response has been received
+
+        Parameters:
+            callback (callable):  The function to call, receives the BatchRequest as its only argument
+        """
+        if self._done:
+            callback(self)
+        else:
+            self._callbacks.append(callback)
+
+    def to_dict(self):
+        data = dict(id=self.id, method=self.method, url=self.url)
+        if self.depends_on:
+            data['dependsOn'] = self.depends_on
+        if self.headers:
+            data['headers'] = self.headers
+        if self.body is not None:
+            data['body'] = self.body
+        return data
+
+    def _set_result(self, status, headers, data):
+        self.status = status
+        self.response_headers = headers
+        self._data = data
+        self._finish()
+
+    def _set_exception(self, status, error):
+        self.status = status
+        self._exception = error
+        self._finish()
+
+    def _finish(self):
+        self._done = True
+        callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback(self)
+
+
+class Batch(object):
+    """
+    Groups calls to an API endpoint into JSON batches of up to 20 requests
+
+    Requests are queued with the same arguments as msgraph.api.GraphAPI.request, so
+    a Batch can be passed in place of a GraphAPI to methods that do not use the
+    response of the API, such as msgraph.user.User.update.  The queue is sent to the
+    $batch endpoint whenever it is full, when the batch is executed, or when the
+    `with` block it is used in exits.  Requests of a batch which are throttled are
+    retried according to the msgraph.retry.RetryScheduler of the API endpoint.
+
+    For more information see: https://docs.microsoft.com/en-us/graph/json-batching
+
+    Attributes:
+        api (msgraph.api.GraphAPI):  The endpoint the batches are sent to
+        version (str):  The version of the API used by every request in the batch
+        max_size (int):  The maximum number of requests sent in a single batch
+
+    Example:
+        with api_instance.batch() as batch:
+            for user in users:
+                user.update(batch)
+
+        batch = api_instance.batch()
+        first = batch.request('users/johndoe@wm.edu')
+        events = batch.request('users/johndoe@wm.edu/events', depends_on=[first])
+        batch.execute()
+        events.result()
+    """
+    limit = 20
+
+    def __init__(self, api, **kwargs):
+        self.api = api
+        self.version = kwargs.get('version', 'v1.0')
+        self.max_size = min(kwargs.get('max_size', self.limit), self.limit)
+        self._queue = []
+        self._requests = dict()
+        self._counter = itertools.count(1)
+
+    def __repr__(self):
+        return '<%s %s api=%r, version=%r, queued=%i>' % (self.__class__.__name__, id(self), self.api, self.version, len(self._queue))
+
+    def __len__(self):
+        return len(self._queue)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.execute()
+
+    def request(self, uri, **kwargs):
+        """
+        Queues a request to the API endpoint
+
+        Parameters:
+            uri (str):  The specific endpoint which to send/receive data from
+
+        Keyword Arguments:
+            version (str):  The version of the API to use, must match the version of the batch
+            data (object):  The payload to send to the API endpoint
+            json (obj):  The JSON payload to send the API endpoint
+            method (str):  The type of HTTP Method to call the API endpoint with
+            params (dict):  The query parameters to send to the API endpoint
+            headers (dict):  Additional headers to send to the API endpoint
+            content_type (str):  The content type of the payload, default: application/json
+            depends_on (list):  BatchRequest instances (or their IDs) which must complete before the request
+
+        Returns:
+            BatchRequest:  The queued request
+        """
+        version = kwargs.pop('version', self.version)
+        if version != self.version:
+            raise ValueError('Cannot queue a %r request in a %r batch' % (version, self.version))
+        depends_on = [str(item) for item in kwargs.pop('depends_on', [])]
+        if len(self._queue) >= self.max_size:
+            self.execute()
+
+        url = self._relative_url(uri, kwargs.get('params'))
+        method = kwargs.get('method', 'GET')
+        headers = dict(kwargs.get('headers', dict()))
+        body = kwargs.get('json')
+        if body is None and kwargs.get('data') is not None:
+            body = kwargs['data']
+            if isinstance(body, bytes):
+                body = base64.b64encode(body).decode('ascii')
+        if body is not None:
+            headers['Content-Type'] = kwargs.get('content_type', 'application/json')
+
+        request_id = str(next(self._counter))
+        batch_request = BatchRequest(self, request_id, method, url, body, headers, depends_on)
+        self._requests[request_id] = batch_request
+        self._queue.append(batch_request)
+        return batch_request
+
+    def execute(self):
+        """
+        Sends the queued requests to the $batch endpoint
+
+        Returns:
+            list:  The BatchRequest instances which were executed
+        """
+        queue, self._queue = self._queue, []
+        pending = queue
+        attempt = 0
+        while pending:
+            pending = [batch_request for batch_request in pending if self._resolve_dependencies(batch_request)]
+            if not pending:
+                break
+            payload = dict(requests=[batch_request.to_dict() for batch_request in pending])
+            try:
+                data = self.api.request('$batch', json=payload, method='POST', version=self.version)
+            except exception.MicrosoftException as e:
+                for batch_request in pending:
+                    batch_request._set_exception(None, e)
+                break
+            logger.debug('Executed batch of %i requests in %r', len(pending), self.api)
+            pending = self._dispatch(pending, data.get('responses', []), attempt)
+            attempt += 1
+        return queue
+
+    def _resolve_dependencies(self, batch_request):
+        remaining = []
+        for dependency_id in batch_request.depends_on:
+            dependency = self._requests.get(dependency_id)
+            if dependency is None or not dependency.done():
+                remaining.append(dependency_id)
+            elif dependency.exception():
+                message = 'Request %s depends on failed request %s' % (batch_request.id, dependency_id)
+                batch_request._set_exception(424, exception.MicrosoftException('FailedDependency', message))
+                return False
+        batch_request.depends_on = remaining
+        return True
+
+    def _dispatch(self, pending, responses, attempt):
+        scheduler = getattr(self.api, 'retry', None)
+        rate_limiter = getattr(self.api, 'rate_limiter', None)
+        lookup = dict((batch_request.id, batch_request) for batch_request in pending)
+        retries = []
+        delays = [0.0]
+        failed_dependencies = []
+        for response in responses:
+            batch_request = lookup.pop(str(response.get('id')), None)
+            if batch_request is None:
+                continue
+            status = response.get('status')
+            headers = response.get('headers', dict())
+            body = response.get('body')
+            if rate_limiter and status in (429, 503):
+                rate_limiter.throttled(batch_request.url)
+            delay = scheduler.delay(status, headers, attempt, batch_request.method) if scheduler else None
+            if delay is not None:
+                retries.append(batch_request)
+                delays.append(delay)
+            elif status == 424:
+                failed_dependencies.append((batch_request, body))
+            elif status >= 400:
+                self._set_error(batch_request, status, body)
+            else:
+                batch_request._set_result(status, headers, body)
+        retry_ids = set(batch_request.id for batch_request in retries)
+        for batch_request, body in failed_dependencies:
+            if retry_ids.intersection(batch_request.depends_on):
+                retries.append(batch_request)
+            else:
+                self._set_error(batch_request, 424, body)
+        for batch_request in lookup.values():
+            message = 'No response received for request %s' % batch_request.id
+            batch_request._set_exception(None, exception.MicrosoftException(None, message))
+        if retries:
+            delay = max(delays)
+            logger.warning('%i requests of batch were throttled, retrying in %.2f seconds', len(retries), delay)
+            time.sleep(delay)
+        return sorted(retries, key=lambda batch_request: int(batch_request.id))
+
+    def _set_error(self, batch_request, status, body):
+        error = body.get('error', dict()) if isinstance(body, dict) else dict()
+        code = error.get('code', status)
+        message = error.get('message', '%r %r request unsuccessful' % (batch_request.url, batch_request.method))
+        logger.error(error)
+        batch_request._set_exception(status, exception.MicrosoftException(code, message))
+
+    def _relative_url(self, uri, params):
+        prefix = '%s/%s' % (self.api.resource_uri, self.version)
+        if uri.startswith(prefix):
+            uri = uri[len(prefix):]
+        elif self.api.resource_uri in uri:
+            raise ValueError('Cannot queue %r in a %r batch' % (uri, self.version))
+        if not uri.startswith('/'):
+            uri = '/' + uri
+        if params:
+            separator = '&' if '?' in uri else '?'
+            uri += separator + urlencode(params)
+        return uri
@@ -7,6 +7,34 @@ logger = logging.getLogger(__name__)
 
 class Appointment(base.Base):
     __slots__ = ('id', 'start', 'end', 'duration', 'customer_id', 'customer_name', 'customer_email_address', 'customer_location', 'customer_phone', 'customer_notes', 'service_id', 'service_name', 'service_location', 'service_notes', 'invoice_id', 'invoice_url', 'invoice_status', 'invoice_amount', 'invoice_date', 'prebuffer', 'postbuffer', 'price_type', 'price', 'price', 'price_type', 'reminders',  'staff_member_ids', 'opt_out_of_customer_email')
+    api_fields = {
+        'id': ('id', None),
+        'start': ('start', None),
+        'end': ('end', None),
+        'duration': ('duration', None),
+        'customer_id': ('customerId', None),
+        'customer_name': ('customerName', None),
+        'customer_email_address': ('customerEmailAddress', None),
+        'customer_location': ('customerLocation', None),
+        'customer_phone': ('customerPhone', None),
+        'customer_notes': ('customerNotes', None),
+        'service_id': ('serviceId', None),
+        'service_name': ('serviceName', None),
+        'service_location': ('serviceLocation', None),
+        'service_notes': ('serviceNotes', None),
+        'invoice_id': ('invoiceId', None),
+        'invoice_url': ('invoiceUrl', None),
+        'invoice_status': ('invoiceStatus', None),
+        'invoice_amount': ('invoiceAmount', None),
+        'invoice_date': ('invoiceDate', None),
+        'prebuffer': ('preBuffer', None),
+        'postbuffer': ('postBuffer', None),
+        'price_type': ('priceType', None),
+        'price': ('price', None),
+        'reminders': ('reminders', None),
+        'staff_member_ids': ('staffMemberIds', None),
+        'opt_out_of_customer_email': ('optOutOfCustomerEmail', None)
+    }
 
     def __init__(self, id, start, end, duration, customer_id, customer_name, customer_email_address, customer_location, customer_phone, customer_notes, service_id, service_name, service_location, service_notes, invoice_id, invoice_url, invoice_status, invoice_amount, invoice_date, prebuffer, postbuffer, price_type, price, reminders, staff_member_ids, opt_out_of_customer_email):
         self.id = id,
@@ -49,51 +77,66 @@ class Appointment(base.Base):
 
     @classmethod
     def from_api(cls, data):
-        id = data['id']
-        start = data['start']
-        end = data['end']
-        duration = data['duration']
-        customer_id = data['customerId']
-        customer_name = data['customerName']
-        customer_email_address = data['customerEmailAddress']
-        customer_location = data['customerLocation']
-        customer_phone = data['customerPhone']
-        customer_notes = data['customerNotes']
-        service_id = data['serviceId']
-        service_name = data['serviceName']
-        service_location = data['serviceLocation']
-        service_notes = data['serviceNotes']
-        invoice_id = data['invoiceId']
-        invoice_url = data['invoiceUrl']
-        invoice_status = data['invoiceStatus']
-        invoice_amount = data['invoiceAmount']
-        invoice_date = data['invoiceDate']
-        prebuffer = data['preBuffer']
-        postbuffer = data['postbuffer']
-        price_type = data['priceType']
-        price = data['price']
-        reminders = data['reminders']
-        staff_member_ids = data['staffMemberIds']
-        opt_out_of_customer_email = data['optOutOfCustomerEmail']
-        return cls(id, start, end, duration, customer_id, customer_name, customer_email_address, customer_location, customer_phone, customer_notes, service_id, service_name, service_location, service_notes, invoice_id, invoice_url, invoice_status, invoice_amount, invoice_date, prebuffer, postbuffer, price_type, price, price, price_type, reminders,  staff_member_ids, opt_out_of_customer_email)
+        id = data.get('id')
+        start = data.get('start')
+        end = data.get('end')
+        duration = data.get('duration')
+        customer_id = data.get('customerId')
+        customer_name = data.get('customerName')
+        customer_email_address = data.get('customerEmailAddress')
+        customer_location = data.get('customerLocation')
+        customer_phone = data.get('customerPhone')
+        customer_notes = data.get('customerNotes')
+        service_id = data.get('serviceId')
+        service_name = data.get('serviceName')
+        service_location = data.get('serviceLocation')
+        service_notes = data.get('serviceNotes')
+        invoice_id = data.get('invoiceId')
+        invoice_url = data.get('invoiceUrl')
+        invoice_status = data.get('invoiceStatus')
+        invoice_amount = data.get('invoiceAmount')
+        invoice_date = data.get('invoiceDate')
+        prebuffer = data.get('preBuffer')
+        postbuffer = data.get('postBuffer')
+        price_type = data.get('priceType')
+        price = data.get('price')
+        reminders = data.get('reminders')
+        staff_member_ids = data.get('staffMemberIds')
+        opt_out_of_customer_email = data.get('optOutOfCustomerEmail')
+        return cls(id, start, end, duration, customer_id, customer_name, customer_email_address, customer_location, customer_phone, customer_notes, service_id, service_name, service_location, service_notes, invoice_id, invoice_url, invoice_status, invoice_amount, invoice_date, prebuffer, postbuffer, price_type, price, reminders, staff_member_ids, opt_out_of_customer_email)
 
     @classmethod
     def get(cls, api, business, **kwargs):
         appointment = kwargs.pop('appointment', None)
+        params = cls.select_params(fields=kwargs.pop('fields', None))
         if appointment:
             uri = 'bookingBusinesses/%s/appointments/%s' % (business, appointment)
-            data = api.request(uri, version='beta')
+            data = api.request(uri, params=params, version='beta')
             output = cls.from_api(data)
         else:
             uri = 'bookingBusinesses/%s/appointments' % business
             kwargs.setdefault('version', 'beta')
-            data = api.request(uri, **kwargs)
+            data = api.request(uri, params=params, **kwargs)
             output = [cls.from_api(row) for row in data['value']]
         return output
 
 
 class Business(base.Base):
     __slots__ = ('id', 'display_name', 'type', 'address', 'phone', 'email', 'is_published', 'business_hours', 'public_url', 'website_url', 'default_currency_iso', 'scheduling_policy')
+    api_fields = {
+        'id': ('id', None),
+        'display_name': ('displayName', None),
+        'type': ('type', None),
+        'address': ('address', None),
+        'phone': ('phone', None),
+        'email': ('email', None),
+        'is_published': ('isPublished', None),
+        'business_hours': ('businessHours', None),
+        'public_url': ('publicUrl', None),
+        'website_url': ('websiteUrl', None),
+        'default_currency_iso': ('defaultCurrencyIso', None),
+        'scheduling_policy': ('schedulingPolicy', None)
+    }
 
     def __init__(self, id, display_name, type, address, phone, email, is_published, business_hours, public_url, website_url, default_currency_iso, scheduling_policy):
         self.id = id
@@ -138,8 +181,8 @@ class Business(base.Base):
 
     @classmethod
     def from_api(cls, data):
-        id = data['id']
-        display_name = data['displayName']
+        id = data.get('id')
+        display_name = data.get('displayName')
         type = data.get('type')
         address = data.get('address')
         phone = data.get('phone')
@@ -156,19 +199,25 @@ class Business(base.Base):
     def get(cls, api, **kwargs):
         kwargs.setdefault('version', 'beta')
         business = kwargs.pop('business', None)
+        params = cls.select_params(fields=kwargs.pop('fields', None))
         uri = 'bookingBusinesses'
         if business:
             uri = 'bookingBusinesses/%s' % business
-            data = api.request(uri, **kwargs)
+            data = api.request(uri, params=params, **kwargs)
             output = cls.from_api(data)
         else:
-            data = api.request(uri, **kwargs)
-            output = [cls.from_api(data) for item in data.get('value', [])]
+            data = api.request(uri, params=params, **kwargs)
+            output = [cls.from_api(item) for item in data.get('value', [])]
         return output
 
 
 class Customer(base.Base):
     __slots__ = ('id', 'display_name', 'email_address')
+    api_fields = {
+        'id': ('id', None),
+        'display_name': ('displayName', None),
+        'email_address': ('emailAddress', None)
+    }
 
     def __init__(self, id, display_name, email_address):
         self.id = id
@@ -197,22 +246,22 @@ class Customer(base.Base):
 
     @classmethod
     def from_api(cls, data):
-        id = data['id']
-        display_name = data['displayName']
-        email_address = data['emailAddress']
+        id = data.get('id')
+        display_name = data.get('displayName')
+        email_address = data.get('emailAddress')
         return cls(id, display_name, email_address)
 
     @classmethod
     def get(cls, api, business, **kwargs):
         kwargs.setdefault('version', 'beta')
         customer = kwargs.pop('customer', None)
+        params = cls.select_params(fields=kwargs.pop('fields', None))
         if customer:
             uri = 'bookingBusinesses/%s/customers/%s' % (business, customer)
-            data = api.request(uri, **kwargs)
+            data = api.request(uri, params=params, **kwargs)
             output = cls.from_api(data)
         else:
             uri = 'bookingBusinesses/%s/customers' % business
-            params = dict(**kwargs)
             data = api.request(uri, params=params, **kwargs)
             output = [cls.from_api(row) for row in data['value']]
         return output
@@ -228,6 +277,23 @@ class Customer(base.Base):
 
 class Service(base.Base):
     __slots__ = ('id', 'display_name', 'description', 'email_address', 'is_hidden_from_customers', 'notes', 'prebuffer', 'postbuffer', 'scheduling_policy', 'staff_member_ids', 'default_duration', 'default_location', 'default_price', 'default_price_type', 'default_reminders')
+    api_fields = {
+        'id': ('id', None),
+        'display_name': ('displayName', None),
+        'description': ('description', None),
+        'email_address': ('emailAddress', None),
+        'is_hidden_from_customers': ('isHiddenFromCustomers', None),
+        'notes': ('notes', None),
+        'prebuffer': ('preBuffer', None),
+        'postbuffer': ('postBuffer', None),
+        'scheduling_policy': ('schedulingPolicy', None),
+        'staff_member_ids': ('staffMemberIds', None),
+        'default_duration': ('defaultDuration', None),
+        'default_location': ('defaultLocation', None),
+        'default_price': ('defaultPrice', None),
+        'default_price_type': ('defaultPriceType', None),
+        'default_reminders': ('defaultReminders', None)
+    }
 
     def __init__(self, id, display_name, description, email_address, is_hidden_from_customers, notes, prebuffer, postbuffer, scheduling_policy, staff_member_ids, default_duration, default_location, default_price, default_price_type, default_reminders):
         self.id = id
@@ -265,34 +331,34 @@ class Service(base.Base):
 
     @classmethod
     def from_api(cls, data):
-        id = data['id']
-        display_name = data['displayName']
-        description = data['description']
-        email_address = data['emailAddress']
-        is_hidden_from_customers = data['isHiddenFromCustomers']
-        notes = data['notes']
-        prebuffer = data['preBuffer']
-        postbuffer = data['postBuffer']
-        scheduling_policy = data['schedulingPolicy']
-        staff_member_ids = data['staffMemberIds']
-        default_duration = data['defaultDuration']
-        default_location = data['defaultLocation']
-        default_price = data['defaultPrice']
-        default_price_type = data['defaultPriceType']
-        default_reminders = data['defaultReminders']
+        id = data.get('id')
+        display_name = data.get('displayName')
+        description = data.get('description')
+        email_address = data.get('emailAddress')
+        is_hidden_from_customers = data.get('isHiddenFromCustomers')
+        notes = data.get('notes')
+        prebuffer = data.get('preBuffer')
+        postbuffer = data.get('postBuffer')
+        scheduling_policy = data.get('schedulingPolicy')
+        staff_member_ids = data.get('staffMemberIds')
+        default_duration = data.get('defaultDuration')
+        default_location = data.get('defaultLocation')
+        default_price = data.get('defaultPrice')
+        default_price_type = data.get('defaultPriceType')
+        default_reminders = data.get('defaultReminders')
         return cls(id, display_name, description, email_address, is_hidden_from_customers, notes, prebuffer, postbuffer, scheduling_policy, staff_member_ids, default_duration, default_location, default_price, default_price_type, default_reminders)
 
     @classmethod
     def get(cls, api, business, **kwargs):
         kwargs.setdefault('version', 'beta')
         service = kwargs.pop('service', None)
+        params = cls.select_params(fields=kwargs.pop('fields', None))
         if service:
             uri = 'bookingBusinesses/%s/services/%s' % (business, service)
-            data = api.request(uri, **kwargs)
+            data = api.request(uri, params=params, **kwargs)
             output = cls.from_api(data)
         else:
             uri = 'bookingBusinesses/%s/services' % business
-            params = dict(**kwargs)
             data = api.request(uri, params=params, **kwargs)
             output = [cls.from_api(row) for row in data['value']]
         return output
@@ -300,6 +366,16 @@ class Service(base.Base):
 
 class StaffMember(base.Base):
     __slots__ = ('id', 'display_name', 'email_address', 'role', 'working_hours', 'use_business_hours', 'availability_is_affected_by_personal_calendar', 'color_index')
+    api_fields = {
+        'id': ('id', None),
+        'display_name': ('displayName', None),
+        'email_address': ('emailAddress', None),
+        'role': ('role', None),
+        'working_hours': ('workingHours', lambda rows: [WorkingHours.from_api(row) for row in rows]),
+        'use_business_hours': ('useBusinessHours', None),
+        'availability_is_affected_by_personal_calendar': ('availabilityIsAffectedByPersonalCalendar', None),
+        'color_index': ('colorIndex', None)
+    }
 
     def __init__(self, id, display_name, email_address, role, working_hours, use_business_hours, availability_is_affected_by_personal_calendar, color_index):
         self.id = id
@@ -330,27 +406,27 @@ class StaffMember(base.Base):
 
     @classmethod
     def from_api(cls, data):
-        id = data['id']
-        display_name = data['display_name']
-        email_address = data['email_address']
-        role = data['role']
-        working_hours = [WorkingHours.from_api(item) for item in data['working_hours']]
-        use_business_hours = data['use_business_hours']
-        availability_is_affected_by_personal_calendar = data['availability_is_affected_by_personal_calendar']
-        color_index = data['color_index']
+        id = data.get('id')
+        display_name = data.get('displayName')
+        email_address = data.get('emailAddress')
+        role = data.get('role')
+        working_hours = [WorkingHours.from_api(item) for item in data.get('workingHours', [])]
+        use_business_hours = data.get('useBusinessHours')
+        availability_is_affected_by_personal_calendar = data.get('availabilityIsAffectedByPersonalCalendar')
+        color_index = data.get('colorIndex')
         return cls(id, display_name, email_address, role, working_hours, use_business_hours, availability_is_affected_by_personal_calendar, color_index)
 
     @classmethod
     def get(cls, api, business, **kwargs):
         kwargs.setdefault('version', 'beta')
         staff_member = kwargs.pop('service', None)
+        params = cls.select_params(fields=kwargs.pop('fields', None))
         if staff_member:
             uri = 'bookingBusinesses/%s/staffMembers/%s' % (business, staff_member)
-            data = api.request(uri, **kwargs)
+            data = api.request(uri, params=params, **kwargs)
             output = cls.from_api(data)
         else:
             uri = 'bookingBusinesses/%s/staffMembers' % business
-            params = dict(**kwargs)
             data = api.request(uri, params=params, **kwargs)
             output = [cls.from_api(row) for row in data['value']]
         return output
@@ -386,8 +462,8 @@ class WorkingHours(base.Base):
 
     @classmethod
     def from_api(cls, data):
-        day = data['day']
-        time_slots = [TimeSlot.from_api(item) for item in data['timeSlots']]
+        day = data.get('day')
+        time_slots = [TimeSlot.from_api(item) for item in data.get('timeSlots', [])]
         return cls(day, time_slots)
 
 
@@ -403,8 +479,8 @@ class TimeSlot(base.Base):
 
     @classmethod
     def from_api(cls, data):
-        raw_start = data['start']
+        raw_start = data.get('start')
         start = cls.parse_date_time(raw_start)
-        raw_end = data['end']
+        raw_end = data.get('end')
         end = cls.parse_date_time(raw_end)
         return cls(start, end)
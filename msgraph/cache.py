@@ -0,0 +1,272 @@
+import base64
+import collections
+import json
+import threading
+import time
+from urllib.parse import urlencode, urlparse
+
+
+class CacheEntry(object):
+    """
+    A response of the API endpoint remembered by a ResponseCache
+
+    Attributes:
+        etag (str):  The ETag of the response, from its ETag header or its eTag/@odata.etag property, None if it had none
+        content (bytes):  The JSON body of the response
+        fresh_until (float):  The time (in seconds since the epoch) until which the entry is used without being revalidated
+    """
+    __slots__ = ('etag', 'content', 'fresh_until')
+
+    def __init__(self, etag, content, fresh_until):
+        self.etag = etag
+        self.content = content
+        self.fresh_until = fresh_until
+
+    def __repr__(self):
+        return '<%s %s etag=%r, size=%i, fresh_until=%r>' % (self.__class__.__name__, id(self), self.etag, len(self.content), self.fresh_until)
+
+    def fresh(self):
+        """
+        Returns:
+            bool:  True while the entry is used without being revalidated
+        """
+        return time.time() < self.fresh_until
+
+    def data(self):
+        """
+        Returns:
+            object:  A new copy of the JSON body of the response, which the caller may modify
+        """
+        return json.loads(self.content)
+
+
+class ResponseCache(object):
+    """
+    Remembers the responses of GET requests to the API endpoint, revalidating them with If-None-Match
+
+    Responses are keyed by their URL and query parameters, scoped to the tenant and
+    the principal the access token was issued to.  A response is used as-is
+    for max_age seconds.  After that, a response with an ETag (the ETag header, or the
+    eTag or @odata.etag property of Site, ListItem, DriveItem, Event and Calendar
+    instances) is revalidated with If-None-Match.  A 304 Not Modified answer reuses
+    the remembered body.  Responses without an ETag are only remembered while
+    max_age is positive.  Any other method sent to a URL forgets the responses of
+    that URL, of every URL under it and of the collection containing it, including
+    the requests of a JSON batch, once the request has been answered.  The least
+    recently used responses are forgotten first once max_entries responses or
+    max_bytes bytes are remembered.  Pages of a delta query, pages following
+    @odata.nextLink, and requests to pre-authenticated or absolute URLs (such as
+    upload sessions) are never remembered, see cacheable.
+
+    Pass the cache to a GraphAPI with its cache keyword argument.  The cache is safe
+    to share between threads, and between GraphAPI instances of different tenants
+    or principals, which never see the responses of one another.
+
+    Attributes:
+        max_entries (int):  The maximum number of responses remembered
+        max_bytes (int):  The maximum total size of the responses remembered
+        max_age (float):  The number of seconds a response is used without being revalidated
+        hits (int):  The number of responses used without sending a request
+        revalidations (int):  The number of responses confirmed unchanged by 304 Not Modified
+        misses (int):  The number of requests answered with a new response
+        evictions (int):  The number of responses forgotten to make room for others
+
+    Example:
+        from msgraph import api, cache, sites
+
+        response_cache = cache.ResponseCache(max_entries=5000, max_age=60)
+        api_instance = api.GraphAPI.from_certificate(authority_host_uri, tenant, resource_uri, client_id, client_certificate, client_thumbprint, cache=response_cache)
+        site = sites.Site.by_relative_url(api_instance, host_name, relative_url)
+    """
+
+    def __init__(self, max_entries=1000, max_bytes=64 * 1024 * 1024, max_age=0.0):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = collections.OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return '<%s %s entries=%i, size=%i, hits=%i, revalidations=%i, misses=%i>' % (self.__class__.__name__, id(self), len(self._entries), self._size, self.hits, self.revalidations, self.misses)
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def key(url, params=None, scope=None):
+        """
+        Builds the key under which the response of a request is remembered
+
+        Parameters:
+            url (str):  The absolute URL of the request
+            params (dict, optional):  The query parameters of the request
+            scope (str, optional):  The tenant and principal sending the request, see token_scope
+
+        Returns:
+            tuple:  The scope, and the URL followed by the query parameters in a stable order
+        """
+        if not params:
+            return (scope, url)
+        separator = '&' if '?' in url else '?'
+        return (scope, url + separator + urlencode(sorted((str(name), str(value)) for name, value in params.items())))
+
+    def get(self, key):
+        """
+        Fetches a remembered response, whether or not it is fresh, counting a hit if it is fresh
+
+        Parameters:
+            key (tuple):  The key of the request, see ResponseCache.key
+
+        Returns:
+            CacheEntry|None:  The remembered response, None if the request is not remembered
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                if entry.fresh():
+                    self.hits += 1
+            return entry
+
+    def put(self, key, etag, content):
+        """
+        Remembers a new response to a request, counting a miss, unless the response can never be reused
+
+        Parameters:
+            key (tuple):  The key of the request, see ResponseCache.key
+            etag (str):  The ETag of the response, None if it has none
+            content (bytes):  The JSON body of the response
+
+        Returns:
+            bool:  True if the response was remembered
+        """
+        with self._lock:
+            self.misses += 1
+        if (etag is None and self.max_age <= 0) or len(content) > self.max_bytes:
+            return False
+        entry = CacheEntry(etag, content, time.time() + self.max_age)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous.content)
+            self._entries[key] = entry
+            self._size += len(content)
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.content)
+                self.evictions += 1
+        return True
+
+    def refresh(self, key):
+        """
+        Marks a remembered response as revalidated, using it as-is for another max_age seconds
+
+        Parameters:
+            key (tuple):  The key of the request, see ResponseCache.key
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.fresh_until = time.time() + self.max_age
+            self.revalidations += 1
+
+    def invalidate(self, url, body=None):
+        """
+        Forgets the responses of a URL, of every URL under it and of the collection containing it, in every scope
+
+        The URL of a JSON batch instead forgets the responses of each request of the
+        batch which is not a GET.
+
+        Parameters:
+            url (str):  The absolute URL, with or without query parameters
+            body (object, optional):  The JSON payload of the request
+        """
+        parsed = urlparse(url)
+        path = parsed.path.rstrip('/')
+        if path.endswith('/$batch') and isinstance(body, dict) and isinstance(body.get('requests'), list):
+            base = '%s://%s%s/' % (parsed.scheme, parsed.netloc, path[:-len('/$batch')])
+            for request in body['requests']:
+                if str(request.get('method', 'GET')).upper() != 'GET' and request.get('url'):
+                    self.invalidate(base + request['url'].lstrip('/'))
+            return
+        prefix = '%s://%s%s' % (parsed.scheme, parsed.netloc, path)
+        # the collection containing the item, unless the item is the root of the API version
+        parent = prefix.rpartition('/')[0] if path.count('/') > 2 else None
+        with self._lock:
+            for key in [key for key in self._entries if key[1] == prefix or key[1].startswith((prefix + '/', prefix + '?', prefix + ':')) or (parent and (key[1] == parent or key[1].startswith(parent + '?')))]:
+                self._size -= len(self._entries.pop(key).content)
+
+    def clear(self):
+        """
+        Forgets every response
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+def response_etag(headers, data):
+    """
+    Finds the ETag of a response of the API endpoint
+
+    Parameters:
+        headers (dict):  The headers of the response
+        data (object):  The parsed JSON body of the response
+
+    Returns:
+        str|None:  The ETag header, else the eTag or @odata.etag property of the body, None if the response has none
+    """
+    etag = headers.get('ETag')
+    if etag is None and isinstance(data, dict):
+        etag = data.get('eTag') or data.get('@odata.etag')
+    return etag
+
+
+def cacheable(url, params=None):
+    """
+    Indicates if the response of a GET request may be remembered
+
+    Pages of a delta query and the pages following @odata.nextLink or
+    @odata.deltaLink change with every request, so they are never remembered.
+
+    Parameters:
+        url (str):  The URL of the request, relative to the API version
+        params (dict, optional):  The query parameters of the request
+
+    Returns:
+        bool:  False if the request fetches a delta or a continuation page, True otherwise
+    """
+    parsed = urlparse(url)
+    path = parsed.path.rstrip('/')
+    if path.endswith('/delta') or path.endswith('/delta()') or path == 'delta' or '/delta(' in path:
+        return False
+    names = [name.split('=', 1)[0].lower() for name in parsed.query.split('&') if name]
+    names += [str(name).lower() for name in (params or ())]
+    return not any(name.lstrip('$') in ('skiptoken', 'deltatoken', 'token') for name in names)
+
+
+def token_scope(tenant, token):
+    """
+    Identifies the tenant and principal an access token was issued to, scoping the responses remembered with it
+
+    Parameters:
+        tenant (str):  The tenant ID of the GraphAPI sending the request
+        token (msgraph.api.Token):  The access token sent with the request
+
+    Returns:
+        str:  The tenant, followed by the object ID (or subject) of the principal, or by the access token itself when it is not a JSON Web Token
+    """
+    access_token = getattr(token, 'access_token', None) or str(token)
+    try:
+        payload = access_token.split('.')[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4)).decode('utf-8'))
+        subject = claims.get('oid') or claims['sub']
+        tenant = claims.get('tid') or tenant
+    except Exception:
+        subject = access_token
+    return '%s/%s' % (tenant, subject)
@@ -1,5 +1,5 @@
 import logging
-from msgraph import base
+from msgraph import aio, base, paging
 
 
 logger = logging.getLogger(__name__)
@@ -7,6 +7,16 @@ logger = logging.getLogger(__name__)
 
 class Calendar(base.Base):
     __slots__ = ('id', 'name', 'owner', 'color', 'can_edit', 'can_share', 'can_view_private_items', 'change_key')
+    api_fields = {
+        'id': ('id', None),
+        'name': ('name', None),
+        'owner': ('owner', None),
+        'color': ('color', None),
+        'can_edit': ('canEdit', None),
+        'can_share': ('canShare', None),
+        'can_view_private_items': ('canViewPrivateItems', None),
+        'change_key': ('changeKey', None)
+    }
 
     def __init__(self, id, name, owner, color, can_edit, can_share, can_view_private_items, change_key):
         self.id = id
@@ -69,16 +79,35 @@ class Calendar(base.Base):
 
     @classmethod
     def from_api(cls, data):
-        id = data['id']
-        name = data['name']
-        owner = data['owner']
-        color = data['color']
-        can_edit = data['canEdit']
-        can_share = data['canShare']
-        can_view_private_items = data['canViewPrivateItems']
-        change_key = data['changeKey']
+        id = data.get('id')
+        name = data.get('name')
+        owner = data.get('owner')
+        color = data.get('color')
+        can_edit = data.get('canEdit')
+        can_share = data.get('canShare')
+        can_view_private_items = data.get('canViewPrivateItems')
+        change_key = data.get('changeKey')
         return cls(id, name, owner, color, can_edit, can_share, can_view_private_items, change_key)
 
+    @classmethod
+    def _get_request(cls, **kwargs):
+        user = kwargs.get('user')
+        group = kwargs.get('group')
+        if user:
+            uri = 'users/%s/' % user
+        else:
+            uri = 'me/'
+
+        if group:
+            uri += 'calendarGroup/%s/calendars' % group
+        else:
+            uri += 'calendars'
+
+        params = cls.select_params({
+            '$top': kwargs.get('page_size', 100)
+        }, **kwargs)
+        return uri, params
+
     @classmethod
     def get(cls, api, **kwargs):
         """
@@ -91,32 +120,37 @@ class Calendar(base.Base):
             user (msgraph.user.User):  The User instance to fetch the Calendar for
             group (Group):  The group for which to fetch the Calendar for
             page_size (int):  The number of items to include in each page, default: 100
+            fields (list):  The attributes (or Graph properties) to fetch, default: every attribute
+            max_items (int):  The maximum number of instances to fetch, default: None
+            prefetch (bool):  Request the next page in the background while the current page is processed, default: False
+            as_list (bool):  Fetch every page up front and return a list, default: False
+            lazy (bool):  Decode the attributes of each instance on first access, default: False
 
         Returns:
-            list: Calendar instances
+            (PageIterator|list): Calendar instances, fetched lazily unless as_list is True
         """
-        user = kwargs.get('user')
-        group = kwargs.get('group')
-        if user:
-            uri = 'users/%s/' % user
-        else:
-            uri = 'me/'
+        uri, params = cls._get_request(**kwargs)
+        return paging.paginate(api, uri, cls.factory(**kwargs), params=params, **kwargs)
 
-        if group:
-            uri += 'calendarGroup/%s/calendars' % group
-        else:
-            uri += 'calendars'
+    @classmethod
+    async def get_async(cls, api, **kwargs):
+        """
+        Fetch Calendar instances from an asynchronous API endpoint
 
-        params = {
-            '$top': kwargs.get('page_size', 100)
-        }
-        data = api.request(uri, params=params)
-        output = [cls.from_api(row) for row in data.get('value', [])]
-        while data.get("@odata.nextLink"):
-            uri = data.get("@odata.nextLink")
-            data = api.request(uri)
-            output += [cls.from_api(row) for row in data.get('value', [])]
-        return output
+        Parameters:
+            api (msgraph.aio.AsyncGraphAPI):  The endpoint from which to fetch Calendar instances
+
+        Keyword Arguments:
+            user (msgraph.user.User):  The User instance to fetch the Calendar for
+            group (Group):  The group for which to fetch the Calendar for
+            page_size (int):  The number of items to include in each page, default: 100
+            fields (list):  The attributes (or Graph properties) to fetch, default: every attribute
+
+        Returns:
+            list: Calendar instances
+        """
+        uri, params = cls._get_request(**kwargs)
+        return await aio.collect(api, uri, cls.factory(**kwargs), params=params, **kwargs)
 
 
 class Location(base.Base):
@@ -136,10 +170,10 @@ class Location(base.Base):
 
     @classmethod
     def from_api(cls, data):
-        display_name = data['displayName']
-        location_type = data['locationType']
+        display_name = data.get('displayName')
+        location_type = data.get('locationType')
         unique_id = data.get('uniqueId')
-        unique_id_type = data['uniqueIdType']
+        unique_id_type = data.get('uniqueIdType')
         return cls(display_name, location_type, unique_id, unique_id_type)
 
 
@@ -166,8 +200,8 @@ class Attendee(base.Base):
 
     @classmethod
     def from_api(cls, data):
-        email_data = data['emailAddress']
-        name = email_data['name']
+        email_data = data.get('emailAddress', dict())
+        name = email_data.get('name')
         email_address = email_data.get('address')
         type = data.get('type')
         status_data = data.get('status', dict())
@@ -180,6 +214,11 @@ class Attendee(base.Base):
 
 class Category(base.Base):
     __slots__ = ('id', 'display_name', 'color')
+    api_fields = {
+        'id': ('id', None),
+        'display_name': ('displayName', None),
+        'color': ('color', None)
+    }
 
     def __init__(self, id, display_name, color):
         self.id = id
@@ -235,9 +274,9 @@ class Category(base.Base):
 
     @classmethod
     def from_api(cls, data):
-        id = data['id']
-        display_name = data['displayName']
-        color = data['color']
+        id = data.get('id')
+        display_name = data.get('displayName')
+        color = data.get('color')
         return cls(id, display_name, color)
 
     @classmethod
@@ -251,25 +290,24 @@ class Category(base.Base):
 
         Keyword Arguments:
             page_size (int):  The number of items to include in each page, default: 100
+            fields (list):  The attributes (or Graph properties) to fetch, default: every attribute
+            max_items (int):  The maximum number of instances to fetch, default: None
+            prefetch (bool):  Request the next page in the background while the current page is processed, default: False
+            as_list (bool):  Fetch every page up front and return a list, default: False
+            lazy (bool):  Decode the attributes of each instance on first access, default: False
 
         Returns:
-            list: Category instances
+            (PageIterator|list): Category instances, fetched lazily unless as_list is True
         """
         if user:
             uri = 'users/%s/output/masterCategories'
         else:
             uri = 'me/outlook/masterCategories'
 
-        params = {
+        params = cls.select_params({
             '$top': kwargs.get('page_size', 100)
-        }
-        data = api.request(uri, params=params)
-        output = [cls.from_api(row) for row in data.get('value', [])]
-        while data.get("@odata.nextLink"):
-            uri = data.get("@odata.nextLink")
-            data = api.request(uri)
-            output += [cls.from_api(row) for row in data.get('value', [])]
-        return output
+        }, **kwargs)
+        return paging.paginate(api, uri, cls.factory(**kwargs), params=params, **kwargs)
 
     @classmethod
     def create(cls, api, display_name, color, **kwargs):
@@ -317,9 +355,9 @@ class Range(base.Base):
 
     @classmethod
     def from_api(cls, data):
-        type = data['type']
-        start_date = cls.parse_date_time(data['startDate'])
-        end_date = cls.parse_date_time(data['endDate'])
+        type = data.get('type')
+        start_date = cls.parse_date_time(data.get('startDate'))
+        end_date = cls.parse_date_time(data.get('endDate'))
         return cls(type, start_date, end_date)
 
 
@@ -342,14 +380,56 @@ class DateTime(base.Base):
 
     @classmethod
     def from_api(cls, data):
-        date_time = data['dateTime']
+        date_time = data.get('dateTime')
         date_time = cls.parse_date_time(date_time[:26])
-        time_zone = data['timeZone']
+        time_zone = data.get('timeZone')
         return cls(date_time, time_zone)
 
 
 class Event(base.Base):
-    __slots__ = ('id', 'ical_uid', 'series_master_id', 'type', 'categories', 'subject', 'body', 'body_preview', 'attendees', 'locations', 'location', 'start', 'original_start', 'original_start_time_zone', 'end', 'original_end', 'original_end_time_zone', 'is_all_day', 'is_cancelled', 'is_reminder_on', 'is_organizer', 'organizer', 'importance', 'sensitivity', 'recurrence', 'response_requested', 'response_status', 'reminder_minutes_before_start', 'show_as', 'online_meeting_url', 'web_link', 'has_attachments', 'attachments', 'calendar', 'extensions', 'instances', 'multi_value_extended_properties', 'single_value_extended_properties', 'created_at', 'last_modified', 'removed')
+    __slots__ = ('id', 'ical_uid', 'series_master_id', 'type', 'categories', 'subject', 'body', 'body_preview', 'attendees', 'locations', 'location', 'start', 'original_start', 'original_start_time_zone', 'end', 'original_end', 'original_end_time_zone', 'is_all_day', 'is_cancelled', 'is_reminder_on', 'is_organizer', 'organizer', 'importance', 'sensitivity', 'recurrence', 'response_requested', 'response_status', 'reminder_minutes_before_start', 'show_as', 'online_meeting_url', 'web_link', 'has_attachments', 'attachments', 'calendar', 'extensions', 'multi_value_extended_properties', 'single_value_extended_properties', 'created_at', 'last_modified', 'removed')
+    api_fields = {
+        'id': ('id', None),
+        'ical_uid': ('iCalUId', None),
+        'series_master_id': ('seriesMasterId', None),
+        'type': ('type', None),
+        'categories': ('categories', None),
+        'subject': ('subject', None),
+        'body': ('body', None),
+        'body_preview': ('bodyPreview', None),
+        'attendees': ('attendees', lambda rows: [Attendee.from_api(row) for row in rows]),
+        'locations': ('locations', lambda rows: [Location.from_api(row) for row in rows]),
+        'location': ('location', lambda value: Location.from_api(value)),
+        'start': ('start', lambda value: DateTime.from_api(value)),
+        'original_start': ('originalStart', base.Base.parse_date_time),
+        'original_start_time_zone': ('originalStartTimeZone', None),
+        'end': ('end', lambda value: DateTime.from_api(value)),
+        'original_end': ('originalEnd', base.Base.parse_date_time),
+        'original_end_time_zone': ('originalEndTimeZone', None),
+        'is_all_day': ('isAllDay', None),
+        'is_cancelled': ('isCancelled', None),
+        'is_reminder_on': ('isReminderOn', None),
+        'is_organizer': ('isOrganizer', None),
+        'organizer': ('organizer', lambda value: Attendee.from_api(value)),
+        'importance': ('importance', None),
+        'sensitivity': ('sensitivity', None),
+        'recurrence': ('recurrence', lambda value: dict(value, range=Range.from_api(value['range']))),
+        'response_requested': ('responseRequested', None),
+        'response_status': ('responseStatus', None),
+        'reminder_minutes_before_start': ('reminderMinutesBeforeStart', None),
+        'show_as': ('showAs', None),
+        'online_meeting_url': ('onlineMeetingUrl', None),
+        'web_link': ('webLink', None),
+        'has_attachments': ('hasAttachments', None),
+        'attachments': ('attachments', None),
+        'calendar': ('calendar', None),
+        'extensions': ('extensions', None),
+        'multi_value_extended_properties': ('multiValueExtendedProperties', None),
+        'single_value_extended_properties': ('singleValueExtendedProperties', None),
+        'created_at': ('createdDateTime', base.Base.parse_date_time),
+        'last_modified': ('lastModifiedDateTime', base.Base.parse_date_time),
+        'removed': ('@removed', None)
+    }
 
     def __init__(self, id, ical_uid, series_master_id, type, categories, subject, body, body_preview, attendees, locations, location, start, original_start, original_start_time_zone, end, original_end, original_end_time_zone, is_all_day, is_cancelled, is_reminder_on, is_organizer, organizer, importance, sensitivity, recurrence, response_requested, response_status, reminder_minutes_before_start, show_as, online_meeting_url, web_link, has_attachments, attachments, calendar, extensions, instances, multi_value_extended_properties, single_value_extended_properties, created_at, last_modified, removed):
         self.id = id
@@ -496,75 +576,72 @@ class Event(base.Base):
 
     @classmethod
     def from_api(cls, data):
-        id = data['id']
-        ical_uid = data.get('ical_uid')
-        series_master_id = data['seriesMasterId']
-        type = data['type']
+        id = data.get('id')
+        ical_uid = data.get('iCalUId')
+        series_master_id = data.get('seriesMasterId')
+        type = data.get('type')
         categories = data.get('categories', [])
-        subject = data['subject']
-        body = data['body']
-        body_preview = data['bodyPreview']
-        attendees = [Attendee.from_api(row) for row in data['attendees']]
-        locations = [Location.from_api(row) for row in data['locations']]
-        location = Location.from_api(data['location'])
-        start = DateTime.from_api(data['start'])
+        subject = data.get('subject')
+        body = data.get('body')
+        body_preview = data.get('bodyPreview')
+        attendees = [Attendee.from_api(row) for row in data.get('attendees', [])]
+        locations = [Location.from_api(row) for row in data.get('locations', [])]
+        location = data.get('location')
+        if location is not None:
+            location = Location.from_api(location)
+        start = data.get('start')
+        if start is not None:
+            start = DateTime.from_api(start)
         original_start = data.get('originalStart')
         if original_start:
             original_start = cls.parse_date_time(original_start[:26])
         original_start_time_zone = data.get('originalStartTimeZone')
-        end = DateTime.from_api(data['end'])
+        end = data.get('end')
+        if end is not None:
+            end = DateTime.from_api(end)
         original_end = data.get('originalEnd')
         if original_end:
             original_end = cls.parse_date_time(original_end[:26])
         original_end_time_zone = data.get('originalEndTimeZone')
-        is_all_day = data['isAllDay']
-        is_cancelled = data['isCancelled']
-        is_reminder_on = data['isReminderOn']
-        is_organizer = data['isOrganizer']
-        organizer = Attendee.from_api(data['organizer'])
-        importance = data['importance']
-        sensitivity = data['sensitivity']
-        recurrence = data['recurrence']
+        is_all_day = data.get('isAllDay')
+        is_cancelled = data.get('isCancelled')
+        is_reminder_on = data.get('isReminderOn')
+        is_organizer = data.get('isOrganizer')
+        organizer = data.get('organizer')
+        if organizer is not None:
+            organizer = Attendee.from_api(organizer)
+        importance = data.get('importance')
+        sensitivity = data.get('sensitivity')
+        recurrence = data.get('recurrence')
         if recurrence:
             recurrence_range = Range.from_api(recurrence['range'])
             recurrence['range'] = recurrence_range
-        response_requested = data['responseRequested']
-        response_status = data['responseStatus']
-        reminder_minutes_before_start = data['reminderMinutesBeforeStart']
-        show_as = data['showAs']
-        online_meeting_url = data['onlineMeetingUrl']
-        web_link = data['webLink']
-        has_attachments = data['hasAttachments']
+        response_requested = data.get('responseRequested')
+        response_status = data.get('responseStatus')
+        reminder_minutes_before_start = data.get('reminderMinutesBeforeStart')
+        show_as = data.get('showAs')
+        online_meeting_url = data.get('onlineMeetingUrl')
+        web_link = data.get('webLink')
+        has_attachments = data.get('hasAttachments')
         attachments = data.get('attachments', [])
         calendar = data.get('calendar')
         extensions = data.get('extensions', [])
         instances = data.get('instances', [])
-        multi_value_extended_properties = data.get('multiValueEextendedProperties', [])
+        multi_value_extended_properties = data.get('multiValueExtendedProperties', [])
         single_value_extended_properties = data.get('singleValueExtendedProperties', [])
-        created_at = cls.parse_date_time(data['createdDateTime'][:26])
-        last_modified = cls.parse_date_time(data['lastModifiedDateTime'][:26])
+        created_at = data.get('createdDateTime')
+        if created_at:
+            created_at = cls.parse_date_time(created_at[:26])
+        last_modified = data.get('lastModifiedDateTime')
+        if last_modified:
+            last_modified = cls.parse_date_time(last_modified[:26])
         removed = data.get('@removed')
         return cls(id, ical_uid, series_master_id, type, categories, subject, body, body_preview, attendees, locations, location, start, original_start, original_start_time_zone, end, original_end, original_end_time_zone, is_all_day, is_cancelled, is_reminder_on, is_organizer, organizer, importance, sensitivity, recurrence, response_requested, response_status, reminder_minutes_before_start, show_as, online_meeting_url, web_link, has_attachments, attachments, calendar, extensions, instances, multi_value_extended_properties, single_value_extended_properties, created_at, last_modified, removed)
 
     @classmethod
-    def delta(cls, api, start, end, **kwargs):
-        """
-        Fetch the Events from the API endpoint
-
-        Parameters:
-            api (msgraph.api.GraphAPI):  The endpoint in which to create the Group instance
-            start (datetime):  The lower bound of the datetime range
-            end (datetime):  The upper bound of the datetime range
-
-        Keyword Parameters:
-            user (msgraph.user.User):  The User instance for which to fetch Events for
-            group (Group):  The Group for which to fetch Events for
-            calendar (Calendar):  The Calendar for which to fetch Events for
-            page_size (int):  The number of items to include in each page, default: 100
-
-        Returns:
-            list: Event instances
-        """
+    def _delta_request(cls, start=None, end=None, **kwargs):
+        if start is None or end is None:
+            raise ValueError('The delta query of %s requires a start and end' % cls.__name__)
         fields = kwargs.get('fields', ['id', 'seriesMasterId', 'type', 'categories', 'subject', 'body', 'bodyPreview', 'attendees', 'locations', 'location', 'start', 'end', 'isAllDay', 'isCancelled', 'isReminderOn', 'isOrganizer', 'originalStart', 'originalStartTimeZone', 'originalEndTimeZone', 'organizer', 'importance', 'sensitivity', 'recurrence', 'responseRequested', 'responseStatus', 'reminderMinutesBeforeStart', 'showAs', 'onlineMeetingUrl', 'webLink', 'hasAttachments', 'attachments', 'calendar', 'extensions', 'instances', 'createdDateTime', 'lastModifiedDateTime'])
         user = kwargs.get('user')
         start_formatted = start.strftime(cls.datetime_format)
@@ -574,35 +651,38 @@ class Event(base.Base):
         else:
             uri = 'me/calendarView/delta'
         params = dict(startDateTime=start_formatted, endDateTime=end_formatted)
-        params['$select'] = ','.join(fields)
-
-        data = api.request(uri, params=params)
-
-        output = [cls.from_api(row) for row in data.get('value', [])]
-        while data.get("@odata.nextLink"):
-            uri = data.get("@odata.nextLink")
-            data = api.request(uri)
-            output += [cls.from_api(row) for row in data.get('value', [])]
-        delta_link = data['@odata.deltaLink']
-        return output, delta_link
+        params['$select'] = cls.select(fields)
+        return uri, params
 
     @classmethod
-    def get(cls, api, **kwargs):
+    def delta(cls, api, start, end, **kwargs):
         """
         Fetch the Events from the API endpoint
 
         Parameters:
             api (msgraph.api.GraphAPI):  The endpoint in which to create the Group instance
+            start (datetime):  The lower bound of the datetime range
+            end (datetime):  The upper bound of the datetime range
 
         Keyword Parameters:
             user (msgraph.user.User):  The User instance for which to fetch Events for
             group (Group):  The Group for which to fetch Events for
             calendar (Calendar):  The Calendar for which to fetch Events for
             page_size (int):  The number of items to include in each page, default: 100
+            fields (list):  The attributes (or Graph properties) to fetch, default: the standard Event attributes
+            lazy (bool):  Decode the attributes of each instance on first access, default: False
 
         Returns:
             list: Event instances
         """
+        uri, params = cls._delta_request(start=start, end=end, **kwargs)
+
+        iterator = paging.PageIterator(api, uri, cls.factory(**kwargs), params=params, prefetch=kwargs.get('prefetch', False))
+        output = list(iterator)
+        return output, iterator.delta_link
+
+    @classmethod
+    def _get_request(cls, **kwargs):
         fields = kwargs.get('fields', ['id', 'seriesMasterId', 'type', 'categories', 'subject', 'body', 'bodyPreview', 'attendees', 'locations', 'location', 'start', 'end', 'isAllDay', 'isCancelled', 'isReminderOn', 'isOrganizer', 'originalStart', 'originalStartTimeZone', 'originalEndTimeZone', 'organizer', 'importance', 'sensitivity', 'recurrence', 'responseRequested', 'responseStatus', 'reminderMinutesBeforeStart', 'showAs', 'onlineMeetingUrl', 'webLink', 'hasAttachments', 'attachments', 'calendar', 'extensions', 'instances', 'createdDateTime', 'lastModifiedDateTime'])
         raw_filters = kwargs.get('raw_filters', [])
         user = kwargs.get('user')
@@ -626,34 +706,36 @@ class Event(base.Base):
         if raw_filters:
             parameters['$filter'] = ' and '.join(raw_filters)
         if fields:
-            parameters['$select'] = ','.join(fields)
-
-        data = api.request(uri, params=parameters)
-        output = [cls.from_api(row) for row in data.get('value', [])]
-        while data.get("@odata.nextLink"):
-            uri = data.get("@odata.nextLink")
-            data = api.request(uri)
-            output += [cls.from_api(row) for row in data.get('value', [])]
-        return output
+            parameters['$select'] = cls.select(fields)
+        return uri, parameters
 
     @classmethod
-    def instances(cls, api, event, **kwargs):
+    def get(cls, api, **kwargs):
         """
         Fetch the Events from the API endpoint
 
         Parameters:
             api (msgraph.api.GraphAPI):  The endpoint in which to create the Group instance
-            event (msgraph.calendar.Event):  The event for which to fetch instances for
 
         Keyword Parameters:
             user (msgraph.user.User):  The User instance for which to fetch Events for
             group (Group):  The Group for which to fetch Events for
             calendar (Calendar):  The Calendar for which to fetch Events for
             page_size (int):  The number of items to include in each page, default: 100
+            fields (list):  The attributes (or Graph properties) to fetch, default: the standard Event attributes
+            max_items (int):  The maximum number of instances to fetch, default: None
+            prefetch (bool):  Request the next page in the background while the current page is processed, default: False
+            as_list (bool):  Fetch every page up front and return a list, default: False
+            lazy (bool):  Decode the attributes of each instance on first access, default: False
 
         Returns:
-            list: Event instances
+            (PageIterator|list): Event instances, fetched lazily unless as_list is True
         """
+        uri, parameters = cls._get_request(**kwargs)
+        return paging.paginate(api, uri, cls.factory(**kwargs), params=parameters, **kwargs)
+
+    @classmethod
+    def _instances_request(cls, event, **kwargs):
         fields = kwargs.get('fields', ['id', 'seriesMasterId', 'type', 'categories', 'subject', 'body', 'bodyPreview', 'attendees', 'locations', 'location', 'start', 'end', 'isAllDay', 'isCancelled', 'isReminderOn', 'isOrganizer', 'originalStart', 'originalStartTimeZone', 'originalEndTimeZone', 'organizer', 'importance', 'sensitivity', 'recurrence', 'responseRequested', 'responseStatus', 'reminderMinutesBeforeStart', 'showAs', 'onlineMeetingUrl', 'webLink', 'hasAttachments', 'attachments', 'calendar', 'extensions', 'instances', 'createdDateTime', 'lastModifiedDateTime'])
         raw_filters = kwargs.get('raw_filters', [])
         user = kwargs.get('user')
@@ -684,15 +766,79 @@ class Event(base.Base):
         if raw_filters:
             parameters['$filter'] = ' and '.join(raw_filters)
         if fields:
-            parameters['$select'] = ','.join(fields)
+            parameters['$select'] = cls.select(fields)
+        return uri, parameters
 
-        data = api.request(uri, params=parameters)
-        output = [cls.from_api(row) for row in data.get('value', [])]
-        while data.get("@odata.nextLink"):
-            uri = data.get("@odata.nextLink")
-            data = api.request(uri)
-            output += [cls.from_api(row) for row in data.get('value', [])]
-        return output
+    @classmethod
+    def instances(cls, api, event, **kwargs):
+        """
+        Fetch the Events from the API endpoint
+
+        Parameters:
+            api (msgraph.api.GraphAPI):  The endpoint in which to create the Group instance
+            event (msgraph.calendar.Event):  The event for which to fetch instances for
+
+        Keyword Parameters:
+            user (msgraph.user.User):  The User instance for which to fetch Events for
+            group (Group):  The Group for which to fetch Events for
+            calendar (Calendar):  The Calendar for which to fetch Events for
+            page_size (int):  The number of items to include in each page, default: 100
+            fields (list):  The attributes (or Graph properties) to fetch, default: the standard Event attributes
+            max_items (int):  The maximum number of instances to fetch, default: None
+            prefetch (bool):  Request the next page in the background while the current page is processed, default: False
+            as_list (bool):  Fetch every page up front and return a list, default: False
+            lazy (bool):  Decode the attributes of each instance on first access, default: False
+
+        Returns:
+            (PageIterator|list): Event instances, fetched lazily unless as_list is True
+        """
+        uri, parameters = cls._instances_request(event, **kwargs)
+        return paging.paginate(api, uri, cls.factory(**kwargs), params=parameters, **kwargs)
+
+    @classmethod
+    async def get_async(cls, api, **kwargs):
+        """
+        Fetch the Events from an asynchronous API endpoint
+
+        Parameters:
+            api (msgraph.aio.AsyncGraphAPI):  The endpoint from which to fetch Events
+
+        Keyword Parameters:
+            user (msgraph.user.User):  The User instance for which to fetch Events for
+            group (Group):  The Group for which to fetch Events for
+            calendar (Calendar):  The Calendar for which to fetch Events for
+            page_size (int):  The number of items to include in each page, default: 100
+            fields (list):  The attributes (or Graph properties) to fetch, default: the standard Event attributes
+            lazy (bool):  Decode the attributes of each instance on first access, default: False
+
+        Returns:
+            list: Event instances
+        """
+        uri, parameters = cls._get_request(**kwargs)
+        return await aio.collect(api, uri, cls.factory(**kwargs), params=parameters, **kwargs)
+
+    @classmethod
+    async def instances_async(cls, api, event, **kwargs):
+        """
+        Fetch the instances of a recurring Event from an asynchronous API endpoint
+
+        Parameters:
+            api (msgraph.aio.AsyncGraphAPI):  The endpoint from which to fetch Events
+            event (msgraph.calendar.Event):  The event for which to fetch instances for
+
+        Keyword Parameters:
+            user (msgraph.user.User):  The User instance for which to fetch Events for
+            group (Group):  The Group for which to fetch Events for
+            calendar (Calendar):  The Calendar for which to fetch Events for
+            page_size (int):  The number of items to include in each page, default: 100
+            fields (list):  The attributes (or Graph properties) to fetch, default: the standard Event attributes
+            lazy (bool):  Decode the attributes of each instance on first access, default: False
+
+        Returns:
+            list: Event instances
+        """
+        uri, parameters = cls._instances_request(event, **kwargs)
+        return await aio.collect(api, uri, cls.factory(**kwargs), params=parameters, **kwargs)
 
     @classmethod
     def create(cls, api, subject, body, **kwargs):
@@ -778,12 +924,18 @@ class Event(base.Base):
 
 class Group(base.Base):
     __slots__ = ('id', 'name', 'class_id', 'change_key')
+    api_fields = {
+        'id': ('id', None),
+        'name': ('name', None),
+        'class_id': ('classId', None),
+        'change_key': ('changeKey', None)
+    }
 
     def __init__(self, id, name, class_id, change_key):
         self.id = id
         self.name = name
         self.class_id = class_id
-        self.change_key
+        self.change_key = change_key
 
     def __hash__(self):
         return hash((self.id))
@@ -836,6 +988,14 @@ class Group(base.Base):
         api.request(uri, method='DELETE')
         logger.debug('Deleted %r in %r', self, api)
 
+    @classmethod
+    def from_api(cls, data):
+        id = data.get('id')
+        name = data.get('name')
+        class_id = data.get('classId')
+        change_key = data.get('changeKey')
+        return cls(id, name, class_id, change_key)
+
     @classmethod
     def get(cls, api, user=None, **kwargs):
         """
@@ -847,25 +1007,24 @@ class Group(base.Base):
 
         Keyword Arguments:
             page_size (int):  The number of items to include in each page, default: 100
+            fields (list):  The attributes (or Graph properties) to fetch, default: every attribute
+            max_items (int):  The maximum number of instances to fetch, default: None
+            prefetch (bool):  Request the next page in the background while the current page is processed, default: False
+            as_list (bool):  Fetch every page up front and return a list, default: False
+            lazy (bool):  Decode the attributes of each instance on first access, default: False
 
         Returns:
-            list:  Group instances
+            (PageIterator|list):  Group instances, fetched lazily unless as_list is True
         """
         if user:
             uri = 'users/%s/calendarGroups' % user
         else:
             uri = 'me/calendarGroups'
 
-        params = {
+        params = cls.select_params({
             '$top': kwargs.get('page_size', 100)
-        }
-        data = api.request(uri, params=params)
-        output = [cls.from_api(row) for row in data.get('value', [])]
-        while data.get("@odata.nextLink"):
-            uri = data.get("@odata.nextLink")
-            data = api.request(uri)
-            output += [cls.from_api(row) for row in data.get('value', [])]
-        return output
+        }, **kwargs)
+        return paging.paginate(api, uri, cls.factory(**kwargs), params=params, **kwargs)
 
     @classmethod
     def create(cls, api, name, class_id, change_key, **kwargs):
@@ -926,11 +1085,11 @@ class Attachment(base.Base):
 
     @classmethod
     def from_api(cls, data):
-        id = data['id']
-        name = data['name']
-        is_inline = data['isInline']
-        size = data['size']
-        raw_last_modified_datetime = data['lastModifiedDateTime']
+        id = data.get('id')
+        name = data.get('name')
+        is_inline = data.get('isInline')
+        size = data.get('size')
+        raw_last_modified_datetime = data.get('lastModifiedDateTime')
         if raw_last_modified_datetime:
             last_modified_datetime = cls.parse_date_time(raw_last_modified_datetime[:-1])
         return cls(id, name, is_inline, size, content_id, content_type, content_location, content_bytes, last_modified_datetime)
@@ -947,25 +1106,24 @@ class Attachment(base.Base):
         Keyword Arguments:
             user (msgraph.user.User):  The User instance to fetch the Attachment for
             page_size (int):  The number of items to include in each page, default: 100
+            fields (list):  The attributes (or Graph properties) to fetch, default: every attribute
+            max_items (int):  The maximum number of instances to fetch, default: None
+            prefetch (bool):  Request the next page in the background while the current page is processed, default: False
+            as_list (bool):  Fetch every page up front and return a list, default: False
+            lazy (bool):  Decode the attributes of each instance on first access, default: False
 
         Returns:
-            list:  Attachments instances
+            (PageIterator|list):  Attachments instances, fetched lazily unless as_list is True
         """
         user = kwargs.get('user')
         if user:
             uri = 'users/%s/events/%s/attachments' % (user, event)
         else:
             uri = 'me/events/%s/attachments' % event
-        params = {
+        params = cls.select_params({
             '$top': kwargs.get('page_size', 100)
-        }
-        data = api.request(uri, params=params)
-        output = [cls.from_api(row) for row in data.get('value', [])]
-        while data.get("@odata.nextLink"):
-            uri = data.get("@odata.nextLink")
-            data = api.request(uri)
-            output += [cls.from_api(row) for row in data.get('value', [])]
-        return output
+        }, **kwargs)
+        return paging.paginate(api, uri, cls.factory(**kwargs), params=params, **kwargs)
 
     @classmethod
     def create(cls, api, event, name, content, type, **kwargs):
@@ -1032,15 +1190,15 @@ class FileAttachment(Attachment):
 
     @classmethod
     def from_api(cls, data):
-        id = data['id']
-        name = data['name']
-        is_inline = data['isInline']
-        size = data['size']
-        raw_last_modified_datetime = data['lastModifiedDateTime']
-        content_id = data['contentId']
-        content_type = data['contentType']
-        content_location = data['contentLocation']
-        content_bytes = data['contentBytes']
+        id = data.get('id')
+        name = data.get('name')
+        is_inline = data.get('isInline')
+        size = data.get('size')
+        raw_last_modified_datetime = data.get('lastModifiedDateTime')
+        content_id = data.get('contentId')
+        content_type = data.get('contentType')
+        content_location = data.get('contentLocation')
+        content_bytes = data.get('contentBytes')
         if raw_last_modified_datetime:
             last_modified_datetime = cls.parse_date_time(raw_last_modified_datetime[:-1])
         return cls(id, name, is_inline, size, content_id, content_type, content_location, content_bytes, last_modified_datetime)
@@ -1084,12 +1242,12 @@ class Permission(object):
 
     @classmethod
     def from_api(cls, data):
-        id = data['id']
-        email_address = data['emailAddress']
-        role = data['role']
-        allowed_roles = data['allowedRoles']
-        is_removeable = data['isRemoveable']
-        is_inside_organization = data['isInsideOrganization']
+        id = data.get('id')
+        email_address = data.get('emailAddress')
+        role = data.get('role')
+        allowed_roles = data.get('allowedRoles')
+        is_removeable = data.get('isRemoveable')
+        is_inside_organization = data.get('isInsideOrganization')
         return cls(id, email_address, role, allowed_roles, is_removeable, is_inside_organization)
 
     @classmethod
@@ -0,0 +1,147 @@
+import asyncio
+import copy
+import logging
+import threading
+
+
+logger = logging.getLogger(__name__)
+
+
+class _Call(object):
+    __slots__ = ('done', 'result', 'error', 'waiters')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight(object):
+    """
+    Coalesces identical calls made concurrently, so that only the first is executed and the others share its result
+
+    The first caller of a key executes the call, while every caller arriving with the
+    same key before it completes waits for, and receives, the same result (or
+    error).  Once the call completes the key is forgotten, so later callers execute
+    it again: nothing is cached.  As callers such as from_api may modify the rows
+    they are given, each waiting caller receives its own copy of the result.
+
+    GraphAPI and AsyncGraphAPI coalesce identical GET requests through a SingleFlight
+    passed as their single_flight keyword argument.  Threads and asyncio tasks
+    are coalesced separately.
+
+    Attributes:
+        executed (int):  The number of calls executed
+        shared (int):  The number of calls which waited for an identical call rather than being executed
+
+    Example:
+        from msgraph import api, coalesce, user
+        from concurrent import futures
+
+        api_instance = api.GraphAPI.from_certificate(authority_host_uri, tenant, resource_uri, client_id, client_certificate, client_thumbprint, single_flight=coalesce.SingleFlight())
+        with futures.ThreadPoolExecutor(max_workers=64) as executor:
+            owners = list(executor.map(lambda task: user.User.get(api_instance, user=task.owner), tasks))
+    """
+
+    def __init__(self):
+        self.executed = 0
+        self.shared = 0
+        self._calls = dict()
+        self._tasks = dict()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return '<%s %s in_flight=%i, executed=%i, shared=%i>' % (self.__class__.__name__, id(self), len(self._calls) + len(self._tasks), self.executed, self.shared)
+
+    @staticmethod
+    def key(*args, **kwargs):
+        """
+        Builds a key which is equal for calls with equal arguments, regardless of the order of the items of dict arguments
+
+        Returns:
+            str:  The key of the call
+        """
+        def normalize(value):
+            if isinstance(value, dict):
+                return sorted((str(name), normalize(item)) for name, item in value.items())
+            return value
+        return repr((args, normalize(kwargs)))
+
+    def do(self, key, function):
+        """
+        Executes function, unless a call with the same key is in flight, in which case its result is shared
+
+        Parameters:
+            key (str):  The key of the call, see SingleFlight.key
+            function (callable):  Executes the call, without arguments
+
+        Returns:
+            object:  The result of the call
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+            else:
+                call.waiters += 1
+                self.shared += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+        result = None
+        try:
+            result = function()
+            return result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            if call.waiters:
+                logger.debug('Shared the result of %s with %i identical calls', key, call.waiters)
+                # the caller may modify result as soon as it is returned, so waiting callers copy a snapshot of it
+                call.result = copy.deepcopy(result)
+            call.done.set()
+
+    async def do_async(self, key, function):
+        """
+        Awaits function, unless a call with the same key is in flight on the event loop, in which case its result is shared
+
+        Parameters:
+            key (str):  The key of the call, see SingleFlight.key
+            function (callable):  Returns the coroutine executing the call, without arguments
+
+        Returns:
+            object:  The result of the call
+        """
+        loop = asyncio.get_running_loop()
+        task_key = (id(loop), key)
+        call = self._tasks.get(task_key)
+        if call is not None:
+            self.shared += 1
+            call[1] += 1
+            return copy.deepcopy(await asyncio.shield(call[0]))
+        future = loop.create_future()
+        call = self._tasks[task_key] = [future, 0]
+        self.executed += 1
+        try:
+            result = await function()
+            # the caller may modify result as soon as it is returned, so waiting callers copy a snapshot of it
+            future.set_result(copy.deepcopy(result) if call[1] else None)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # retrieve the exception, so it is not reported as never retrieved when no call was waiting
+            future.exception()
+            raise
+        finally:
+            del self._tasks[task_key]
@@ -0,0 +1,301 @@
+import itertools
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from urllib.parse import urlencode
+from msgraph import exception, paging
+
+
+logger = logging.getLogger(__name__)
+
+
+class DeltaState(object):
+    """
+    The progress of the delta query of a resource
+
+    Attributes:
+        resource (str):  The endpoint of the delta query, such as users/delta
+        scope (str):  Distinguishes delta queries of the same resource, such as different query parameters
+        link (str):  The @odata.nextLink of the next page, or the @odata.deltaLink once the query completed
+        complete (bool):  Indicates link is a delta link, so the next sync only fetches later changes
+        updated_at (float):  The time (in seconds since the epoch) the state was saved
+    """
+    __slots__ = ('resource', 'scope', 'link', 'complete', 'updated_at')
+
+    def __init__(self, resource, scope, link, complete, updated_at=None):
+        self.resource = resource
+        self.scope = scope
+        self.link = link
+        self.complete = complete
+        self.updated_at = time.time() if updated_at is None else updated_at
+
+    def __repr__(self):
+        return '<%s %s resource=%r, scope=%r, complete=%r, updated_at=%r>' % (self.__class__.__name__, id(self), self.resource, self.scope, self.complete, self.updated_at)
+
+    def to_dict(self):
+        return dict(resource=self.resource, scope=self.scope, link=self.link, complete=self.complete, updated_at=self.updated_at)
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['resource'], data['scope'], data['link'], data['complete'], data.get('updated_at'))
+
+
+class DeltaStore(object):
+    """
+    Remembers the progress of delta queries, keyed by resource and scope
+
+    The states are only kept in memory, so they are lost when the process exits.
+    Use FileDeltaStore or SQLiteDeltaStore to persist them between runs.
+
+    Example:
+        from msgraph import delta, user
+
+        store = delta.SQLiteDeltaStore('delta.sqlite3')
+        for instance in delta.sync(api_instance, user.User, store):
+            ...
+    """
+
+    def __init__(self):
+        self._states = dict()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return '<%s %s>' % (self.__class__.__name__, id(self))
+
+    def load(self, resource, scope=''):
+        """
+        Fetches the state of a delta query
+
+        Parameters:
+            resource (str):  The endpoint of the delta query
+            scope (str):  Distinguishes delta queries of the same resource
+
+        Returns:
+            DeltaState|None:  The saved state, None if the delta query has never been saved
+        """
+        with self._lock:
+            return self._states.get((resource, scope))
+
+    def save(self, state):
+        """
+        Records the state of a delta query
+
+        Parameters:
+            state (DeltaState):  The state to save
+        """
+        with self._lock:
+            self._states[(state.resource, state.scope)] = state
+
+    def clear(self, resource, scope=''):
+        """
+        Forgets the state of a delta query, so the next sync fetches every instance
+
+        Parameters:
+            resource (str):  The endpoint of the delta query
+            scope (str):  Distinguishes delta queries of the same resource
+        """
+        with self._lock:
+            self._states.pop((resource, scope), None)
+
+
+class FileDeltaStore(DeltaStore):
+    """
+    Persists the progress of delta queries to a JSON file
+
+    The file is rewritten atomically whenever a state is saved, so an interrupted
+    process never leaves a partially written file behind.
+
+    Attributes:
+        path (str):  The path of the JSON file
+    """
+
+    def __init__(self, path):
+        super(FileDeltaStore, self).__init__()
+        self.path = path
+        if os.path.exists(path):
+            with open(path, 'r') as input_file:
+                for row in json.load(input_file):
+                    state = DeltaState.from_dict(row)
+                    self._states[(state.resource, state.scope)] = state
+
+    def __repr__(self):
+        return '<%s %s path=%r>' % (self.__class__.__name__, id(self), self.path)
+
+    def save(self, state):
+        with self._lock:
+            self._states[(state.resource, state.scope)] = state
+            self._write()
+
+    def clear(self, resource, scope=''):
+        with self._lock:
+            if self._states.pop((resource, scope), None):
+                self._write()
+
+    def _write(self):
+        temporary_path = '%s.tmp' % self.path
+        with open(temporary_path, 'w') as output_file:
+            json.dump([state.to_dict() for state in self._states.values()], output_file)
+        os.replace(temporary_path, self.path)
+
+
+class SQLiteDeltaStore(DeltaStore):
+    """
+    Persists the progress of delta queries to a SQLite database
+
+    Attributes:
+        path (str):  The path of the SQLite database
+    """
+
+    def __init__(self, path):
+        super(SQLiteDeltaStore, self).__init__()
+        self.path = path
+        with self._connect() as connection:
+            connection.execute('CREATE TABLE IF NOT EXISTS delta_state (resource TEXT NOT NULL, scope TEXT NOT NULL, link TEXT NOT NULL, complete INTEGER NOT NULL, updated_at REAL NOT NULL, PRIMARY KEY (resource, scope))')
+
+    def __repr__(self):
+        return '<%s %s path=%r>' % (self.__class__.__name__, id(self), self.path)
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    def load(self, resource, scope=''):
+        with self._lock, self._connect() as connection:
+            row = connection.execute('SELECT link, complete, updated_at FROM delta_state WHERE resource = ? AND scope = ?', (resource, scope)).fetchone()
+        if row is None:
+            return None
+        link, complete, updated_at = row
+        return DeltaState(resource, scope, link, bool(complete), updated_at)
+
+    def save(self, state):
+        with self._lock, self._connect() as connection:
+            connection.execute('INSERT OR REPLACE INTO delta_state (resource, scope, link, complete, updated_at) VALUES (?, ?, ?, ?, ?)', (state.resource, state.scope, state.link, int(state.complete), state.updated_at))
+
+    def clear(self, resource, scope=''):
+        with self._lock, self._connect() as connection:
+            connection.execute('DELETE FROM delta_state WHERE resource = ? AND scope = ?', (resource, scope))
+
+
+class DeltaSync(object):
+    """
+    Fetches the changes to a resource since its last sync, recording the progress in a DeltaStore
+
+    The state is saved once each page has been processed by the caller: the
+    @odata.nextLink while the sync is in progress, so an interrupted sync resumes
+    from the last completed page, then the @odata.deltaLink, so the next sync only
+    fetches later changes.  When the saved link has expired, the resource is
+    synchronized from scratch.
+
+    Attributes:
+        api (msgraph.api.GraphAPI):  The endpoint from which to fetch data
+        store (DeltaStore):  Records the progress of the delta query
+        resource (str):  The endpoint of the delta query
+        scope (str):  Distinguishes delta queries of the same resource
+        factory (callable):  Builds an instance from each row of the delta query
+        params (dict):  The query parameters of the initial delta query
+        version (str):  The version of the API to use
+        prefetch (bool):  Request the next page in the background while the current page is processed
+        delta_link (str):  The @odata.deltaLink received once the sync completed, None until then
+    """
+    resync_codes = ('resyncRequired', 'syncStateNotFound', 'syncStateInvalid')
+
+    def __init__(self, api, store, resource, scope, factory, **kwargs):
+        self.api = api
+        self.store = store
+        self.resource = resource
+        self.scope = scope
+        self.factory = factory
+        self.params = kwargs.get('params')
+        self.version = kwargs.get('version', 'v1.0')
+        self.prefetch = kwargs.get('prefetch', False)
+        self.delta_link = None
+
+    def __repr__(self):
+        return '<%s %s resource=%r, scope=%r, store=%r>' % (self.__class__.__name__, id(self), self.resource, self.scope, self.store)
+
+    def __iter__(self):
+        for page in self.pages():
+            for instance in page:
+                yield instance
+
+    def _iterator(self, state):
+        if state is None:
+            return paging.PageIterator(self.api, self.resource, self.factory, params=self.params, version=self.version, prefetch=self.prefetch)
+        return paging.PageIterator(self.api, state.link, self.factory, version=self.version, prefetch=self.prefetch)
+
+    def pages(self):
+        """
+        Iterates over the pages of changes, saving the progress after each page
+
+        Returns:
+            generator:  A list of instances for each page of changes
+        """
+        state = self.store.load(self.resource, self.scope)
+        if state:
+            logger.debug('Resuming %r from %r', self, state)
+        iterator = self._iterator(state)
+        pages = iterator.pages()
+        try:
+            first_page = next(pages)
+        except exception.MicrosoftException as e:
+            if state is None or e.code not in self.resync_codes:
+                raise
+            logger.warning('Delta state of %r expired (%s), synchronizing from scratch', self, e.code)
+            self.store.clear(self.resource, self.scope)
+            iterator = self._iterator(None)
+            pages = iterator.pages()
+            first_page = next(pages)
+
+        for page in itertools.chain([first_page], pages):
+            yield page
+            if iterator.next_link:
+                self.store.save(DeltaState(self.resource, self.scope, iterator.next_link, False))
+            elif iterator.delta_link:
+                self.delta_link = iterator.delta_link
+                self.store.save(DeltaState(self.resource, self.scope, iterator.delta_link, True))
+
+
+def sync(api, model, store, **kwargs):
+    """
+    Fetches the instances of a model which changed since its last sync
+
+    The first sync of a resource fetches every instance, later syncs only fetch the
+    instances created, updated or removed since the previous sync completed.
+
+    Parameters:
+        api (msgraph.api.GraphAPI):  The endpoint from which to fetch data
+        model (type):  A model supporting delta queries, such as msgraph.user.User, msgraph.group.Group or msgraph.calendar.Event
+        store (DeltaStore):  Records the progress of the delta query
+
+    Keyword Arguments:
+        scope (str):  Distinguishes delta queries of the same resource, default: the query parameters of the delta query
+        fields (list):  The attributes (or Graph properties) to fetch, default: the standard attributes of the model
+        prefetch (bool):  Request the next page in the background while the current page is processed, default: False
+        lazy (bool):  Decode the attributes of each instance on first access, default: False
+        as_list (bool):  Fetch every page up front and return a list, default: False
+
+        Any other keyword arguments are passed to the delta query of the model, such as
+        the start and end of msgraph.calendar.Event.
+
+    Returns:
+        (DeltaSync|list):  The changed instances, fetched lazily unless as_list is True
+
+    Example:
+        from msgraph import delta, group
+
+        store = delta.FileDeltaStore('delta.json')
+        for instance in delta.sync(api_instance, group.Group, store):
+            if instance.removed:
+                ...
+    """
+    as_list = kwargs.pop('as_list', False)
+    uri, params = model._delta_request(**kwargs)
+    scope = kwargs.get('scope')
+    if scope is None:
+        scope = urlencode(sorted(params.items())) if params else ''
+    iterator = DeltaSync(api, store, uri, scope, model.factory(**kwargs), params=params, version=kwargs.get('version', 'v1.0'), prefetch=kwargs.get('prefetch', False))
+    if as_list:
+        return list(iterator)
+    return iterator
@@ -0,0 +1,183 @@
+import contextlib
+import logging
+import threading
+import time
+from concurrent import futures
+import requests
+from msgraph import exception, retry
+
+
+logger = logging.getLogger(__name__)
+
+
+class Download(object):
+    """
+    Downloads the content of a DriveItem to a file object (or the path of a file)
+
+    The content is streamed from the response one chunk at a time, so only a single
+    chunk per connection is held in memory.  Large files can instead be split into
+    segments which are requested concurrently with Range headers and written in place
+    into the destination, which is preallocated to the size of the content.  When a
+    connection fails, the remaining bytes are requested again from where it stopped.
+
+    For more information see: https://docs.microsoft.com/en-us/graph/api/driveitem-get-content
+
+    Attributes:
+        api (msgraph.api.GraphAPI):  The endpoint from which to download
+        url (str):  The content endpoint of the item, or its pre-authenticated download URL
+        size (int):  The size of the content, None if unknown
+        authenticate (bool):  Send the access token, disabled for pre-authenticated download URLs
+        chunk_size (int):  The number of bytes read from the response at a time
+        segment_size (int):  The number of bytes requested by each ranged request
+        max_workers (int):  The maximum number of segments requested concurrently
+        retry_policy (msgraph.retry.RetryPolicy):  Decides how many times, and after how long, a failed connection is resumed
+        bytes_received (int):  The number of bytes received by this download
+        elapsed (float):  The number of seconds spent downloading
+
+    Example:
+        from msgraph import files
+
+        item = files.DriveItem.get_by_path(api_instance, 'exports/export.csv', drive=drive_id)
+        item.download(api_instance, '/tmp/export.csv', drive=drive_id)
+        item.download(api_instance, '/tmp/export.csv', drive=drive_id, parallel=True, max_workers=8)
+    """
+    default_chunk_size = 1024 * 1024
+    default_segment_size = 16 * 1024 * 1024
+
+    def __init__(self, api, url, **kwargs):
+        self.api = api
+        self.url = url
+        self.size = kwargs.get('size')
+        self.authenticate = kwargs.get('authenticate', True)
+        self.chunk_size = kwargs.get('chunk_size', self.default_chunk_size)
+        self.segment_size = max(self.chunk_size, kwargs.get('segment_size', self.default_segment_size))
+        self.max_workers = kwargs.get('max_workers', 4)
+        self.retry_policy = kwargs.get('retry_policy', retry.RetryPolicy(max_retries=5, backoff_factor=1.0, max_backoff=30.0))
+        self.bytes_received = 0
+        self.elapsed = 0.0
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return '<%s %s size=%r, bytes_received=%i>' % (self.__class__.__name__, id(self), self.size, self.bytes_received)
+
+    @property
+    def throughput(self):
+        """
+        Returns:
+            float:  The average number of bytes received per second
+        """
+        if not self.elapsed:
+            return 0.0
+        return self.bytes_received / self.elapsed
+
+    @classmethod
+    def from_api(cls, api, data, **kwargs):
+        """
+        Builds a Download from the pre-authenticated download URL of an item
+
+        Parameters:
+            api (msgraph.api.GraphAPI):  The endpoint the item was fetched from
+            data (dict):  raw data of the item returned from the API, including @microsoft.graph.downloadUrl
+
+        Returns:
+            Download:  the download built from the provided data
+        """
+        return cls(api, data['@microsoft.graph.downloadUrl'], size=data.get('size'), authenticate=False, **kwargs)
+
+    def stream(self, destination, progress=None):
+        """
+        Writes the content to the destination sequentially, over a single connection
+
+        Parameters:
+            destination (str|file):  A binary file object, or the path of the file to write
+            progress (callable, optional):  Called with this Download after each chunk is written
+
+        Returns:
+            int:  The number of bytes written
+        """
+        with self._open(destination, 'wb') as output:
+            started_at = time.time()
+            written = self._fetch(0, None, lambda position, chunk: output.write(chunk), progress)
+            self.elapsed += time.time() - started_at
+        logger.info('Downloaded %i bytes in %.2f seconds (%.0f bytes/second)', written, self.elapsed, self.throughput)
+        return written
+
+    def download_ranges(self, destination, progress=None):
+        """
+        Writes the content to the destination in segments requested concurrently
+
+        Content no larger than a single segment, or of unknown size, is streamed instead.
+
+        Parameters:
+            destination (str|file):  A seekable binary file object, or the path of the file to write
+            progress (callable, optional):  Called with this Download after each chunk is written
+
+        Returns:
+            int:  The number of bytes written
+        """
+        if self.size is None or self.size <= self.segment_size or self.max_workers < 2:
+            return self.stream(destination, progress)
+        with self._open(destination, 'w+b') as output:
+            if isinstance(destination, str):
+                output.truncate(self.size)
+            write_lock = threading.Lock()
+
+            def write(position, chunk):
+                with write_lock:
+                    output.seek(position)
+                    output.write(chunk)
+
+            segments = [(start, min(start + self.segment_size, self.size)) for start in range(0, self.size, self.segment_size)]
+            started_at = time.time()
+            with futures.ThreadPoolExecutor(max_workers=min(self.max_workers, len(segments))) as executor:
+                pending = [executor.submit(self._fetch, start, end, write, progress) for start, end in segments]
+                written = sum(future.result() for future in pending)
+            self.elapsed += time.time() - started_at
+        logger.info('Downloaded %i bytes in %i segments in %.2f seconds (%.0f bytes/second)', written, len(segments), self.elapsed, self.throughput)
+        return written
+
+    def _fetch(self, start, end, write, progress):
+        position = start
+        failures = 0
+        while True:
+            headers = dict()
+            if position or end is not None:
+                headers['Range'] = 'bytes=%i-%s' % (position, '' if end is None else end - 1)
+            try:
+                response = self.api.request(self.url, headers=headers, stream=True, authenticate=self.authenticate)
+                with response:
+                    if headers and response.status_code != 206:
+                        raise exception.MicrosoftException(response.status_code, 'Expected bytes %s, received the full content' % headers['Range'][6:])
+                    expected = end
+                    if expected is None and 'Content-Length' in response.headers and 'Content-Encoding' not in response.headers:
+                        expected = position + int(response.headers['Content-Length'])
+                    for chunk in response.iter_content(self.chunk_size):
+                        write(position, chunk)
+                        position += len(chunk)
+                        self._received(len(chunk), progress)
+                if expected is not None and position < expected:
+                    raise exception.MicrosoftException(None, 'The response ended at %i before offset %i' % (position, expected))
+                logger.debug('Downloaded bytes %i-%i', start, position - 1)
+                return position - start
+            except (exception.MicrosoftException, requests.RequestException) as e:
+                if failures >= self.retry_policy.max_retries:
+                    raise
+                delay = self.retry_policy.delay(failures)
+                logger.warning('Downloading from offset %i failed (%s), resuming in %.2f seconds', position, e, delay)
+                time.sleep(delay)
+                failures += 1
+
+    def _received(self, count, progress):
+        with self._lock:
+            self.bytes_received += count
+        if progress:
+            progress(self)
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _open(destination, mode):
+        if isinstance(destination, str):
+            with open(destination, mode) as output:
+                yield output
+        else:
+            yield destination
@@ -0,0 +1,751 @@
+import base64
+import collections
+import datetime
+import itertools
+import json
+import logging
+import threading
+import time
+import uuid
+from http import server
+from urllib.parse import parse_qsl, quote, unquote, urlencode, urlparse
+from msgraph import api, hashes, retry, transport
+
+
+logger = logging.getLogger(__name__)
+
+
+def _now():
+    return datetime.datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+
+
+class FakeDrive(object):
+    """
+    A drive of a FakeGraph, holding a hierarchy of folders and files in memory
+
+    Attributes:
+        id (str):  The ID of the drive
+        items (dict):  The raw data of each item, keyed by ID
+    """
+
+    def __init__(self, graph, id):
+        self.graph = graph
+        self.id = id
+        self.items = dict()
+        self.contents = dict()
+        self.changes = collections.OrderedDict()
+        self.root = self._create(None, 'root', folder=True)
+
+    def __repr__(self):
+        return '<%s %s id=%r, items=%i>' % (self.__class__.__name__, id(self), self.id, len(self.items))
+
+    def add_folder(self, path):
+        """
+        Creates a folder, and any missing folders above it
+
+        Parameters:
+            path (str):  The path of the folder, relative to the root of the drive
+
+        Returns:
+            dict:  The raw data of the folder
+        """
+        with self.graph._lock:
+            return self._folder(path)
+
+    def add_file(self, path, content=b''):
+        """
+        Creates or replaces a file, creating any missing folders above it
+
+        Parameters:
+            path (str):  The path of the file, relative to the root of the drive
+            content (bytes):  The content of the file
+
+        Returns:
+            dict:  The raw data of the file
+        """
+        with self.graph._lock:
+            parent_path, _, name = path.strip('/').rpartition('/')
+            parent = self._folder(parent_path)
+            return self._write(parent, name, content)
+
+    def _folder(self, path):
+        folder = self.root
+        for name in [name for name in path.split('/') if name]:
+            child = self._child(folder, name)
+            if child is None:
+                child = self._create(folder, name, folder=True)
+            folder = child
+        return folder
+
+    def _child(self, folder, name):
+        name = name.lower()
+        for item in self.items.values():
+            if item.get('parentReference', dict()).get('id') == folder['id'] and item['name'].lower() == name:
+                return item
+        return None
+
+    def _children(self, folder):
+        return [item for item in self.items.values() if item.get('parentReference', dict()).get('id') == folder['id']]
+
+    def _path(self, item):
+        names = []
+        while 'root' not in item:
+            names.append(item['name'])
+            item = self.items[item['parentReference']['id']]
+        return '/'.join(reversed(names))
+
+    def _parent_reference(self, folder):
+        path = self._path(folder)
+        return dict(driveId=self.id, id=folder['id'], path='/drive/root:' + ('/' + path if path else ''))
+
+    def _create(self, parent, name, folder=False):
+        item = dict(id=uuid.uuid4().hex.upper(), name=name, createdDateTime=_now(), lastModifiedDateTime=_now(), size=0)
+        if parent is None:
+            item['root'] = dict()
+        else:
+            item['parentReference'] = self._parent_reference(parent)
+        if folder:
+            item['folder'] = dict(childCount=0)
+        else:
+            item['file'] = dict(mimeType='application/octet-stream', hashes=dict(quickXorHash=hashes.QuickXorHash().base64digest()))
+            self.contents[item['id']] = b''
+        self.items[item['id']] = item
+        self._touch(item)
+        return item
+
+    def _write(self, parent, name, content):
+        item = self._child(parent, name)
+        if item is None:
+            item = self._create(parent, name)
+        item['size'] = len(content)
+        item['file']['hashes'] = dict(quickXorHash=hashes.QuickXorHash(content).base64digest())
+        self.contents[item['id']] = bytes(content)
+        self._touch(item, content=True)
+        return item
+
+    def _touch(self, item, content=False):
+        version = self.graph._next_sequence()
+        item['eTag'] = '"{%s},%i"' % (item['id'], version)
+        if content or 'cTag' not in item:
+            item['cTag'] = '"c:{%s},%i"' % (item['id'], version)
+        item['lastModifiedDateTime'] = _now()
+        self.changes[item['id']] = version
+        self.changes.move_to_end(item['id'])
+
+    def _delete(self, item):
+        for child in self._children(item):
+            self._delete(child)
+        del self.items[item['id']]
+        self.contents.pop(item['id'], None)
+        version = self.graph._next_sequence()
+        self.changes[item['id']] = version
+        self.changes.move_to_end(item['id'])
+
+    def _view(self, item, base_url):
+        data = dict(item)
+        if 'parentReference' in data:
+            data['parentReference'] = self._parent_reference(self.items[item['parentReference']['id']])
+        if 'folder' in data:
+            data['folder'] = dict(childCount=len(self._children(item)))
+        if 'file' in data:
+            data['@microsoft.graph.downloadUrl'] = '%s/_content/%s/%s' % (base_url, self.id, item['id'])
+        return data
+
+
+class FakeGraph(object):
+    """
+    An in-memory stand-in for the Microsoft Graph API, for tests and benchmarks which run offline
+
+    Entities are kept in collections addressed like the API endpoint, such as users,
+    groups/{id}/members or sites/{id}/lists/{id}/items, and support GET, POST, PATCH
+    and DELETE, paging through @odata.nextLink, $select, $top, delta queries and
+    JSON batches.  Drives additionally support paths, content with Range requests,
+    upload sessions, copies with monitor URLs and drive delta queries.  Requests can
+    be throttled and slowed down to exercise retries and concurrency.
+
+    The FakeGraph is used in-process through FakeGraph.api, or over HTTP (for example
+    by msgraph.aio.AsyncGraphAPI) through FakeGraph.serve.
+
+    Attributes:
+        base_url (str):  The resource URI of the stand-in, used in the links it returns
+        page_size (int):  The number of entities in each page, unless $top is requested
+        latency (float):  The number of seconds each request is delayed
+        throttle_every (int):  Every throttle_every request is answered with 429 Too Many Requests, None to never throttle
+        retry_after (float):  The Retry-After of throttled requests
+        request_count (int):  The number of requests handled
+
+    Example:
+        from msgraph import fake, user
+
+        graph = fake.FakeGraph()
+        graph.add_many('users', [dict(displayName='User %i' % index, userPrincipalName='user%i@example.com' % index) for index in range(1000)])
+        api_instance = graph.api()
+        users = user.User.get(api_instance, as_list=True)
+    """
+    singletons = ('drive', 'root', 'outlook', 'calendar')
+    aliases = {'calendarview': 'events'}
+
+    def __init__(self, **kwargs):
+        self.base_url = kwargs.get('base_url', 'https://graph.fake').rstrip('/')
+        self.page_size = kwargs.get('page_size', 100)
+        self.latency = kwargs.get('latency', 0.0)
+        self.throttle_every = kwargs.get('throttle_every')
+        self.retry_after = kwargs.get('retry_after', 0)
+        self.request_count = 0
+        self.collections = dict()
+        self.changes = dict()
+        self.drives = dict()
+        self.me = kwargs.get('me')
+        self._sessions = dict()
+        self._monitors = dict()
+        self._sequence = itertools.count(1)
+        self._lock = threading.RLock()
+        self._server = None
+
+    def __repr__(self):
+        return '<%s %s base_url=%r, request_count=%i>' % (self.__class__.__name__, id(self), self.base_url, self.request_count)
+
+    def _next_sequence(self):
+        return next(self._sequence)
+
+    def add(self, path, data=None, **fields):
+        """
+        Adds an entity to a collection, assigning it an ID unless it has one
+
+        Parameters:
+            path (str):  The collection, such as users or sites/{site-id}/lists
+            data (dict, optional):  The raw data of the entity
+
+        Returns:
+            dict:  The raw data of the entity
+        """
+        entity = dict(data or dict(), **fields)
+        with self._lock:
+            key = self._collection_key(path)
+            return self._store(key, entity)
+
+    def add_many(self, path, rows):
+        """
+        Adds entities to a collection
+
+        Parameters:
+            path (str):  The collection, such as users or groups
+            rows (iterable):  The raw data of each entity
+
+        Returns:
+            list:  The raw data of each entity, including its ID
+        """
+        with self._lock:
+            key = self._collection_key(path)
+            return [self._store(key, dict(row)) for row in rows]
+
+    def remove(self, path, id):
+        """
+        Deletes an entity, reporting it as removed to later delta queries
+
+        Parameters:
+            path (str):  The collection of the entity
+            id (str):  The ID of the entity
+        """
+        with self._lock:
+            key = self._collection_key(path)
+            self.collections.get(key, dict()).pop(id, None)
+            self._changed(key, id)
+
+    def drive(self, owner='me'):
+        """
+        Fetches a drive, creating it if it does not exist
+
+        Parameters:
+            owner (str):  The ID of the drive, or the endpoint owning it such as me, users/{id}, groups/{id} or sites/{id}
+
+        Returns:
+            FakeDrive:  The drive
+        """
+        with self._lock:
+            drive = self.drives.get(owner)
+            if drive is None:
+                drive = self.drives[owner] = FakeDrive(self, owner.replace('/', '-'))
+                self.drives[drive.id] = drive
+            return drive
+
+    def api(self, **kwargs):
+        """
+        Creates a GraphAPI which sends its requests to this stand-in, without a network or authentication
+
+        Keyword Arguments:
+            retry (msgraph.retry.RetryScheduler):  Decides if and when throttled requests are retried, default: a scheduler of this stand-in
+            transport (object):  Sends each request, default: an in-process FakeTransport
+
+        Returns:
+            msgraph.api.GraphAPI:  The API endpoint
+        """
+        tenant = 'fake-%s' % id(self)
+        kwargs.setdefault('transport', FakeTransport(self))
+        kwargs.setdefault('retry', retry.RetryScheduler(budget=retry.RetryBudget(), gate=retry.BackoffGate.for_tenant(tenant)))
+        return api.GraphAPI(None, tenant, self.base_url, None, 'Bearer fake', **kwargs)
+
+    def serve(self, host='127.0.0.1', port=0):
+        """
+        Serves the stand-in over HTTP from a background thread
+
+        Parameters:
+            host (str):  The address to listen on
+            port (int):  The port to listen on, 0 for any free port
+
+        Returns:
+            str:  The resource URI of the server, which also becomes the base_url of the stand-in
+        """
+        graph = self
+
+        class Handler(server.BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def _handle(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                body = self.rfile.read(length) if length else b''
+                status, headers, content = graph.handle(self.command, graph.base_url + self.path, dict(self.headers), body)
+                self.send_response(status)
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.send_header('Content-Length', str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
+
+            def log_message(self, format, *args):
+                logger.debug(format, *args)
+
+        class Server(server.ThreadingHTTPServer):
+            daemon_threads = True
+            # accept as many simultaneous connections as the threads of a stress test open
+            request_queue_size = 1024
+
+        self._server = Server((host, port), Handler)
+        self.base_url = 'http://%s:%i' % self._server.server_address[:2]
+        thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        thread.start()
+        return self.base_url
+
+    def shutdown(self):
+        """
+        Stops serving the stand-in over HTTP
+        """
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def handle(self, method, url, headers, body):
+        """
+        Answers a single request
+
+        Parameters:
+            method (str):  The HTTP method of the request
+            url (str):  The absolute URL of the request, including its query string
+            headers (dict):  The headers of the request
+            body (bytes):  The payload of the request
+
+        Returns:
+            tuple:  The status code, headers and content of the response
+        """
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            self.request_count += 1
+            throttled = self.throttle_every and self.request_count % self.throttle_every == 0
+        if throttled:
+            return self._error(429, 'TooManyRequests', 'The request was throttled', {'Retry-After': str(self.retry_after)})
+        return self._answer(method, url, headers, body)
+
+    def _answer(self, method, url, headers, body):
+        parsed = urlparse(url)
+        query = dict(parse_qsl(parsed.query, keep_blank_values=True))
+        segments = [unquote(segment) for segment in parsed.path.split('/') if segment]
+        try:
+            with self._lock:
+                return self._route(method.upper(), segments, query, dict((key.lower(), value) for key, value in (headers or dict()).items()), body or b'')
+        except LookupError as e:
+            return self._error(404, 'itemNotFound', str(e))
+        except (KeyError, ValueError, TypeError) as e:
+            return self._error(400, 'invalidRequest', str(e))
+
+    def _route(self, method, segments, query, headers, body):
+        if segments and segments[0] == '_content':
+            return self._download(self._drive_by_id(segments[1]), segments[2], headers)
+        if segments and segments[0] == '_upload':
+            return self._upload_chunk(method, segments[1], headers, body)
+        if segments and segments[0] == '_monitor':
+            return self._json(202 if segments[1] not in self._monitors else 200, self._monitors.get(segments[1], dict(status='inProgress')))
+        if segments and segments[0] in ('v1.0', 'beta'):
+            segments = segments[1:]
+        if segments == ['$batch']:
+            return self._batch(json.loads(body.decode('utf-8')))
+        drive_path = self._drive_path('/'.join(segments))
+        if drive_path:
+            return self._drive_route(method, drive_path[0], drive_path[1], query, headers, body)
+        return self._entity_route(method, segments, query, headers, body)
+
+    def _json(self, status, data, headers=None):
+        output = {'Content-Type': 'application/json'}
+        output.update(headers or dict())
+        return status, output, json.dumps(data).encode('utf-8')
+
+    def _conditional(self, data, query, headers):
+        etag = data.get('eTag') or data.get('@odata.etag')
+        if etag is None:
+            return self._json(200, self._select(data, query))
+        if headers.get('if-none-match') == etag:
+            return 304, {'ETag': etag}, b''
+        return self._json(200, self._select(data, query), {'ETag': etag})
+
+    def _error(self, status, code, message, headers=None):
+        return self._json(status, dict(error=dict(code=code, message=message)), headers)
+
+    def _select(self, data, query):
+        fields = query.get('$select')
+        if not fields:
+            return data
+        names = set(field.strip() for field in fields.split(','))
+        return dict((key, value) for key, value in data.items() if key in names or key == 'id' or key.startswith('@'))
+
+    def _page(self, path, rows, query):
+        top = int(query.get('$top') or self.page_size)
+        offset = int(query.get('$skiptoken') or 0)
+        data = {'value': [self._select(row, query) for row in rows[offset:offset + top]]}
+        if offset + top < len(rows):
+            next_query = dict(query, **{'$skiptoken': str(offset + top)})
+            data['@odata.nextLink'] = '%s/v1.0/%s?%s' % (self.base_url, quote(path), urlencode(next_query))
+        return data
+
+    def _delta_page(self, path, rows, query, token):
+        data = self._page(path, rows, query)
+        if '@odata.nextLink' not in data:
+            data['@odata.deltaLink'] = '%s/v1.0/%s?%s' % (self.base_url, quote(path), urlencode({'$deltatoken': str(token)}))
+        return data
+
+    def _collection_key(self, path):
+        segments = [segment for segment in path.strip('/').split('/') if segment]
+        key, entity = self._resolve(segments)
+        if entity is not None:
+            raise ValueError('%r is an entity, not a collection' % path)
+        return key
+
+    def _resolve(self, segments):
+        key = []
+        entity = None
+        index = 0
+        if [segment.lower() for segment in segments[:2]] == ['users', 'me']:
+            segments = segments[1:]
+        while index < len(segments):
+            name = segments[index]
+            lowered = self.aliases.get(name.lower(), name.lower())
+            if lowered == 'me':
+                me = self.me or next(iter(self.collections.get('users', dict())), None)
+                if me is None:
+                    raise LookupError('No users exist to sign in as')
+                key = ['users', me]
+                entity = self.collections['users'][me]
+                index += 1
+                continue
+            if lowered in self.singletons:
+                entity = None
+                key.append(lowered)
+                index += 1
+                if lowered == 'calendar' and index < len(segments):
+                    key.pop()
+                continue
+            key.append(lowered)
+            entity = None
+            if index + 1 < len(segments) and segments[index + 1].lower() != 'delta':
+                entities = self.collections.get('/'.join(key), dict())
+                identifier = segments[index + 1]
+                entity = entities.get(identifier) or self._find(entities, identifier)
+                if entity is None:
+                    raise LookupError('%s %r does not exist' % (name, identifier))
+                key.append(entity['id'])
+                index += 2
+            else:
+                index += 1
+        return '/'.join(key), entity
+
+    def _find(self, entities, identifier):
+        lowered = identifier.strip("'").lower()
+        for entity in entities.values():
+            for field in ('userPrincipalName', 'mail'):
+                if str(entity.get(field, '')).lower() == lowered:
+                    return entity
+        return None
+
+    def _store(self, key, entity):
+        entity.setdefault('id', str(uuid.uuid4()))
+        entity.setdefault('createdDateTime', _now())
+        self.collections.setdefault(key, collections.OrderedDict())[entity['id']] = entity
+        self._changed(key, entity['id'])
+        return entity
+
+    def _changed(self, key, id):
+        changes = self.changes.setdefault(key, collections.OrderedDict())
+        changes[id] = self._next_sequence()
+        changes.move_to_end(id)
+
+    def _entity_route(self, method, segments, query, headers, body):
+        delta = bool(segments) and segments[-1].lower() == 'delta'
+        if delta:
+            segments = segments[:-1]
+        key, entity = self._resolve(segments)
+        path = '/'.join(segments)
+        if delta:
+            return self._json(200, self._entity_delta(key, path + '/delta', query))
+        payload = json.loads(body.decode('utf-8')) if body else dict()
+        if entity is None:
+            if method == 'GET':
+                rows = list(self.collections.get(key, dict()).values())
+                return self._json(200, self._page(path, rows, query))
+            if method == 'POST':
+                return self._json(201, self._store(key, payload))
+            raise ValueError('%s is not supported on the collection %r' % (method, path))
+        if method == 'GET':
+            return self._conditional(entity, query, headers)
+        if method == 'PATCH':
+            entity.update(payload)
+            if '@odata.etag' in entity:
+                entity['@odata.etag'] = 'W/"%i"' % self._next_sequence()
+            self._changed(key.rpartition('/')[0], entity['id'])
+            return self._json(200, entity)
+        if method == 'DELETE':
+            self.remove(key.rpartition('/')[0], entity['id'])
+            return 204, dict(), b''
+        return self._json(200, entity)
+
+    def _entity_delta(self, key, path, query):
+        token = int(query.get('$deltatoken') or 0)
+        entities = self.collections.get(key, dict())
+        rows = []
+        for id, sequence in self.changes.get(key, dict()).items():
+            if sequence <= token:
+                continue
+            if id in entities:
+                rows.append(entities[id])
+            elif token:
+                rows.append({'id': id, '@removed': dict(reason='deleted')})
+        latest = max([token] + list(self.changes.get(key, dict()).values()))
+        query = dict((name, value) for name, value in query.items() if name != '$deltatoken')
+        return self._delta_page(path, rows, query, latest)
+
+    def _batch(self, payload):
+        responses = []
+        for request in payload.get('requests', []):
+            url = '%s/v1.0%s' % (self.base_url, request['url'])
+            headers = request.get('headers', dict())
+            body = request.get('body')
+            if body is None:
+                content = b''
+            elif isinstance(body, str) and 'json' not in headers.get('Content-Type', 'application/json'):
+                content = base64.b64decode(body)
+            else:
+                content = json.dumps(body).encode('utf-8')
+            status, response_headers, content = self._answer(request.get('method', 'GET'), url, headers, content)
+            try:
+                data = json.loads(content.decode('utf-8')) if content else None
+            except ValueError:
+                data = base64.b64encode(content).decode('ascii')
+            responses.append(dict(id=request['id'], status=status, headers=response_headers, body=data))
+        return self._json(200, dict(responses=responses))
+
+    def _drive_by_id(self, id):
+        drive = self.drives.get(id)
+        if drive is None:
+            raise LookupError('Drive %r does not exist' % id)
+        return drive
+
+    def _drive_path(self, path):
+        segments = path.split('/')
+        lowered = [segment.lower() for segment in segments]
+        if lowered[0] == 'drives' and len(segments) > 1:
+            return self.drive(segments[1]), '/'.join(segments[2:])
+        for index, segment in enumerate(lowered):
+            if segment == 'drive':
+                owner = '/'.join(segments[:index]) or 'me'
+                if owner.lower() == 'me' or owner.lower() == 'users/me':
+                    owner = 'me'
+                return self.drive(owner), '/'.join(segments[index + 1:])
+        return None
+
+    def _drive_route(self, method, drive, rest, query, headers, body):
+        if not rest:
+            return self._json(200, dict(id=drive.id, driveType='business', name='Documents'))
+        if ':/' in rest or rest.endswith(':'):
+            base, _, tail = rest.partition(':')
+            tail = tail.lstrip('/')
+            item_path, _, action = tail.partition(':')
+            action = action.lstrip('/')
+        else:
+            parts = rest.split('/')
+            base = '/'.join(parts[:2]) if parts[0] == 'items' else parts[0]
+            action = '/'.join(parts[2:] if parts[0] == 'items' else parts[1:])
+            item_path = ''
+        if base == 'root':
+            item = drive.root
+        elif base.startswith('items/'):
+            item = drive.items.get(base[len('items/'):])
+            if item is None:
+                raise LookupError('Item %r does not exist' % base[len('items/'):])
+        else:
+            raise LookupError('Unknown drive resource %r' % rest)
+        names = [name for name in item_path.split('/') if name]
+        for index, name in enumerate(names):
+            child = drive._child(item, name)
+            if child is None:
+                if method not in ('PUT', 'POST') or action not in ('content', 'createUploadSession'):
+                    raise LookupError('Item at %r does not exist' % item_path)
+                if index == len(names) - 1:
+                    return self._drive_action(method, drive, None, action, query, headers, body, parent=item, name=name)
+                child = drive._create(item, name, folder=True)
+            item = child
+        return self._drive_action(method, drive, item, action, query, headers, body)
+
+    def _drive_action(self, method, drive, item, action, query, headers, body, parent=None, name=None):
+        payload = json.loads(body.decode('utf-8')) if body and action != 'content' else dict()
+        if action == 'content':
+            if method == 'GET':
+                return self._download(drive, item['id'], headers)
+            if item is None:
+                item = drive._write(parent, name, body)
+            else:
+                item = drive._write(drive.items[item['parentReference']['id']], item['name'], body)
+            return self._json(201, drive._view(item, self.base_url))
+        if action == 'createUploadSession':
+            if item is not None:
+                parent, name = drive.items[item['parentReference']['id']], item['name']
+            session = uuid.uuid4().hex
+            self._sessions[session] = dict(drive=drive, parent=parent, name=name, chunks=dict(), size=None)
+            expires = (datetime.datetime.utcnow() + datetime.timedelta(hours=1)).strftime('%Y-%m-%dT%H:%M:%SZ')
+            return self._json(200, dict(uploadUrl='%s/_upload/%s' % (self.base_url, session), expirationDateTime=expires, nextExpectedRanges=['0-']))
+        if action == 'children':
+            if method == 'POST':
+                if drive._child(item, payload['name']) is not None and payload.get('@microsoft.graph.conflictBehavior', 'fail') == 'fail':
+                    return self._error(409, 'nameAlreadyExists', 'An item named %r already exists' % payload['name'])
+                return self._json(201, drive._view(drive._create(item, payload['name'], folder='folder' in payload), self.base_url))
+            rows = [drive._view(child, self.base_url) for child in sorted(drive._children(item), key=lambda child: child['name'].lower())]
+            return self._json(200, self._page('drives/%s/items/%s/children' % (drive.id, item['id']), rows, query))
+        if action == 'delta':
+            return self._json(200, self._drive_delta(drive, query))
+        if action == 'copy':
+            parent_reference = payload.get('parentReference', dict())
+            target = self.drives.get(parent_reference.get('driveId'), drive)
+            destination = target.items.get(parent_reference.get('id'))
+            if destination is None:
+                raise LookupError('Folder %r does not exist' % parent_reference.get('id'))
+            copied = self._copy(drive, item, target, destination, payload.get('name') or item['name'])
+            monitor = uuid.uuid4().hex
+            self._monitors[monitor] = dict(status='completed', percentageComplete=100.0, resourceId=copied['id'])
+            return 202, {'Location': '%s/_monitor/%s' % (self.base_url, monitor)}, b''
+        if action.startswith('search('):
+            term = action[len('search('):].rstrip(')').partition('=')[2].strip("'").lower()
+            rows = [drive._view(candidate, self.base_url) for candidate in drive.items.values() if term in candidate['name'].lower() and 'root' not in candidate]
+            return self._json(200, self._page('drives/%s/root/search' % drive.id, rows, query))
+        if action in ('checkin', 'checkout'):
+            return 204, dict(), b''
+        if action == 'versions':
+            return self._json(200, dict(value=[]))
+        if action:
+            raise LookupError('Unknown drive action %r' % action)
+        if method == 'GET':
+            return self._conditional(drive._view(item, self.base_url), query, headers)
+        if method == 'DELETE':
+            drive._delete(item)
+            return 204, dict(), b''
+        if method == 'PATCH':
+            parent_reference = payload.get('parentReference')
+            if parent_reference and parent_reference.get('id'):
+                if parent_reference['id'] not in drive.items:
+                    raise LookupError('Folder %r does not exist' % parent_reference['id'])
+                item['parentReference'] = dict(id=parent_reference['id'])
+            for field in ('name', 'description', 'fileSystemInfo'):
+                if payload.get(field) is not None:
+                    item[field] = payload[field]
+            drive._touch(item)
+            return self._json(200, drive._view(item, self.base_url))
+        raise ValueError('%s is not supported on drive items' % method)
+
+    def _copy(self, drive, item, target, destination, name):
+        if 'folder' in item:
+            copied = target._create(destination, name, folder=True)
+            for child in drive._children(item):
+                self._copy(drive, child, target, copied, child['name'])
+            return copied
+        return target._write(destination, name, drive.contents.get(item['id'], b''))
+
+    def _drive_delta(self, drive, query):
+        token = int(query.get('$deltatoken') or 0)
+        rows = []
+        for id, sequence in drive.changes.items():
+            if sequence <= token:
+                continue
+            if id in drive.items:
+                rows.append(drive._view(drive.items[id], self.base_url))
+            elif token:
+                rows.append(dict(id=id, deleted=dict(state='deleted')))
+        latest = max([token] + list(drive.changes.values()))
+        query = dict((name, value) for name, value in query.items() if name != '$deltatoken')
+        return self._delta_page('drives/%s/root/delta' % drive.id, rows, query, latest)
+
+    def _download(self, drive, id, headers):
+        if id not in drive.contents:
+            raise LookupError('Item %r has no content' % id)
+        content = drive.contents[id]
+        content_range = headers.get('range')
+        if not content_range:
+            return 200, {'Content-Type': 'application/octet-stream'}, content
+        start, _, end = content_range.partition('=')[2].partition('-')
+        start = int(start)
+        end = min(int(end), len(content) - 1) if end else len(content) - 1
+        if start >= len(content):
+            return self._error(416, 'invalidRange', 'The range %r cannot be satisfied' % content_range)
+        output_headers = {'Content-Type': 'application/octet-stream', 'Content-Range': 'bytes %i-%i/%i' % (start, end, len(content))}
+        return 206, output_headers, content[start:end + 1]
+
+    def _upload_chunk(self, method, id, headers, body):
+        session = self._sessions.get(id)
+        if session is None:
+            raise LookupError('Upload session %r does not exist' % id)
+        if method == 'PUT':
+            content_range = headers.get('content-range', '')
+            span, _, total = content_range.partition(' ')[2].partition('/')
+            start, _, end = span.partition('-')
+            if int(end) - int(start) + 1 != len(body):
+                raise ValueError('The Content-Range %r does not match the %i bytes received' % (content_range, len(body)))
+            session['size'] = int(total)
+            session['chunks'][int(start)] = body
+        received = 0
+        for start in sorted(session['chunks']):
+            if start != received:
+                break
+            received += len(session['chunks'][start])
+        if session['size'] is not None and received >= session['size']:
+            content = b''.join(session['chunks'][start] for start in sorted(session['chunks']))
+            del self._sessions[id]
+            drive = session['drive']
+            item = drive._write(session['parent'], session['name'], content[:session['size']])
+            return self._json(201, drive._view(item, self.base_url))
+        return self._json(202, dict(nextExpectedRanges=['%i-' % received]))
+
+
+class FakeTransport(transport.Transport):
+    """
+    Answers the requests of a GraphAPI from a FakeGraph in the same process, without opening a socket
+
+    Attributes:
+        graph (FakeGraph):  The stand-in answering the requests
+    """
+
+    def __init__(self, graph):
+        self.graph = graph
+
+    def __repr__(self):
+        return '<%s %s graph=%r>' % (self.__class__.__name__, id(self), self.graph)
+
+    def send(self, method, url, headers, body):
+        return self.graph.handle(method, url, headers, body)
@@ -1,11 +1,31 @@
+import io
 import logging
-from msgraph import base
+import mimetypes
+import os
+from msgraph import aio, base, download, exception, hashes, paging, paths, transfer, upload, walk
 
 logger = logging.getLogger(__name__)
 
 
 class Drive(base.Base):
     __slots__ = ('id', 'name', 'description', 'drive_type', 'root', 'owner', 'quote', 'sharepoint_ids', 'special', 'items', 'following', 'created_at', 'created_by', 'last_modified_at', 'last_modified_by')
+    api_fields = {
+        'id': ('id', None),
+        'name': ('name', None),
+        'description': ('description', None),
+        'drive_type': ('driveType', None),
+        'root': ('root', None),
+        'owner': ('owner', None),
+        'quote': ('quote', None),
+        'sharepoint_ids': ('sharepointIds', None),
+        'special': ('special', None),
+        'items': ('items', None),
+        'following': ('following', None),
+        'created_at': ('createdDateTime', base.Base.parse_date_time),
+        'created_by': ('createdBy', None),
+        'last_modified_at': ('lastModifiedDateTime', base.Base.parse_date_time),
+        'last_modified_by': ('lastModifiedBy', None)
+    }
 
     def __init__(self, id, name, description, drive_type, root, owner, quote, sharepoint_ids, special, items, following, created_at, created_by, last_modified_at, last_modified_by):
         self.id = id
@@ -32,12 +52,12 @@ class Drive(base.Base):
 
     @classmethod
     def from_api(cls, data):
-        id = data['id']
-        name = data['name']
-        description = data['description']
-        drive_type = data['driveType']
+        id = data.get('id')
+        name = data.get('name')
+        description = data.get('description')
+        drive_type = data.get('driveType')
         root = data.get('root')
-        owner = data['owner']
+        owner = data.get('owner')
         quote = data.get('quote')
         sharepoint_ids = data.get('sharepointIds', [])
         special = data.get('special')
@@ -64,17 +84,17 @@ class Drive(base.Base):
             uri = 'users/%s/drive' % user
         else:
             uri = 'me/drive'
-        data = api.request(uri)
+        data = api.request(uri, params=cls.select_params(**kwargs))
         return cls.from_api(data)
 
     @classmethod
-    def by_site(cls, api, site):
+    def by_site(cls, api, site, **kwargs):
         uri = 'sites/%s/drive' % site
-        data = api.request(uri)
+        data = api.request(uri, params=cls.select_params(**kwargs))
         return cls.from_api(data)
 
     @classmethod
-    def get(cls, api, **kwargs):
+    def _get_uri(cls, **kwargs):
         group = kwargs.get('group')
         site = kwargs.get('site')
         drive = kwargs.get('drive')
@@ -89,20 +109,30 @@ class Drive(base.Base):
             uri = 'users/%s/drive' % user
         else:
             uri = 'me/drive'
-        data = api.request(uri)
+        return uri
+
+    @classmethod
+    def get(cls, api, **kwargs):
+        uri = cls._get_uri(**kwargs)
+        data = api.request(uri, params=cls.select_params(**kwargs))
         return cls.from_api(data)
 
-        output = [cls.from_api(row) for row in data.get('value', [])]
-        while data.get("@odata.nextLink"):
-            uri = data.get("@odata.nextLink")
-            data = api.request(uri)
-            output += [cls.from_api(row) for row in data.get('value', [])]
-        return output
+    @classmethod
+    async def get_async(cls, api, **kwargs):
+        """
+        Fetches the Drive of a User, Site, or Group from an asynchronous API endpoint
+        """
+        uri = cls._get_uri(**kwargs)
+        data = await api.request(uri, params=cls.select_params(**kwargs))
+        return cls.from_api(data)
 
     @classmethod
     def accessible(cls, api, **kwargs):
         """
         Drives accessible to a User, Site, or Group
+
+        Returns:
+            (PageIterator|list):  Drive instances, fetched lazily unless as_list is True
         """
         group = kwargs.get('group')
         site = kwargs.get('site')
@@ -118,19 +148,54 @@ class Drive(base.Base):
             uri = 'users/%s/drives' % user
         else:
             uri = 'me/drives'
-        data = api.request(uri)
-        output = [cls.from_api(row) for row in data.get('value', [])]
-        while data.get("@odata.nextLink"):
-            uri = data.get("@odata.nextLink")
-            data = api.request(uri)
-            output += [cls.from_api(row) for row in data.get('value', [])]
-        return output
+        return paging.paginate(api, uri, cls.factory(**kwargs), params=cls.select_params(**kwargs), **kwargs)
 
 
 class DriveItem(base.Base):
-    __slots__ = ('id', 'name', 'description', 'etag', 'ctag', 'parent_reference', 'root', 'web_url', 'audio', 'content', 'file', 'file_system_info', 'folder', 'image', 'location', 'package', 'photo', 'publication', 'remote_item', 'search_result', 'shared', 'sharepoint_ids', 'size', 'special_folder', 'video', 'web_dav_url', 'activity', 'analytics', 'children', 'permissions', 'subscriptions', 'thumbnails', 'versions', 'created_by_user', 'last_modified_user', 'created_at', 'created_by', 'last_modified_at', 'last_modified_by')
+    __slots__ = ('id', 'name', 'description', 'etag', 'ctag', 'parent_reference', 'root', 'web_url', 'audio', 'content', 'file', 'file_system_info', 'folder', 'image', 'location', 'package', 'photo', 'publication', 'remote_item', 'search_result', 'shared', 'sharepoint_ids', 'size', 'special_folder', 'video', 'web_dav_url', 'activity', 'children', 'permissions', 'subscriptions', 'thumbnails', 'created_by_user', 'last_modified_user', 'created_at', 'created_by', 'last_modified_at', 'last_modified_by', 'deleted')
+    simple_upload_limit = 4 * 1024 * 1024
+    api_fields = {
+        'id': ('id', None),
+        'name': ('name', None),
+        'description': ('description', None),
+        'etag': ('eTag', None),
+        'ctag': ('cTag', None),
+        'parent_reference': ('parentReference', None),
+        'root': ('root', None),
+        'web_url': ('webUrl', None),
+        'audio': ('audio', None),
+        'content': ('content', None),
+        'file': ('file', None),
+        'file_system_info': ('fileSystemInfo', None),
+        'folder': ('folder', None),
+        'image': ('image', None),
+        'location': ('location', None),
+        'package': ('package', None),
+        'photo': ('photo', None),
+        'publication': ('publication', None),
+        'remote_item': ('remoteItem', None),
+        'search_result': ('searchResult', None),
+        'shared': ('shared', None),
+        'sharepoint_ids': ('sharepointIds', None),
+        'size': ('size', None),
+        'special_folder': ('specialFolder', None),
+        'video': ('video', None),
+        'web_dav_url': ('webDavUrl', None),
+        'activity': ('activity', None),
+        'children': ('children', None),
+        'permissions': ('permissions', None),
+        'subscriptions': ('subscriptions', None),
+        'thumbnails': ('thumbnails', None),
+        'created_by_user': ('createdByUser', None),
+        'last_modified_user': ('lastModifiedUser', None),
+        'created_at': ('createdDateTime', base.Base.parse_date_time),
+        'created_by': ('createdBy', None),
+        'last_modified_at': ('lastModifiedDateTime', base.Base.parse_date_time),
+        'last_modified_by': ('lastModifiedBy', None),
+        'deleted': ('deleted', None)
+    }
 
-    def __init__(self, id, name, description, etag, ctag, parent_reference, root, web_url, audio, content, file, file_system_info, folder, image, location, package, photo, publication, remote_item, search_result, shared, sharepoint_ids, size, special_folder, video, web_dav_url, activity, analytics, children, permissions, subscriptions, thumbnails, versions, created_by_user, last_modified_user, created_at, created_by, last_modified_at, last_modified_by):
+    def __init__(self, id, name, description, etag, ctag, parent_reference, root, web_url, audio, content, file, file_system_info, folder, image, location, package, photo, publication, remote_item, search_result, shared, sharepoint_ids, size, special_folder, video, web_dav_url, activity, analytics, children, permissions, subscriptions, thumbnails, versions, created_by_user, last_modified_user, created_at, created_by, last_modified_at, last_modified_by, deleted=None):
         self.id = id
         self.name = name
         self.description = description
@@ -170,6 +235,7 @@ class DriveItem(base.Base):
         self.created_by = created_by
         self.last_modified_at = last_modified_at
         self.last_modified_by = last_modified_by
+        self.deleted = deleted
 
     def __str__(self):
         return self.id
@@ -204,10 +270,36 @@ class DriveItem(base.Base):
             patch_data['parentReference'] = self.parent_reference
         data = api.request(uri, json=patch_data, method='PATCH')
         logger.info('Moved file %r to %r as %r', self.name, patch_data['parentReference'], new_name)
+        self._forget(api, **kwargs)
+        self._remember(api, data, **kwargs)
         self.id = data['id']
         self.parent_reference = data['parentReference']
         self.name = data['name']
 
+    def copy(self, api, parent, **kwargs):
+        """
+        Copies the item to a folder, waiting for the copy to complete
+
+        Parameters:
+            api (msgraph.api.GraphAPI):  The endpoint to which to send the copy
+            parent (str):  The ID of the destination folder
+
+        Keyword Arguments:
+            name (str):  The name of the copy, default: the name of the item
+            destination_drive (str):  The ID of the destination drive, default: the drive of the item
+            conflict_behavior (str):  What to do if the copy already exists, one of fail, replace or rename
+            wait (bool):  Poll the copy until it completes, default: True
+
+        Returns:
+            msgraph.transfer.TransferOperation:  The copy, including the ID of the new item once completed
+        """
+        bulk = self.transfer(api, **kwargs)
+        operation = bulk.copy(self.id, parent, name=kwargs.get('name'), drive=kwargs.get('destination_drive'))
+        bulk.execute(wait=kwargs.get('wait', True))
+        if operation.error:
+            raise operation.error
+        return operation
+
     def check_in(self, api, **kwargs):
         group = kwargs.get('group')
         site = kwargs.get('site')
@@ -249,6 +341,12 @@ class DriveItem(base.Base):
         logger.info('Checked out %r', self.name)
 
     def all_children(self, api, **kwargs):
+        """
+        Fetches the items in this folder
+
+        Returns:
+            (PageIterator|list):  DriveItem instances, fetched lazily unless as_list is True
+        """
         group = kwargs.get('group')
         site = kwargs.get('site')
         drive = kwargs.get('drive')
@@ -265,14 +363,7 @@ class DriveItem(base.Base):
         else:
             uri = 'me/drive'
         uri += '/items/%s/children' % self.id
-        data = api.request(uri)
-
-        output = [self.__class__.from_api(row) for row in data.get('value', [])]
-        while data.get("@odata.nextLink"):
-            uri = data.get("@odata.nextLink")
-            data = api.request(uri)
-            output += [self.__class__.from_api(row) for row in data.get('value', [])]
-        return output
+        return paging.paginate(api, uri, self.__class__.factory(**kwargs), params=self.select_params(**kwargs), **kwargs)
 
     def update(self, api, **kwargs):
         group = kwargs.get('group')
@@ -314,6 +405,39 @@ class DriveItem(base.Base):
         uri += '/items/%s' % self.id
         api.request(uri, method='DELETE')
         logger.info('Deleted file %r from %r', self.name, uri)
+        self._forget(api, **kwargs)
+
+    def download(self, api, destination, **kwargs):
+        """
+        Downloads the content of the item, streaming it to the destination in chunks
+
+        With parallel enabled, the pre-authenticated download URL of the item is
+        fetched and content larger than segment_size is split into segments which
+        are requested concurrently and written in place into the destination.
+
+        Parameters:
+            api (msgraph.api.GraphAPI):  The endpoint from which to download
+            destination (str|file):  A binary file object, or the path of the file to write
+
+        Keyword Arguments:
+            parallel (bool):  Request segments of the content concurrently with Range headers, default: False
+            chunk_size (int):  The number of bytes read from the response at a time, default: 1 MiB
+            segment_size (int):  The number of bytes requested by each ranged request, default: 16 MiB
+            max_workers (int):  The maximum number of segments requested concurrently, default: 4
+            retry_policy (msgraph.retry.RetryPolicy):  Decides how many times, and after how long, a failed connection is resumed
+            progress (callable):  Called with the msgraph.download.Download after each chunk is written
+
+        Returns:
+            int:  The number of bytes written
+        """
+        uri = self._drive_uri(**kwargs) + '/items/%s' % self.id
+        download_kwargs = dict((key, kwargs[key]) for key in ('chunk_size', 'segment_size', 'max_workers', 'retry_policy') if key in kwargs)
+        if kwargs.get('parallel'):
+            data = api.request(uri, params={'$select': 'id,size,@microsoft.graph.downloadUrl'})
+            content = download.Download.from_api(api, data, **download_kwargs)
+            return content.download_ranges(destination, progress=kwargs.get('progress'))
+        content = download.Download(api, uri + '/content', size=self.size, **download_kwargs)
+        return content.stream(destination, progress=kwargs.get('progress'))
 
     @classmethod
     def versions(self, api, **kwargs):
@@ -353,10 +477,10 @@ class DriveItem(base.Base):
 
     @classmethod
     def from_api(cls, data):
-        id = data['id']
-        name = data['name']
+        id = data.get('id')
+        name = data.get('name')
         description = data.get('description')
-        etag = data.get('etag')
+        etag = data.get('eTag')
         ctag = data.get('cTag')
         parent_reference = data.get('parentReference')
         root = data.get('root')
@@ -375,7 +499,7 @@ class DriveItem(base.Base):
         search_result = data.get('searchResult')
         shared = data.get('shared')
         sharepoint_ids = data.get('sharepointIds')
-        size = data['size']
+        size = data.get('size')
         special_folder = data.get('specialFolder')
         video = data.get('video')
         web_dav_url = data.get('webDavUrl')
@@ -400,7 +524,8 @@ class DriveItem(base.Base):
         else:
             last_modified_at = None
         last_modified_by = data.get('lastModifiedBy')
-        return cls(id, name, description, etag, ctag, parent_reference, root, web_url, audio, content, file, file_system_info, folder, image, location, package, photo, publication, remote_item, search_result, shared, sharepoint_ids, size, special_folder, video, web_dav_url, activity, analytics, children, permissions, subscriptions, thumbnails, versions, created_by_user, last_modified_user, created_at, created_by, last_modified_at, last_modified_by)
+        deleted = data.get('deleted')
+        return cls(id, name, description, etag, ctag, parent_reference, root, web_url, audio, content, file, file_system_info, folder, image, location, package, photo, publication, remote_item, search_result, shared, sharepoint_ids, size, special_folder, video, web_dav_url, activity, analytics, children, permissions, subscriptions, thumbnails, versions, created_by_user, last_modified_user, created_at, created_by, last_modified_at, last_modified_by, deleted)
 
     @classmethod
     def create_folder(cls, api, name, parent, **kwargs):
@@ -426,42 +551,207 @@ class DriveItem(base.Base):
             '@microsoft.graph.conflictBehavior': kwargs.get('conflict_behavior', 'fail')
         }
         data = api.request(uri, json=post_data, method='POST')
-        logger.info('Created new folder %r under', name, parent)
+        logger.info('Created new folder %r under %r', name, parent)
+        cls._remember(api, data, **kwargs)
         return cls.from_api(data)
 
     @classmethod
-    def upload(cls, api, content, **kwargs):
+    def _drive_uri(cls, **kwargs):
         group = kwargs.get('group')
         site = kwargs.get('site')
         drive = kwargs.get('drive')
         user = kwargs.get('user')
 
-        replace = kwargs.get('replace')
         if drive:
-            uri = 'drives/%s' % drive
+            return 'drives/%s' % drive
         elif group:
-            uri = 'groups/%s/drives' % group
+            return 'groups/%s/drive' % group
         elif site:
-            uri = 'sites/%s/drives' % site
+            return 'sites/%s/drive' % site
         elif user:
-            uri = 'users/%s/drives' % user
-        else:
-            uri = 'me/drive'
+            return 'users/%s/drive' % user
+        return 'me/drive'
+
+    @classmethod
+    def upload(cls, api, content=None, **kwargs):
+        """
+        Uploads content to a new item, or replaces the content of an existing item
+
+        Content of at most simple_upload_limit bytes (str being encoded as UTF-8),
+        including empty content, is sent in a single request.  Larger content, and
+        file objects whose size cannot be determined, are sent in chunks through an
+        upload session, see upload_large.  The size of the file named by path, or
+        of a seekable file object, is read from the file system.
+
+        Parameters:
+            api (msgraph.api.GraphAPI):  The endpoint to which to upload
+            content (bytes|str|file):  The content, always sent as-is when bytes or str, or a binary file object
+
+        Keyword Arguments:
+            path (str):  The path of a local file to upload instead of content
+            size (int):  The size of the content, when the file object is not seekable
+            replace (bool):  Replace the content of item instead of creating file_name under parent
+            item (str):  The ID of the item to replace
+            parent (str):  The ID of the folder in which to create the item
+            file_name (str):  The name of the item to create
+            content_type (str):  The content type of the content, default: guessed from file_name, else application/octet-stream
+            skip_unchanged (bool):  Compare the size and hash of the content to the existing item, and skip the upload if they match, default: False
+            remote (DriveItem):  The existing item to compare against when skip_unchanged is enabled, default: fetched from the API endpoint
+
+        Returns:
+            DriveItem:  The uploaded item, or the existing item if the upload was skipped
+        """
+        if kwargs.get('skip_unchanged'):
+            remote = cls._unchanged_remote(api, content, **kwargs)
+            if remote is not None:
+                logger.info('Skipped uploading %r, its content is unchanged', remote.name)
+                return remote
+
+        if not kwargs.get('upload_url'):
+            small_content = cls._small_content(content, **kwargs)
+            if small_content is not None:
+                return cls._upload_simple(api, small_content, **kwargs)
+        return cls.upload_large(api, content, **kwargs)
+
+    @classmethod
+    def _small_content(cls, content, **kwargs):
+        if kwargs.get('path') is not None:
+            if os.path.getsize(kwargs['path']) > cls.simple_upload_limit:
+                return None
+            with open(kwargs['path'], 'rb') as input_file:
+                return input_file.read()
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        if isinstance(content, (bytes, bytearray, memoryview)):
+            return bytes(content) if len(content) <= cls.simple_upload_limit else None
+        size = hashes.size(content)
+        if size is None:
+            size = kwargs.get('size')
+        if size is None or size > cls.simple_upload_limit:
+            return None
+        return content.read(size)
 
-        if replace:
+    @classmethod
+    def _upload_simple(cls, api, content, **kwargs):
+        uri = cls._drive_uri(**kwargs)
+        if kwargs.get('replace'):
             item = kwargs.get('item')
             uri += '/items/%s/content' % item
         else:
             parent = kwargs.get('parent')
             file_name = kwargs.get('file_name')
             uri += '/items/%s:/%s:/content' % (parent, file_name)
-        data = api.request(uri, data=content, content_type='text/plain', method='PUT')
+        content_type = kwargs.get('content_type') or mimetypes.guess_type(kwargs.get('file_name') or '')[0] or 'application/octet-stream'
+        data = api.request(uri, data=content, content_type=content_type, method='PUT')
+        cls._remember(api, data, **kwargs)
+        return cls.from_api(data)
+
+    @classmethod
+    def _unchanged_remote(cls, api, content, **kwargs):
+        remote = kwargs.get('remote')
+        if remote is None:
+            uri = cls._drive_uri(**kwargs)
+            if kwargs.get('replace'):
+                uri += '/items/%s' % kwargs.get('item')
+            else:
+                uri += '/items/%s:/%s:' % (kwargs.get('parent'), kwargs.get('file_name'))
+            try:
+                data = api.request(uri, params={'$select': 'id,name,size,file,eTag,cTag,parentReference'})
+            except exception.MicrosoftException:
+                return None
+            remote = cls.from_api(data)
+        if not remote.file:
+            return None
+        if kwargs.get('path') is not None:
+            content = kwargs['path']
+        elif isinstance(content, str):
+            content = content.encode('utf-8')
+        if hashes.size(content) != remote.size:
+            return None
+        if hashes.matches(content, remote.file.get('hashes')):
+            return remote
+        return None
+
+    @classmethod
+    def create_upload_session(cls, api, **kwargs):
+        """
+        Creates an upload session, through which large content is uploaded in chunks
+
+        Parameters:
+            api (msgraph.api.GraphAPI):  The endpoint in which to create the session
+
+        Keyword Arguments:
+            replace (bool):  Replace the content of item instead of creating file_name under parent
+            item (str):  The ID of the item to replace
+            parent (str):  The ID of the folder in which to create the item
+            file_name (str):  The name of the item to create
+            conflict_behavior (str):  What to do if the item already exists, one of fail, replace or rename, default: replace
+            chunk_size (int):  The number of bytes sent in each request, rounded down to a multiple of 320 KiB, default: 10 MiB
+            retry_policy (msgraph.retry.RetryPolicy):  Decides how many times, and after how long, a failed chunk is resumed
+
+        Returns:
+            msgraph.upload.UploadSession:  The created session
+        """
+        uri = cls._drive_uri(**kwargs)
+        if kwargs.get('replace'):
+            uri += '/items/%s/createUploadSession' % kwargs.get('item')
+        else:
+            uri += '/items/%s:/%s:/createUploadSession' % (kwargs.get('parent'), kwargs.get('file_name'))
+        session_kwargs = dict((key, kwargs[key]) for key in ('conflict_behavior', 'chunk_size', 'retry_policy') if key in kwargs)
+        return upload.UploadSession.create(api, uri, **session_kwargs)
+
+    @classmethod
+    def upload_large(cls, api, content=None, **kwargs):
+        """
+        Uploads content in chunks through an upload session, resuming after failures
+
+        Accepts the keyword arguments of create_upload_session.  Pass the upload_url
+        of an interrupted session to resume it rather than starting over.  Empty
+        content is sent in a single request, as an upload session cannot receive it.
+
+        Parameters:
+            api (msgraph.api.GraphAPI):  The endpoint to which to upload
+            content (bytes|str|file):  The content, always sent as-is when bytes or str (encoded as UTF-8), or a binary file object
+
+        Keyword Arguments:
+            path (str):  The path of a local file to upload instead of content
+            upload_url (str):  The URL of an existing upload session to resume
+            size (int):  The size of the content, required when the file object is not seekable
+            progress (callable):  Called with the msgraph.upload.UploadSession after each chunk is accepted
+
+        Returns:
+            DriveItem:  The uploaded item
+        """
+        upload_url = kwargs.get('upload_url')
+        if kwargs.get('path') is not None:
+            content = kwargs['path']
+        elif isinstance(content, str):
+            content = content.encode('utf-8')
+        size = kwargs.get('size')
+        if size is None:
+            size = hashes.size(content)
+        if size == 0 and not upload_url:
+            # an upload session cannot receive an empty range
+            return cls._upload_simple(api, b'', **kwargs)
+        if upload_url:
+            session_kwargs = dict((key, kwargs[key]) for key in ('chunk_size', 'retry_policy') if key in kwargs)
+            session = upload.UploadSession(api, upload_url, **session_kwargs)
+            session.status()
+        else:
+            session = cls.create_upload_session(api, **kwargs)
+        if isinstance(content, bytes):
+            content = io.BytesIO(content)
+        data = session.upload(content, size=kwargs.get('size'), progress=kwargs.get('progress'))
+        cls._remember(api, data, **kwargs)
         return cls.from_api(data)
 
     @classmethod
     def search(cls, api, query, **kwargs):
         """
         Searches the full hierarchy of items for items matching the query
+
+        Returns:
+            (PageIterator|list):  DriveItem instances, fetched lazily unless as_list is True
         """
         group = kwargs.get('group')
         site = kwargs.get('site')
@@ -480,17 +770,10 @@ class DriveItem(base.Base):
             uri = 'me/drive'
 
         uri += "/root/search(q='%s')" % query
-        data = api.request(uri)
-
-        output = [cls.from_api(row) for row in data.get('value', [])]
-        while data.get("@odata.nextLink"):
-            uri = data.get("@odata.nextLink")
-            data = api.request(uri)
-            output += [cls.from_api(row) for row in data.get('value', [])]
-        return output
+        return paging.paginate(api, uri, cls.factory(**kwargs), params=cls.select_params(**kwargs), **kwargs)
 
     @classmethod
-    def get_children(cls, api, **kwargs):
+    def _children_uri(cls, **kwargs):
         group = kwargs.get('group')
         site = kwargs.get('site')
         drive = kwargs.get('drive')
@@ -515,13 +798,23 @@ class DriveItem(base.Base):
             uri += '/root:/%s:/children' % path
         else:
             uri += '/root/children'
-        data = api.request(uri)
-        output = [cls.from_api(row) for row in data.get('value', [])]
-        while data.get("@odata.nextLink"):
-            uri = data.get("@odata.nextLink")
-            data = api.request(uri)
-            output += [cls.from_api(row) for row in data.get('value', [])]
-        return output
+        return uri
+
+    @classmethod
+    def get_children(cls, api, **kwargs):
+        """
+        Fetches the items in the folder with the ID parent, at path, or at the root of the drive
+
+        Returns:
+            (PageIterator|list):  DriveItem instances, fetched lazily unless as_list is True
+        """
+        if kwargs.get('path') and not kwargs.get('parent'):
+            cache = cls._path_cache(api, **kwargs)
+            entry = cache.get(kwargs['path']) if cache is not None else None
+            if entry is not None and not entry.expired():
+                kwargs['parent'] = entry.id
+        uri = cls._children_uri(**kwargs)
+        return paging.paginate(api, uri, cls.factory(**kwargs), params=cls.select_params(**kwargs), **kwargs)
 
     @classmethod
     def root_folder(cls, api, **kwargs):
@@ -541,11 +834,11 @@ class DriveItem(base.Base):
         else:
             uri = 'me/drive'
         uri += '/root'
-        data = api.request(uri)
+        data = api.request(uri, params=cls.select_params(**kwargs))
         return cls.from_api(data)
 
     @classmethod
-    def get_by_path(cls, api, path, **kwargs):
+    def _path_uri(cls, path, **kwargs):
         group = kwargs.get('group')
         site = kwargs.get('site')
         drive = kwargs.get('drive')
@@ -562,5 +855,205 @@ class DriveItem(base.Base):
         else:
             uri = 'me/drive'
         uri += '/root:/%s' % path
-        data = api.request(uri)
+        return uri
+
+    @classmethod
+    def get_by_path(cls, api, path, **kwargs):
+        cache = cls._path_cache(api, **kwargs)
+        entry = cache.get(path) if cache is not None else None
+        if entry is not None:
+            stale = entry.expired()
+            params = cls.select_params(**kwargs)
+            if stale and params and '$select' in params:
+                # the name and parent are needed to check that the item is still at the path
+                params['$select'] += ',name,parentReference'
+            try:
+                data = api.request(cls._drive_uri(**kwargs) + '/items/%s' % entry.id, params=params)
+            except exception.MicrosoftException:
+                data = dict()
+            if data and not stale:
+                return cls.from_api(data)
+            if cache.normalize(cls._item_path(data) or '') == cache.normalize(path):
+                cache.put(path, data['id'])
+                return cls.from_api(data)
+            logger.debug('Path %r no longer refers to %r', path, entry.id)
+            cache.invalidate(path)
+        uri = cls._path_uri(path, **kwargs)
+        data = api.request(uri, params=cls.select_params(**kwargs))
+        if cache is not None and 'id' in data:
+            cache.put(path, data['id'])
+        return cls.from_api(data)
+
+    @classmethod
+    def resolve(cls, api, path, **kwargs):
+        """
+        Resolves the ID of the item at a path, relative to the root of the drive
+
+        The ID is remembered in the path cache of the drive, so resolving the same
+        path again does not call the API endpoint until the entry expires, after
+        which it is revalidated with a request for the item by its ID.
+
+        Parameters:
+            api (msgraph.api.GraphAPI):  The endpoint from which to fetch data
+            path (str):  The path of the item, such as Reports/2020/summary.xlsx
+
+        Keyword Arguments:
+            path_cache (msgraph.paths.PathCache):  The cache in which to remember the ID, None to always call the API endpoint, default: the shared cache of the drive
+
+        Returns:
+            str:  The ID of the item
+        """
+        cache = cls._path_cache(api, **kwargs)
+        entry = cache.get(path) if cache is not None else None
+        if entry is not None and not entry.expired():
+            return entry.id
+        params = {'$select': 'id,name,parentReference'}
+        if entry is not None:
+            try:
+                data = api.request(cls._drive_uri(**kwargs) + '/items/%s' % entry.id, params=params)
+            except exception.MicrosoftException:
+                data = dict()
+            if cache.normalize(cls._item_path(data) or '') == cache.normalize(path):
+                cache.put(path, data['id'])
+                return data['id']
+            logger.debug('Path %r no longer refers to %r', path, entry.id)
+            cache.invalidate(path)
+        data = api.request(cls._path_uri(path, **kwargs), params=params)
+        if cache is not None:
+            cache.put(path, data['id'])
+        return data['id']
+
+    @classmethod
+    def _path_cache(cls, api, **kwargs):
+        if 'path_cache' in kwargs:
+            return kwargs['path_cache']
+        return paths.PathCache.for_drive(api, cls._drive_uri(**kwargs))
+
+    @staticmethod
+    def _item_path(data):
+        parent_path = (data.get('parentReference') or dict()).get('path')
+        if parent_path is None or not data.get('name'):
+            return None
+        parent_path = parent_path.partition(':')[2].strip('/')
+        if parent_path:
+            return '%s/%s' % (parent_path, data['name'])
+        return data['name']
+
+    @classmethod
+    def _remember(cls, api, data, **kwargs):
+        cache = cls._path_cache(api, **kwargs)
+        path = cls._item_path(data)
+        if cache is not None and path and 'id' in data:
+            cache.put(path, data['id'])
+
+    def _forget(self, api, **kwargs):
+        cache = self._path_cache(api, **kwargs)
+        if cache is None:
+            return
+        cache.invalidate_item(self.id)
+        path = self._item_path(dict(parentReference=self.parent_reference, name=self.name))
+        if path:
+            cache.invalidate(path)
+
+    @classmethod
+    def _delta_request(cls, **kwargs):
+        uri = cls._drive_uri(**kwargs) + '/root/delta'
+        return uri, cls.select_params(**kwargs)
+
+    @classmethod
+    def delta(cls, api, uri=None, **kwargs):
+        """
+        Fetches the DriveItem instances of a drive that were created, updated, moved or deleted from a certain point forward
+
+        Deleted items have the deleted attribute set.  To have the deltaLink persisted
+        between executions, see msgraph.delta.sync, or msgraph.mirror.DriveMirror to
+        maintain a local index of the drive.
+
+        For more information see: https://docs.microsoft.com/en-us/graph/api/driveitem-delta
+
+        Parameters:
+            api (msgraph.api.GraphAPI):  The endpoint from which to fetch data
+            uri (str, optional):  The delta link previously used
+
+        Returns:
+            (tuple):  list of DriveItem instances changed since the uri was last received, and the delta URL
+        """
+        if uri:
+            params = None
+        else:
+            uri, params = cls._delta_request(**kwargs)
+
+        iterator = paging.PageIterator(api, uri, cls.factory(**kwargs), params=params, prefetch=kwargs.get('prefetch', False))
+        output = list(iterator)
+        return output, iterator.delta_link
+
+    @classmethod
+    def transfer(cls, api, **kwargs):
+        """
+        Creates a BulkTransfer, which copies and moves many items of a drive concurrently
+
+        Parameters:
+            api (msgraph.api.GraphAPI):  The endpoint to which to send the operations
+
+        Keyword Arguments:
+            max_workers (int):  The maximum number of batches submitted, or copies polled, concurrently, default: 4
+            initial_interval (float):  The number of seconds before a copy is first polled, default: 1
+            max_interval (float):  The longest number of seconds between two polls of a copy, default: 30
+            max_poll_errors (int):  The number of consecutive polls of a copy which may fail before the copy is failed, default: 5
+            conflict_behavior (str):  What to do if a copy already exists, one of fail, replace or rename
+
+        Returns:
+            msgraph.transfer.BulkTransfer:  The transfer, to which copies and moves are added before it is executed
+        """
+        transfer_kwargs = dict((key, kwargs[key]) for key in ('max_workers', 'initial_interval', 'max_interval', 'max_poll_errors', 'conflict_behavior', 'path_cache') if key in kwargs)
+        return transfer.BulkTransfer(api, cls._drive_uri(**kwargs), **transfer_kwargs)
+
+    @classmethod
+    def walk(cls, api, **kwargs):
+        """
+        Recursively iterates over the items under a folder, listing folders concurrently
+
+        Parameters:
+            api (msgraph.api.GraphAPI):  The endpoint from which to fetch data
+
+        Keyword Arguments:
+            parent (str):  The ID of the folder from which to start, default: the root of the drive
+            path (str):  The path of the folder from which to start, relative to the root of the drive
+            max_workers (int):  The maximum number of folders listed concurrently, default: 4
+            max_depth (int):  The deepest level to list, 1 for only the children of the folder, default: None
+            prune (callable):  Called with the path and instance of each folder, returns True to skip its children
+            page_size (int):  The number of items requested in each page, default: 200
+            fields (list|str):  The attributes to fetch, default: every attribute
+            lazy (bool):  Decode the attributes of each instance on first access, default: False
+
+        Returns:
+            msgraph.walk.TreeWalker:  Yields the path, relative to the folder, and instance of each item
+        """
+        root = kwargs.get('parent')
+        path = kwargs.get('path')
+        if not root and path:
+            root = api.request(cls._path_uri(path, **kwargs), params={'$select': 'id'})['id']
+        params = {'$top': kwargs.get('page_size', 200)}
+        fields = kwargs.get('fields')
+        if fields:
+            if isinstance(fields, str):
+                fields = fields.split(',')
+            params = cls.select_params(params, fields=list(fields) + ['id', 'name', 'folder'])
+        return walk.TreeWalker(api, cls._drive_uri(**kwargs), cls.factory(**kwargs), root=root, params=params, max_workers=kwargs.get('max_workers', 4), max_depth=kwargs.get('max_depth'), prune=kwargs.get('prune'))
+
+    @classmethod
+    async def get_children_async(cls, api, **kwargs):
+        """
+        Fetches the children of a folder from an asynchronous API endpoint
+        """
+        uri = cls._children_uri(**kwargs)
+        return await aio.collect(api, uri, cls.factory(**kwargs), params=cls.select_params(**kwargs), **kwargs)
+
+    @classmethod
+    async def get_by_path_async(cls, api, path, **kwargs):
+        """
+        Fetches the item at a path relative to the root of a drive from an asynchronous API endpoint
+        """
+        uri = cls._path_uri(path, **kwargs)
+        data = await api.request(uri, params=cls.select_params(**kwargs))
         return cls.from_api(data)
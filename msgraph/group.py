@@ -1,5 +1,5 @@
 import logging
-from msgraph import base
+from msgraph import aio, base, paging
 
 
 logger = logging.getLogger(__name__)
@@ -32,10 +32,36 @@ class Group(base.Base):
         security_enabled (bool):  	Specifies whether the group is a security group.
         visibility (str):  	Specifies the visibility of an Office 365 group
         on_premises_provisioning_errors (str):  Errors when using Microsoft synchronization product during provisioning.
+        removed (dict|None):  Used in delta API calls, denoted if a group is new/changed
     """
-    __slots__ = ('id', 'deleted_datetime', 'classification', 'created_datetime', 'creation_options', 'description', 'display_name', 'group_types', 'email_address', 'mail_enabled', 'mail_nickname', 'on_premises_last_sync_datetime', 'on_premises_security_identifier', 'on_premises_sync_enabled', 'preferred_data_location', 'proxy_addresses', 'renewed_date_time', 'resource_behavior_options', 'resource_provisioning_options', 'security_enabled', 'visibility', 'on_premises_provisioning_errors')
+    __slots__ = ('id', 'deleted_datetime', 'classification', 'created_datetime', 'creation_options', 'description', 'display_name', 'group_types', 'email_address', 'mail_enabled', 'mail_nickname', 'on_premises_last_sync_datetime', 'on_premises_security_identifier', 'on_premises_sync_enabled', 'preferred_data_location', 'proxy_addresses', 'renewed_date_time', 'resource_behavior_options', 'resource_provisioning_options', 'security_enabled', 'visibility', 'on_premises_provisioning_errors', 'removed')
+    api_fields = {
+        'id': ('id', None),
+        'deleted_datetime': ('deletedDateTime', base.Base.parse_date_time),
+        'classification': ('classification', None),
+        'created_datetime': ('createdDateTime', base.Base.parse_date_time),
+        'creation_options': ('creationOptions', None),
+        'description': ('description', None),
+        'display_name': ('displayName', None),
+        'group_types': ('groupTypes', None),
+        'email_address': ('mail', None),
+        'mail_enabled': ('mailEnabled', None),
+        'mail_nickname': ('mailNickname', None),
+        'on_premises_last_sync_datetime': ('onPremisesLastSyncDateTime', None),
+        'on_premises_security_identifier': ('onPremisesSecurityIdentifier', None),
+        'on_premises_sync_enabled': ('onPremisesSyncEnabled', None),
+        'preferred_data_location': ('preferredDataLocation', None),
+        'proxy_addresses': ('proxyAddresses', None),
+        'renewed_date_time': ('renewedDateTime', base.Base.parse_date_time),
+        'resource_behavior_options': ('resourceBehaviorOptions', None),
+        'resource_provisioning_options': ('resourceProvisioningOptions', None),
+        'security_enabled': ('securityEnabled', None),
+        'visibility': ('visibility', None),
+        'on_premises_provisioning_errors': ('onPremisesProvisioningErrors', None),
+        'removed': ('@removed', None)
+    }
 
-    def __init__(self, id, deleted_datetime, classification, created_datetime, creation_options, description, display_name, group_types, email_address, mail_enabled, mail_nickname, on_premises_last_sync_datetime, on_premises_security_identifier, on_premises_sync_enabled, preferred_data_location, proxy_addresses, renewed_date_time, resource_behavior_options, resource_provisioning_options, security_enabled, visibility, on_premises_provisioning_errors):
+    def __init__(self, id, deleted_datetime, classification, created_datetime, creation_options, description, display_name, group_types, email_address, mail_enabled, mail_nickname, on_premises_last_sync_datetime, on_premises_security_identifier, on_premises_sync_enabled, preferred_data_location, proxy_addresses, renewed_date_time, resource_behavior_options, resource_provisioning_options, security_enabled, visibility, on_premises_provisioning_errors, removed=None):
         self.id = id
         self.deleted_datetime = deleted_datetime
         self.classification = classification
@@ -58,19 +84,20 @@ class Group(base.Base):
         self.security_enabled = security_enabled
         self.visibility = visibility
         self.on_premises_provisioning_errors = on_premises_provisioning_errors
+        self.removed = removed
 
     def __str__(self):
         return self.id
 
     def __repr__(self):
-        return '<%s %s id=%s display_name=%r, email_address=%r>' % (self.__class__.__name__, id(self), self.display_name, self.email_address)
+        return '<%s %s id=%r, display_name=%r, email_address=%r>' % (self.__class__.__name__, id(self), self.id, self.display_name, self.email_address)
 
     def update(self, api):
         """
         Update the Group at the API endpoint
 
         Parameters:
-            api (msgraph.api.GraphAPI):  The endpoint at which to update the Category instance
+            api (msgraph.api.GraphAPI|msgraph.batch.Batch):  The endpoint at which to update the Group instance
         """
         uri = 'groups/%s' % self.id
         data = {
@@ -98,41 +125,83 @@ class Group(base.Base):
 
     @classmethod
     def from_api(cls, data):
-        id = data['id']
-        raw_deleted_datetime = data['deletedDateTime']
+        id = data.get('id')
+        raw_deleted_datetime = data.get('deletedDateTime')
         if raw_deleted_datetime:
             deleted_datetime = cls.parse_date_time(raw_deleted_datetime)
         else:
             deleted_datetime = None
-        classification = data['classification']
-        raw_created_datetime = data['createdDateTime']
+        classification = data.get('classification')
+        raw_created_datetime = data.get('createdDateTime')
         if raw_created_datetime:
             created_datetime = cls.parse_date_time(raw_created_datetime)
         else:
             created_datetime = None
-        creation_options = data['creationOptions']
-        description = data['description']
-        display_name = data['displayName']
-        group_types = data['groupTypes']
-        email_address = data['mail']
-        mail_enabled = data['mailEnabled']
-        mail_nickname = data['mailNickname']
-        on_premises_last_sync_datetime = data['onPremisesLastSyncDateTime']
-        on_premises_security_identifier = data['onPremisesSecurityIdentifier']
-        on_premises_sync_enabled = data['onPremisesSyncEnabled']
-        preferred_data_location = data['preferredDataLocation']
-        proxy_addresses = data['proxyAddresses']
-        raw_renewed_date_time = data['renewedDateTime']
+        creation_options = data.get('creationOptions')
+        description = data.get('description')
+        display_name = data.get('displayName')
+        group_types = data.get('groupTypes')
+        email_address = data.get('mail')
+        mail_enabled = data.get('mailEnabled')
+        mail_nickname = data.get('mailNickname')
+        on_premises_last_sync_datetime = data.get('onPremisesLastSyncDateTime')
+        on_premises_security_identifier = data.get('onPremisesSecurityIdentifier')
+        on_premises_sync_enabled = data.get('onPremisesSyncEnabled')
+        preferred_data_location = data.get('preferredDataLocation')
+        proxy_addresses = data.get('proxyAddresses')
+        raw_renewed_date_time = data.get('renewedDateTime')
         if raw_renewed_date_time:
             renewed_date_time = cls.parse_date_time(raw_renewed_date_time)
         else:
             renewed_date_time = None
-        resource_behavior_options = data['resourceBehaviorOptions']
-        resource_provisioning_options = data['resourceProvisioningOptions']
-        security_enabled = data['securityEnabled']
-        visibility = data['visibility']
-        on_premises_provisioning_errors = data['onPremisesProvisioningErrors']
-        return cls(id, deleted_datetime, classification, created_datetime, creation_options, description, display_name, group_types, email_address, mail_enabled, mail_nickname, on_premises_last_sync_datetime, on_premises_security_identifier, on_premises_sync_enabled, preferred_data_location, proxy_addresses, renewed_date_time, resource_behavior_options, resource_provisioning_options, security_enabled, visibility, on_premises_provisioning_errors)
+        resource_behavior_options = data.get('resourceBehaviorOptions')
+        resource_provisioning_options = data.get('resourceProvisioningOptions')
+        security_enabled = data.get('securityEnabled')
+        visibility = data.get('visibility')
+        on_premises_provisioning_errors = data.get('onPremisesProvisioningErrors')
+        removed = data.get('@removed')
+        return cls(id, deleted_datetime, classification, created_datetime, creation_options, description, display_name, group_types, email_address, mail_enabled, mail_nickname, on_premises_last_sync_datetime, on_premises_security_identifier, on_premises_sync_enabled, preferred_data_location, proxy_addresses, renewed_date_time, resource_behavior_options, resource_provisioning_options, security_enabled, visibility, on_premises_provisioning_errors, removed)
+
+    @classmethod
+    def _delta_request(cls, **kwargs):
+        fields = kwargs.get('fields', ['id', 'displayName', 'description', 'groupTypes', 'mail', 'mailEnabled', 'mailNickname', 'securityEnabled', 'visibility', 'createdDateTime', 'renewedDateTime'])
+        params = {
+            '$select': cls.select(fields)
+        }
+        return 'groups/delta', params
+
+    @classmethod
+    def delta(cls, api, uri=None, **kwargs):
+        """
+        Fetches Group instances from the API endpoint that were created/updated/removed from a certain point forward
+
+        If a uri is not specified, will return every Group.  The process will return a list of Group
+        instances along with a deltaLink, which should be used during the next execution to fetch the
+        Group instances that changed since the deltaLink was obtained.  To have the deltaLink persisted
+        between executions, see msgraph.delta.sync.
+
+        For more information see: https://docs.microsoft.com/en-us/graph/api/group-delta
+
+        Parameters:
+            api (msgraph.api.GraphAPI):  The endpoint from which to fetch data
+            uri (str, optional):  The delta link previously used
+
+        Keyword Arguments:
+            fields (list):  The attributes (or Graph properties) to fetch, default: the standard Group attributes
+            prefetch (bool):  Request the next page in the background while the current page is processed, default: False
+            lazy (bool):  Decode the attributes of each instance on first access, default: False
+
+        Returns:
+            (tuple):  list of Group instances changed since the uri was last received, and the delta URL
+        """
+        if uri:
+            params = None
+        else:
+            uri, params = cls._delta_request(**kwargs)
+
+        iterator = paging.PageIterator(api, uri, cls.factory(**kwargs), params=params, prefetch=kwargs.get('prefetch', False))
+        output = list(iterator)
+        return output, iterator.delta_link
 
     @classmethod
     def get(cls, api, **kwargs):
@@ -144,22 +213,41 @@ class Group(base.Base):
 
         Keyword Arguments:
             page_size (int):  The number of items to include in each page, default: 100
+            fields (list):  The attributes (or Graph properties) to fetch, default: every attribute
+            max_items (int):  The maximum number of instances to fetch, default: None
+            prefetch (bool):  Request the next page in the background while the current page is processed, default: False
+            as_list (bool):  Fetch every page up front and return a list, default: False
+            lazy (bool):  Decode the attributes of each instance on first access, default: False
 
         Returns:
-            (list):  Group instances
+            (PageIterator|list):  Group instances, fetched lazily unless as_list is True
         """
         uri = 'groups'
 
-        params = {
+        params = cls.select_params({
             '$top': kwargs.get('page_size', 100)
-        }
-        data = api.request(uri, params=params)
-        output = [cls.from_api(row) for row in data.get('value', [])]
-        while data.get("@odata.nextLink"):
-            uri = data.get("@odata.nextLink")
-            data = api.request(uri)
-            output += [cls.from_api(row) for row in data.get('value', [])]
-        return output
+        }, **kwargs)
+        return paging.paginate(api, uri, cls.factory(**kwargs), params=params, **kwargs)
+
+    @classmethod
+    async def get_async(cls, api, **kwargs):
+        """
+        Fetches Group instances from an asynchronous API endpoint
+
+        Parameters:
+            api (msgraph.aio.AsyncGraphAPI):  The endpoint from which to fetch data
+
+        Keyword Arguments:
+            page_size (int):  The number of items to include in each page, default: 100
+            fields (list):  The attributes (or Graph properties) to fetch, default: every attribute
+
+        Returns:
+            (list):  Group instances
+        """
+        params = cls.select_params({
+            '$top': kwargs.get('page_size', 100)
+        }, **kwargs)
+        return await aio.collect(api, 'groups', cls.factory(**kwargs), params=params, **kwargs)
 
     @classmethod
     def create(cls, api, display_name, mail_enabled, mail_nickname, security_enabled, **kwargs):
@@ -0,0 +1,177 @@
+import base64
+import hashlib
+import os
+
+
+class QuickXorHash(object):
+    """
+    Computes the quickXorHash of content, as reported by the API endpoint for files in OneDrive for Business and SharePoint
+
+    Each byte is XORed into a 160 bit state, rotated 11 bits further for every
+    byte, and the length of the content is XORed into the last 64 bits.  As a byte
+    lands at the same rotation as the byte 160 positions before it, each chunk is
+    first folded into 160 bytes with whole-integer XORs, so the cost per byte stays
+    in C rather than in a Python loop.  The interface follows hashlib.
+
+    For more information see: https://docs.microsoft.com/en-us/onedrive/developer/code-snippets/quickxorhash
+
+    Example:
+        from msgraph import hashes
+
+        digest = hashes.QuickXorHash(b'content').base64digest()
+    """
+    name = 'quickXorHash'
+    width = 160
+    shift = 11
+    digest_size = 20
+    _mask = (1 << 160) - 1
+
+    def __init__(self, data=None):
+        self._state = 0
+        self._length = 0
+        if data:
+            self.update(data)
+
+    def __repr__(self):
+        return '<%s %s length=%i>' % (self.__class__.__name__, id(self), self._length)
+
+    def update(self, data):
+        """
+        Adds content to the hash
+
+        Parameters:
+            data (bytes):  The next chunk of the content
+        """
+        size = len(data)
+        if not size:
+            return
+        rows = -(-size // self.width)
+        block = bytes(data) + bytes(rows * self.width - size)
+        while rows > 1:
+            if rows % 2:
+                rows -= 1
+                last = int.from_bytes(block[rows * self.width:], 'little')
+                block = (int.from_bytes(block[:self.width], 'little') ^ last).to_bytes(self.width, 'little') + block[self.width:rows * self.width]
+            half = rows // 2 * self.width
+            block = (int.from_bytes(block[:half], 'little') ^ int.from_bytes(block[half:], 'little')).to_bytes(half, 'little')
+            rows //= 2
+        state = self._state
+        start = self._length
+        for offset, value in enumerate(block):
+            if value:
+                position = (start + offset) * self.shift % self.width
+                state ^= ((value << position) | (value >> (self.width - position))) & self._mask
+        self._state = state
+        self._length += size
+
+    def digest(self):
+        """
+        Returns:
+            bytes:  The 20 byte hash of the content added so far
+        """
+        digest = bytearray(self._state.to_bytes(self.digest_size, 'little'))
+        for index, value in enumerate(self._length.to_bytes(8, 'little')):
+            digest[self.digest_size - 8 + index] ^= value
+        return bytes(digest)
+
+    def base64digest(self):
+        """
+        Returns:
+            str:  The hash encoded as base64, as the quickXorHash of the file facet of a DriveItem
+        """
+        return base64.b64encode(self.digest()).decode('ascii')
+
+
+def _read_chunks(content, chunk_size):
+    if isinstance(content, (bytes, bytearray, memoryview)):
+        view = memoryview(content)
+        for start in range(0, len(view), chunk_size):
+            yield view[start:start + chunk_size]
+        return
+    if isinstance(content, str):
+        with open(content, 'rb') as input_file:
+            for chunk in iter(lambda: input_file.read(chunk_size), b''):
+                yield chunk
+        return
+    position = content.tell()
+    try:
+        for chunk in iter(lambda: content.read(chunk_size), b''):
+            yield chunk
+    finally:
+        content.seek(position)
+
+
+def compute(content, names=('quickXorHash',), chunk_size=4 * 1024 * 1024):
+    """
+    Computes the hashes of content as reported in the file facet of a DriveItem, reading it in chunks
+
+    Parameters:
+        content (bytes|str|file):  The content, a seekable binary file object or the path of a file
+        names (tuple):  The hashes to compute, any of quickXorHash, sha1Hash and sha256Hash
+        chunk_size (int):  The number of bytes read at a time
+
+    Returns:
+        dict:  The value of each requested hash, keyed by its name in the file facet
+    """
+    factories = {
+        'quickXorHash': QuickXorHash,
+        'sha1Hash': hashlib.sha1,
+        'sha256Hash': hashlib.sha256
+    }
+    hashers = dict((name, factories[name]()) for name in names)
+    for chunk in _read_chunks(content, chunk_size):
+        for hasher in hashers.values():
+            hasher.update(chunk)
+    output = dict()
+    for name, hasher in hashers.items():
+        if isinstance(hasher, QuickXorHash):
+            output[name] = hasher.base64digest()
+        else:
+            output[name] = hasher.hexdigest().upper()
+    return output
+
+
+def size(content):
+    """
+    Determines the size of content without reading it
+
+    Parameters:
+        content (bytes|str|file):  The content, a binary file object or the path of a file
+
+    Returns:
+        int|None:  The number of bytes of content, None if the file object is not seekable
+    """
+    if isinstance(content, (bytes, bytearray, memoryview)):
+        return len(content)
+    if isinstance(content, str):
+        return os.path.getsize(content)
+    seekable = getattr(content, 'seekable', None)
+    if not (seekable and seekable()):
+        return None
+    position = content.tell()
+    end = content.seek(0, os.SEEK_END)
+    content.seek(position)
+    return end - position
+
+
+def matches(content, remote_hashes):
+    """
+    Indicates if content is identical to a remote file, comparing a single hash reported for the file
+
+    The quickXorHash is preferred, then the sha1Hash, then the sha256Hash.
+
+    Parameters:
+        content (bytes|str|file):  The content, a seekable binary file object or the path of a file
+        remote_hashes (dict):  The hashes of the file facet of the remote DriveItem
+
+    Returns:
+        bool:  True if the hash of the content equals the remote hash, False if it differs or no supported hash was reported
+    """
+    for name in ('quickXorHash', 'sha1Hash', 'sha256Hash'):
+        remote = (remote_hashes or dict()).get(name)
+        if remote:
+            local = compute(content, names=(name,))[name]
+            if name == 'quickXorHash':
+                return local == remote
+            return local.upper() == remote.upper()
+    return False
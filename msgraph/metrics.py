@@ -0,0 +1,429 @@
+import bisect
+import collections
+import functools
+import logging
+import re
+import threading
+import time
+from urllib.parse import unquote, urlparse
+
+
+logger = logging.getLogger(__name__)
+
+_name_segment = re.compile(r'^[A-Za-z_$][A-Za-z_.$]*$')
+_version_segment = re.compile(r'^(v\d+\.\d+|beta)$')
+_path_addressing = re.compile(r':/[^:]*(:|$)')
+
+
+@functools.lru_cache(maxsize=4096)
+def endpoint_template(url, resource_uri=None):
+    """
+    Groups the URLs of requests by the endpoint they call, replacing the IDs and paths they contain with placeholders
+
+    Segments made only of letters (such as users, children or microsoft.graph.delta)
+    are kept, while every other segment becomes {id}, the path of path-based
+    addressing becomes {path} and the arguments of functions become (...).  The
+    query string is dropped.
+
+    Parameters:
+        url (str):  The absolute URL of the request
+        resource_uri (str, optional):  The host of the API service, whose URLs are reported without their host and version
+
+    Returns:
+        str:  The template of the endpoint, such as users/{id}/drive/root:{path}:/children
+
+    Example:
+        from msgraph import metrics
+
+        metrics.endpoint_template('https://graph.microsoft.com/v1.0/sites/contoso.sharepoint.com,1c5d,8b2a/lists/8bb3c7e8-6a0e-4c4f-9d6a-1e1a2f3b4c5d/items?$top=999', 'https://graph.microsoft.com')
+        # 'sites/{id}/lists/{id}/items'
+    """
+    parsed = urlparse(url)
+    path = _path_addressing.sub(lambda match: ':{path}:', unquote(parsed.path))
+    segments = []
+    for segment in path.split('/'):
+        if not segment:
+            continue
+        name, parenthesis, _ = segment.partition('(')
+        if parenthesis:
+            segment = name + '(...)'
+        elif ':{path}:' in segment:
+            prefix, _, suffix = segment.partition(':{path}:')
+            segment = (prefix if _name_segment.match(prefix) else '{id}') + ':{path}:' + suffix
+        elif not (_name_segment.match(segment) or _version_segment.match(segment)):
+            segment = '{id}'
+        segments.append(segment)
+    if resource_uri and url.startswith(resource_uri):
+        if segments and _version_segment.match(segments[0]):
+            segments = segments[1:]
+        return '/'.join(segments)
+    return '/'.join([parsed.netloc] + segments)
+
+
+class RequestEvent(object):
+    """
+    Describes a completed call to the API endpoint, passed to each hook of a GraphAPI
+
+    A single event is reported for each call to GraphAPI.request, once every retry
+    of the call has completed.
+
+    Attributes:
+        method (str):  The HTTP method of the request
+        url (str):  The absolute URL of the request
+        template (str):  The endpoint of the request, see endpoint_template
+        status (int):  The status code of the final response, None if no response was received (or the call was answered from the cache without sending a request)
+        elapsed (float):  The number of seconds the call took, including retries and the time spent waiting between them
+        attempts (int):  The number of times the request was sent
+        throttled (int):  The number of responses which were throttled (429 Too Many Requests or 503 Service Unavailable)
+        bytes_sent (int):  The size of the payload of the request, for every attempt
+        bytes_received (int):  The size of the body of the final response, or its Content-Length when it was streamed
+        items (int):  The number of rows of the page returned, None unless the response was a page of a collection
+        error (Exception):  The error raised by the call, None if it succeeded
+        cached (bool):  True if the body returned came from a msgraph.cache.ResponseCache, without sending a request or after 304 Not Modified
+    """
+    __slots__ = ('method', 'url', 'template', 'status', 'elapsed', 'attempts', 'throttled', 'bytes_sent', 'bytes_received', 'items', 'error', 'cached', 'started_at')
+
+    def __init__(self, method, url=None):
+        self.method = method.upper()
+        self.url = url
+        self.template = None
+        self.status = None
+        self.elapsed = 0.0
+        self.attempts = 0
+        self.throttled = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.items = None
+        self.error = None
+        self.cached = False
+        self.started_at = time.perf_counter()
+
+    def __repr__(self):
+        return '<%s %s method=%r, template=%r, status=%r, elapsed=%.3f, attempts=%i>' % (self.__class__.__name__, id(self), self.method, self.template, self.status, self.elapsed, self.attempts)
+
+    def sent(self, status, body_size):
+        """
+        Records an attempt of the request
+
+        Parameters:
+            status (int):  The status code of the response
+            body_size (int):  The size of the payload of the request
+        """
+        self.attempts += 1
+        self.status = status
+        self.bytes_sent += body_size or 0
+        if status in (429, 503):
+            self.throttled += 1
+
+    def finish(self, resource_uri=None):
+        """
+        Completes the event, once the call returned or failed
+
+        Parameters:
+            resource_uri (str, optional):  The host of the API service, see endpoint_template
+        """
+        self.elapsed = time.perf_counter() - self.started_at
+        if self.url:
+            self.template = endpoint_template(self.url.split('?', 1)[0], resource_uri)
+
+
+def emit(hooks, event):
+    """
+    Passes a completed call to each hook, logging rather than raising the errors of the hooks
+
+    Parameters:
+        hooks (list):  The callables to which the event is passed
+        event (RequestEvent):  The completed call
+    """
+    for hook in hooks:
+        try:
+            hook(event)
+        except Exception:
+            logger.error('Request hook %r failed', hook, exc_info=1)
+
+
+def body_size(body):
+    """
+    Measures the payload of a request, without reading file objects
+
+    Parameters:
+        body (bytes|str|file|None):  The payload
+
+    Returns:
+        int:  The number of bytes of the payload, 0 if it cannot be measured
+    """
+    if isinstance(body, (bytes, bytearray)):
+        return len(body)
+    if isinstance(body, str):
+        return len(body.encode('utf-8'))
+    return 0
+
+
+class Histogram(object):
+    """
+    Counts observations in buckets with fixed upper bounds, as a Prometheus histogram
+
+    Attributes:
+        bounds (tuple):  The upper bound of each bucket, in increasing order
+        counts (list):  The number of observations which fell in each bucket, the last bucket holding those above every bound
+        count (int):  The number of observations
+        sum (float):  The sum of the observations
+        max (float):  The largest observation, None until a value was observed
+    """
+    default_bounds = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+    def __init__(self, bounds=None):
+        self.bounds = tuple(bounds or self.default_bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = None
+
+    def __repr__(self):
+        return '<%s %s count=%i, sum=%.3f>' % (self.__class__.__name__, id(self), self.count, self.sum)
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def mean(self):
+        """
+        Returns:
+            float:  The average observation, None until a value was observed
+        """
+        return self.sum / self.count if self.count else None
+
+    def percentile(self, fraction):
+        """
+        Estimates a percentile of the observations, as the upper bound of the bucket in which it falls
+
+        Parameters:
+            fraction (float):  The percentile, between 0 and 1, such as 0.99
+
+        Returns:
+            float:  The upper bound of the bucket of the percentile, None until a value was observed
+        """
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+
+class EndpointMetrics(object):
+    """
+    The metrics of every call to a single endpoint, with a single HTTP method
+
+    Attributes:
+        method (str):  The HTTP method of the calls
+        template (str):  The endpoint of the calls, see endpoint_template
+        latency (Histogram):  The number of seconds each call took, including retries
+        statuses (collections.Counter):  The number of calls completed with each status code, None for calls which received no response, not counting those answered from the cache without a request
+        requests (int):  The number of calls, including those answered from the cache
+        cache_hits (int):  The number of calls answered from the cache, without a request or after 304 Not Modified
+        errors (int):  The number of calls which raised an error
+        retries (int):  The number of times calls were retried
+        throttled (int):  The number of throttled responses
+        bytes_sent (int):  The size of every payload sent
+        bytes_received (int):  The size of every response received
+        pages (int):  The number of pages of collections returned
+        items (int):  The number of rows of those pages
+    """
+
+    def __init__(self, method, template, bounds=None):
+        self.method = method
+        self.template = template
+        self.latency = Histogram(bounds)
+        self.statuses = collections.Counter()
+        self.requests = 0
+        self.cache_hits = 0
+        self.errors = 0
+        self.retries = 0
+        self.throttled = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.pages = 0
+        self.items = 0
+
+    def __repr__(self):
+        return '<%s %s method=%r, template=%r, requests=%i, total=%.3f>' % (self.__class__.__name__, id(self), self.method, self.template, self.requests, self.latency.sum)
+
+    def observe(self, event):
+        self.latency.observe(event.elapsed)
+        if event.attempts or not event.cached:
+            self.statuses[event.status] += 1
+        self.requests += 1
+        self.cache_hits += 1 if event.cached else 0
+        self.errors += 1 if event.error is not None else 0
+        self.retries += max(0, event.attempts - 1)
+        self.throttled += event.throttled
+        self.bytes_sent += event.bytes_sent
+        self.bytes_received += event.bytes_received
+        if event.items is not None:
+            self.pages += 1
+            self.items += event.items
+
+    def to_dict(self):
+        """
+        Returns:
+            dict:  The metrics, with the count, mean, p50, p90, p99 and max of the latency
+        """
+        latency = self.latency
+        return dict(
+            method=self.method,
+            endpoint=self.template,
+            requests=self.requests,
+            cache_hits=self.cache_hits,
+            errors=self.errors,
+            retries=self.retries,
+            throttled=self.throttled,
+            statuses=dict(self.statuses),
+            bytes_sent=self.bytes_sent,
+            bytes_received=self.bytes_received,
+            pages=self.pages,
+            items=self.items,
+            latency=dict(total=latency.sum, mean=latency.mean(), p50=latency.percentile(0.5), p90=latency.percentile(0.9), p99=latency.percentile(0.99), max=latency.max)
+        )
+
+
+class MetricsRegistry(object):
+    """
+    Aggregates the calls to the API endpoint by endpoint and HTTP method, as a hook of GraphAPI or AsyncGraphAPI
+
+    The registry is safe to share between threads, and between several GraphAPI
+    instances.  Endpoints are grouped by their template (see endpoint_template), so
+    users/{id} counts every call fetching a single user.
+
+    Attributes:
+        bounds (tuple):  The upper bound, in seconds, of each bucket of the latency histograms
+
+    Example:
+        from msgraph import api, metrics
+
+        registry = metrics.MetricsRegistry()
+        api_instance = api.GraphAPI.from_certificate(authority_host_uri, tenant, resource_uri, client_id, client_certificate, client_thumbprint, hooks=[registry])
+        ...
+        for endpoint in registry.endpoints()[:10]:
+            print(endpoint.method, endpoint.template, endpoint.requests, endpoint.latency.sum, endpoint.latency.percentile(0.99))
+        print(registry.to_prometheus())
+    """
+    prefix = 'msgraph'
+
+    def __init__(self, bounds=None):
+        self.bounds = tuple(bounds or Histogram.default_bounds)
+        self._endpoints = dict()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return '<%s %s endpoints=%i>' % (self.__class__.__name__, id(self), len(self._endpoints))
+
+    def __call__(self, event):
+        self.record(event)
+
+    def record(self, event):
+        """
+        Adds a completed call to the metrics of its endpoint
+
+        Parameters:
+            event (RequestEvent):  The completed call
+        """
+        key = (event.method, event.template)
+        with self._lock:
+            endpoint = self._endpoints.get(key)
+            if endpoint is None:
+                endpoint = self._endpoints[key] = EndpointMetrics(event.method, event.template, self.bounds)
+            endpoint.observe(event)
+
+    def get(self, method, template):
+        """
+        Fetches the metrics of an endpoint
+
+        Parameters:
+            method (str):  The HTTP method of the calls
+            template (str):  The endpoint, see endpoint_template
+
+        Returns:
+            EndpointMetrics|None:  The metrics of the endpoint, None if it was never called
+        """
+        return self._endpoints.get((method.upper(), template))
+
+    def endpoints(self):
+        """
+        Returns:
+            list:  The EndpointMetrics of every endpoint called, those which took the longest in total first
+        """
+        with self._lock:
+            endpoints = list(self._endpoints.values())
+        return sorted(endpoints, key=lambda endpoint: endpoint.latency.sum, reverse=True)
+
+    def snapshot(self):
+        """
+        Returns:
+            list:  The metrics of every endpoint called as a dict, those which took the longest in total first
+        """
+        with self._lock:
+            return [endpoint.to_dict() for endpoint in sorted(self._endpoints.values(), key=lambda endpoint: endpoint.latency.sum, reverse=True)]
+
+    def reset(self):
+        """
+        Forgets every call
+        """
+        with self._lock:
+            self._endpoints.clear()
+
+    def to_prometheus(self):
+        """
+        Exports the metrics in the Prometheus text exposition format, to be served from a /metrics endpoint
+
+        Returns:
+            str:  The metrics of every endpoint
+        """
+        counters = [
+            ('cache_hits_total', 'Requests to the Microsoft Graph API answered from the response cache', 'cache_hits'),
+            ('request_retries_total', 'Retries of requests to the Microsoft Graph API', 'retries'),
+            ('request_throttled_total', 'Throttled responses from the Microsoft Graph API', 'throttled'),
+            ('request_errors_total', 'Requests to the Microsoft Graph API which raised an error', 'errors'),
+            ('sent_bytes_total', 'Bytes of payloads sent to the Microsoft Graph API', 'bytes_sent'),
+            ('received_bytes_total', 'Bytes of responses received from the Microsoft Graph API', 'bytes_received'),
+            ('pages_total', 'Pages of collections returned by the Microsoft Graph API', 'pages'),
+            ('page_items_total', 'Rows of the pages of collections returned by the Microsoft Graph API', 'items'),
+        ]
+        with self._lock:
+            endpoints = sorted(self._endpoints.values(), key=lambda endpoint: (endpoint.template or '', endpoint.method))
+            lines = []
+            name = '%s_request_duration_seconds' % self.prefix
+            lines.append('# HELP %s Duration of requests to the Microsoft Graph API, including retries' % name)
+            lines.append('# TYPE %s histogram' % name)
+            for endpoint in endpoints:
+                labels = self._labels(endpoint)
+                cumulative = 0
+                for bound, count in zip(endpoint.latency.bounds + (float('inf'),), endpoint.latency.counts):
+                    cumulative += count
+                    lines.append('%s_bucket{%s,le="%s"} %i' % (name, labels, '+Inf' if bound == float('inf') else repr(bound), cumulative))
+                lines.append('%s_sum{%s} %r' % (name, labels, endpoint.latency.sum))
+                lines.append('%s_count{%s} %i' % (name, labels, endpoint.latency.count))
+            name = '%s_requests_total' % self.prefix
+            lines.append('# HELP %s Requests to the Microsoft Graph API, by status code' % name)
+            lines.append('# TYPE %s counter' % name)
+            for endpoint in endpoints:
+                for status, count in sorted(endpoint.statuses.items(), key=lambda item: item[0] or 0):
+                    lines.append('%s{%s,status="%s"} %i' % (name, self._labels(endpoint), status or '', count))
+            for suffix, description, attribute in counters:
+                name = '%s_%s' % (self.prefix, suffix)
+                lines.append('# HELP %s %s' % (name, description))
+                lines.append('# TYPE %s counter' % name)
+                for endpoint in endpoints:
+                    lines.append('%s{%s} %i' % (name, self._labels(endpoint), getattr(endpoint, attribute)))
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def _labels(endpoint):
+        template = (endpoint.template or '').replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        return 'method="%s",endpoint="%s"' % (endpoint.method, template)
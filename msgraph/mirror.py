@@ -0,0 +1,220 @@
+import logging
+import posixpath
+from msgraph import delta, files
+
+
+logger = logging.getLogger(__name__)
+
+
+class MirrorItem(object):
+    """
+    The state of a DriveItem as recorded in a DriveMirror
+
+    Attributes:
+        id (str):  The ID of the item
+        parent (str):  The ID of the folder containing the item, None for the root of the drive
+        name (str):  The name of the item
+        etag (str):  The eTag of the item, which changes with its metadata or content
+        ctag (str):  The cTag of the item, which changes with its content
+        size (int):  The size of the item, in bytes
+        hash (str):  The quickXorHash, sha1Hash or sha256Hash of a file, None for folders
+        folder (bool):  Indicates the item is a folder
+        last_modified (str):  When the item was last modified, as returned by the API
+    """
+    __slots__ = ('id', 'parent', 'name', 'etag', 'ctag', 'size', 'hash', 'folder', 'last_modified')
+
+    def __init__(self, id, parent, name, etag, ctag, size, hash, folder, last_modified):
+        self.id = id
+        self.parent = parent
+        self.name = name
+        self.etag = etag
+        self.ctag = ctag
+        self.size = size
+        self.hash = hash
+        self.folder = folder
+        self.last_modified = last_modified
+
+    def __repr__(self):
+        return '<%s %s id=%r, parent=%r, name=%r, size=%r>' % (self.__class__.__name__, id(self), self.id, self.parent, self.name, self.size)
+
+    @classmethod
+    def from_api(cls, data):
+        """
+        Builds a MirrorItem from a row of a drive delta query
+
+        Parameters:
+            data (dict):  raw data returned from the API
+
+        Returns:
+            MirrorItem:  the item built from the provided data
+        """
+        parent = None
+        if 'root' not in data:
+            parent = (data.get('parentReference') or dict()).get('id')
+        hashes = (data.get('file') or dict()).get('hashes') or dict()
+        hash = hashes.get('quickXorHash') or hashes.get('sha1Hash') or hashes.get('sha256Hash')
+        name = '' if 'root' in data else data.get('name')
+        return cls(data['id'], parent, name, data.get('eTag'), data.get('cTag'), data.get('size'), hash, 'folder' in data or 'root' in data, data.get('lastModifiedDateTime'))
+
+
+class DriveMirror(delta.SQLiteDeltaStore):
+    """
+    Mirrors the hierarchy of drives in a SQLite database, kept current through delta queries
+
+    The first sync of a drive records every item, later syncs only apply the items
+    created, updated, moved or deleted since the previous sync.  As the mirror is also
+    the DeltaStore of the query, the delta link is saved in the same database once
+    each page has been applied.  Paths are resolved from the recorded parents, so
+    moving a folder only updates a single row and lookups never call the API endpoint.
+    When the delta link of a drive expires, its items are forgotten and the drive is
+    mirrored from scratch.
+
+    Example:
+        from msgraph import mirror
+
+        drive_mirror = mirror.DriveMirror('drives.sqlite3')
+        drive_mirror.sync(api_instance, drive=drive_id)
+        item = drive_mirror.get_by_path('Reports/2020/summary.xlsx', drive=drive_id)
+        print(drive_mirror.get_path(item.id, drive=drive_id), item.hash)
+    """
+    fields = ['id', 'name', 'parentReference', 'eTag', 'cTag', 'size', 'file', 'folder', 'root', 'deleted', 'lastModifiedDateTime']
+
+    def __init__(self, path):
+        super(DriveMirror, self).__init__(path)
+        with self._connect() as connection:
+            connection.execute('CREATE TABLE IF NOT EXISTS drive_item (drive TEXT NOT NULL, id TEXT NOT NULL, parent TEXT, name TEXT NOT NULL, etag TEXT, ctag TEXT, size INTEGER, hash TEXT, folder INTEGER NOT NULL, last_modified TEXT, PRIMARY KEY (drive, id))')
+            connection.execute('CREATE INDEX IF NOT EXISTS drive_item_parent ON drive_item (drive, parent, name)')
+
+    def sync(self, api, **kwargs):
+        """
+        Applies the changes to a drive since its last sync
+
+        Parameters:
+            api (msgraph.api.GraphAPI):  The endpoint from which to fetch data
+
+        Keyword Arguments:
+            drive (str):  The ID of the drive
+            group (str):  The ID of the group whose default drive is mirrored
+            site (str):  The ID of the site whose default drive is mirrored
+            user (str):  The ID of the user whose default drive is mirrored, default: the signed in user
+            prefetch (bool):  Request the next page in the background while the current page is applied, default: False
+
+        Returns:
+            tuple:  The number of items updated, and the number of items deleted
+        """
+        drive = files.DriveItem._drive_uri(**kwargs)
+        resource = '%s/root/delta' % drive
+        if self.load(resource) is None:
+            self._forget(drive)
+        iterator = delta.DeltaSync(api, self, resource, '', dict, params={'$select': ','.join(self.fields)}, prefetch=kwargs.get('prefetch', False))
+        updated = deleted = 0
+        for page in iterator.pages():
+            page_updated, page_deleted = self._apply(drive, page)
+            updated += page_updated
+            deleted += page_deleted
+        logger.info('Mirrored %r: %i items updated, %i items deleted', drive, updated, deleted)
+        return updated, deleted
+
+    def clear(self, resource, scope=''):
+        super(DriveMirror, self).clear(resource, scope)
+        if resource.endswith('/root/delta'):
+            self._forget(resource[:-len('/root/delta')])
+
+    def _forget(self, drive):
+        with self._lock, self._connect() as connection:
+            connection.execute('DELETE FROM drive_item WHERE drive = ?', (drive,))
+
+    def _apply(self, drive, rows):
+        updated = deleted = 0
+        with self._lock, self._connect() as connection:
+            for row in rows:
+                if 'deleted' in row:
+                    connection.execute('WITH RECURSIVE subtree(id) AS (SELECT ? UNION SELECT drive_item.id FROM drive_item JOIN subtree ON drive_item.parent = subtree.id WHERE drive_item.drive = ?) DELETE FROM drive_item WHERE drive = ? AND id IN subtree', (row['id'], drive, drive))
+                    deleted += 1
+                    continue
+                item = MirrorItem.from_api(row)
+                connection.execute('INSERT OR REPLACE INTO drive_item (drive, id, parent, name, etag, ctag, size, hash, folder, last_modified) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', (drive, item.id, item.parent, item.name, item.etag, item.ctag, item.size, item.hash, int(item.folder), item.last_modified))
+                updated += 1
+        return updated, deleted
+
+    def get(self, id, **kwargs):
+        """
+        Fetches the recorded state of an item
+
+        Parameters:
+            id (str):  The ID of the item
+
+        Keyword Arguments:
+            drive (str):  The ID of the drive, or the group, site or user whose default drive is mirrored
+
+        Returns:
+            MirrorItem|None:  The recorded item, None if the item is not in the mirror
+        """
+        drive = files.DriveItem._drive_uri(**kwargs)
+        with self._lock, self._connect() as connection:
+            row = connection.execute('SELECT id, parent, name, etag, ctag, size, hash, folder, last_modified FROM drive_item WHERE drive = ? AND id = ?', (drive, id)).fetchone()
+        return self._item(row)
+
+    def children(self, id, **kwargs):
+        """
+        Fetches the recorded children of a folder
+
+        Parameters:
+            id (str):  The ID of the folder
+
+        Returns:
+            list:  The MirrorItem of each child, ordered by name
+        """
+        drive = files.DriveItem._drive_uri(**kwargs)
+        with self._lock, self._connect() as connection:
+            rows = connection.execute('SELECT id, parent, name, etag, ctag, size, hash, folder, last_modified FROM drive_item WHERE drive = ? AND parent = ? ORDER BY name', (drive, id)).fetchall()
+        return [self._item(row) for row in rows]
+
+    def get_path(self, id, **kwargs):
+        """
+        Resolves the path of an item, relative to the root of its drive
+
+        Parameters:
+            id (str):  The ID of the item
+
+        Returns:
+            str|None:  The path of the item, such as Reports/2020/summary.xlsx, None if the item is not in the mirror
+        """
+        drive = files.DriveItem._drive_uri(**kwargs)
+        names = []
+        with self._lock, self._connect() as connection:
+            while id is not None:
+                row = connection.execute('SELECT parent, name FROM drive_item WHERE drive = ? AND id = ?', (drive, id)).fetchone()
+                if row is None:
+                    return None
+                id, name = row
+                if name:
+                    names.append(name)
+        return '/'.join(reversed(names))
+
+    def get_by_path(self, path, **kwargs):
+        """
+        Fetches the recorded state of the item at a path, relative to the root of its drive
+
+        Parameters:
+            path (str):  The path of the item, such as Reports/2020/summary.xlsx
+
+        Returns:
+            MirrorItem|None:  The recorded item, None if no item is recorded at the path
+        """
+        drive = files.DriveItem._drive_uri(**kwargs)
+        names = [name for name in posixpath.normpath('/' + path).split('/') if name]
+        with self._lock, self._connect() as connection:
+            row = connection.execute('SELECT id, parent, name, etag, ctag, size, hash, folder, last_modified FROM drive_item WHERE drive = ? AND parent IS NULL', (drive,)).fetchone()
+            for name in names:
+                if row is None:
+                    break
+                row = connection.execute('SELECT id, parent, name, etag, ctag, size, hash, folder, last_modified FROM drive_item WHERE drive = ? AND parent = ? AND name = ? COLLATE NOCASE', (drive, row[0], name)).fetchone()
+        return self._item(row)
+
+    @staticmethod
+    def _item(row):
+        if row is None:
+            return None
+        id, parent, name, etag, ctag, size, hash, folder, last_modified = row
+        return MirrorItem(id, parent, name, etag, ctag, size, hash, bool(folder), last_modified)
@@ -0,0 +1,179 @@
+import asyncio
+import logging
+from concurrent import futures
+
+
+logger = logging.getLogger(__name__)
+
+
+class PageIterator(object):
+    """
+    Lazily iterates over the instances of a paged collection from the API endpoint
+
+    Pages are only requested as the iterator is consumed, following the
+    @odata.nextLink of each page, so only a single page is held in memory at a time.
+    Iteration stops early once max_items instances have been produced.  When
+    prefetch is enabled, the next page is requested on a background worker while
+    the current page is being processed, overlapping the latency of the API
+    endpoint with the work of the caller.
+
+    Attributes:
+        api (msgraph.api.GraphAPI):  The endpoint from which to fetch data
+        uri (str):  The endpoint of the collection
+        factory (callable):  Builds an instance from each row of the collection
+        params (dict):  The query parameters of the first page
+        version (str):  The version of the API to use
+        max_items (int):  The maximum number of instances to produce, None for every instance
+        prefetch (bool):  Request the next page in the background while the current page is processed
+        next_link (str):  The URL of the next page, None once the collection has been exhausted
+        delta_link (str):  The @odata.deltaLink of the final page of a delta query, None otherwise
+        page_count (int):  The number of pages fetched so far
+
+    Example:
+        from msgraph import paging, user
+
+        for instance in user.User.get(api_instance):
+            print(instance)
+
+        first_ten_users = list(user.User.get(api_instance, max_items=10))
+
+        for instance in user.User.get(api_instance, prefetch=True):
+            process(instance)
+    """
+
+    def __init__(self, api, uri, factory, **kwargs):
+        self.api = api
+        self.uri = uri
+        self.factory = factory
+        self.params = kwargs.get('params')
+        self.version = kwargs.get('version', 'v1.0')
+        self.max_items = kwargs.get('max_items')
+        self.prefetch = kwargs.get('prefetch', False)
+        self.next_link = None
+        self.delta_link = None
+        self.page_count = 0
+
+    def __repr__(self):
+        return '<%s %s uri=%r, max_items=%r, page_count=%i>' % (self.__class__.__name__, id(self), self.uri, self.max_items, self.page_count)
+
+    def __iter__(self):
+        for page in self.pages():
+            for instance in page:
+                yield instance
+
+    def _first_page(self):
+        if self.params:
+            return self.api.request(self.uri, params=self.params, version=self.version)
+        return self.api.request(self.uri, version=self.version)
+
+    def _next_page(self):
+        return self.api.request(self.next_link, version=self.version)
+
+    def _advance(self, data, remaining):
+        self.page_count += 1
+        self.next_link = data.get('@odata.nextLink')
+        self.delta_link = data.get('@odata.deltaLink')
+        rows = data.get('value', [])
+        if remaining is not None and len(rows) >= remaining:
+            rows = rows[:remaining]
+            self.next_link = None
+        return rows
+
+    def pages(self):
+        """
+        Iterates over the pages of the collection
+
+        Returns:
+            generator:  A list of instances for each page of the collection
+        """
+        remaining = self.max_items
+        executor = futures.ThreadPoolExecutor(max_workers=1) if self.prefetch else None
+        try:
+            data = self._first_page()
+            while True:
+                rows = self._advance(data, remaining)
+                future = None
+                if executor and self.next_link:
+                    future = executor.submit(self._next_page)
+                page = [self.factory(row) for row in rows]
+                if remaining is not None:
+                    remaining -= len(page)
+                yield page
+                if not self.next_link:
+                    break
+                data = future.result() if future else self._next_page()
+        finally:
+            if executor:
+                executor.shutdown(wait=False)
+
+
+class AsyncPageIterator(PageIterator):
+    """
+    Lazily iterates over the instances of a paged collection from an asynchronous API endpoint
+
+    Example:
+        async for page in paging.AsyncPageIterator(api_instance, 'users', user.User.from_api).pages():
+            ...
+    """
+
+    def __iter__(self):
+        raise TypeError('%s must be iterated using "async for"' % self.__class__.__name__)
+
+    async def __aiter__(self):
+        async for page in self.pages():
+            for instance in page:
+                yield instance
+
+    async def pages(self):
+        """
+        Iterates over the pages of the collection
+
+        Returns:
+            async_generator:  A list of instances for each page of the collection
+        """
+        remaining = self.max_items
+        task = None
+        try:
+            data = await self._first_page()
+            while True:
+                rows = self._advance(data, remaining)
+                task = None
+                if self.prefetch and self.next_link:
+                    task = asyncio.ensure_future(self._next_page())
+                page = [self.factory(row) for row in rows]
+                if remaining is not None:
+                    remaining -= len(page)
+                yield page
+                if not self.next_link:
+                    break
+                data = await (task if task else self._next_page())
+                task = None
+        finally:
+            if task and not task.done():
+                task.cancel()
+
+
+def paginate(api, uri, factory, **kwargs):
+    """
+    Fetches a paged collection from the API endpoint
+
+    Parameters:
+        api (msgraph.api.GraphAPI):  The endpoint from which to fetch data
+        uri (str):  The endpoint of the collection
+        factory (callable):  Builds an instance from each row of the collection
+
+    Keyword Arguments:
+        params (dict):  The query parameters of the first page
+        version (str):  The version of the API to use, default: v1.0
+        max_items (int):  The maximum number of instances to fetch, default: None
+        prefetch (bool):  Request the next page in the background while the current page is processed, default: False
+        as_list (bool):  Fetch every page up front and return a list, default: False
+
+    Returns:
+        (PageIterator|list):  The lazily fetched instances, or a list of instances if as_list is True
+    """
+    as_list = kwargs.pop('as_list', False)
+    iterator = PageIterator(api, uri, factory, **kwargs)
+    if as_list:
+        return list(iterator)
+    return iterator
@@ -0,0 +1,160 @@
+import collections
+import threading
+import time
+import weakref
+
+
+class PathEntry(object):
+    """
+    The ID of the item found at a path of a drive
+
+    Attributes:
+        id (str):  The ID of the item
+        expires_at (float):  The time (in seconds since the epoch) after which the entry must be revalidated
+    """
+    __slots__ = ('id', 'expires_at')
+
+    def __init__(self, id, expires_at):
+        self.id = id
+        self.expires_at = expires_at
+
+    def __repr__(self):
+        return '<%s %s id=%r, expires_at=%r>' % (self.__class__.__name__, id(self), self.id, self.expires_at)
+
+    def expired(self):
+        """
+        Returns:
+            bool:  True once the entry must be revalidated before it is used
+        """
+        return time.time() >= self.expires_at
+
+
+class PathCache(object):
+    """
+    Remembers the IDs of the items found at the paths of a drive
+
+    Entries are trusted for ttl seconds, after which they are revalidated by
+    fetching the name and parent of the item by its ID.  Paths are compared
+    case-insensitively, as they are by the API endpoint.  Moving or deleting an item through msgraph.files.DriveItem
+    forgets the paths of the item and of everything under it.
+
+    Attributes:
+        ttl (float):  The number of seconds an entry is used without being revalidated
+        max_entries (int):  The maximum number of paths remembered, the least recently used are forgotten first
+    """
+    _registry = dict()
+    _instances = weakref.WeakKeyDictionary()
+    _registry_lock = threading.Lock()
+
+    def __init__(self, ttl=300.0, max_entries=10000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return '<%s %s ttl=%r, entries=%i>' % (self.__class__.__name__, id(self), self.ttl, len(self._entries))
+
+    @classmethod
+    def for_drive(cls, api, drive):
+        """
+        Fetches the cache shared by every caller using a drive of a tenant
+
+        The drive of the signed-in user (me/drive) differs with each access token, so
+        its cache is only shared by the callers of the same API instance.
+
+        Parameters:
+            api (msgraph.api.GraphAPI):  The endpoint through which the drive is used
+            drive (str):  The endpoint of the drive relative to the API version, such as drives/{drive-id}
+
+        Returns:
+            PathCache:  The cache of the drive
+        """
+        with cls._registry_lock:
+            if drive.split('/', 1)[0] == 'me':
+                registry = cls._instances.setdefault(api, dict())
+                key = drive
+            else:
+                registry = cls._registry
+                key = (api.tenant, api.resource_uri, drive)
+            cache = registry.get(key)
+            if cache is None:
+                cache = registry[key] = cls()
+            return cache
+
+    @staticmethod
+    def normalize(path):
+        """
+        Builds the key under which a path is remembered
+
+        Parameters:
+            path (str):  The path of an item, relative to the root of the drive
+
+        Returns:
+            str:  The lower case path, without leading, trailing or repeated slashes
+        """
+        return '/'.join(name for name in path.lower().split('/') if name)
+
+    def get(self, path):
+        """
+        Fetches the entry of a path, whether or not it has expired
+
+        Parameters:
+            path (str):  The path of the item, relative to the root of the drive
+
+        Returns:
+            PathEntry|None:  The entry of the path, None if the path is not remembered
+        """
+        key = self.normalize(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, path, id):
+        """
+        Remembers the ID of the item at a path
+
+        Parameters:
+            path (str):  The path of the item, relative to the root of the drive
+            id (str):  The ID of the item
+        """
+        key = self.normalize(path)
+        with self._lock:
+            self._entries[key] = PathEntry(id, time.time() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, path):
+        """
+        Forgets a path, and every path under it
+
+        Parameters:
+            path (str):  The path of the item, relative to the root of the drive
+        """
+        key = self.normalize(path)
+        prefix = key + '/'
+        with self._lock:
+            for cached in [cached for cached in self._entries if cached == key or cached.startswith(prefix) or not key]:
+                del self._entries[cached]
+
+    def invalidate_item(self, id):
+        """
+        Forgets the paths of an item, and every path under them
+
+        Parameters:
+            id (str):  The ID of the item
+        """
+        with self._lock:
+            paths = [cached for cached, entry in self._entries.items() if entry.id == id]
+        for path in paths:
+            self.invalidate(path)
+
+    def clear(self):
+        """
+        Forgets every path
+        """
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,270 @@
+import asyncio
+import logging
+import threading
+import time
+from urllib.parse import urlparse
+
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket(object):
+    """
+    Paces requests to a steady rate, allowing short bursts
+
+    The bucket holds up to capacity tokens and is refilled at rate tokens per
+    second.  Each request takes a token, reserving it ahead of time when the bucket
+    is empty: the caller is told how long to wait for its token, so threads and
+    asyncio tasks share a single bucket.  Once slowed down, the rate recovers
+    linearly to its limit over recovery seconds.
+
+    Attributes:
+        limit (float):  The number of requests per second once recovered
+        capacity (float):  The number of requests which can be sent in a burst
+        recovery (float):  The number of seconds the rate takes to recover from being slowed down
+    """
+
+    def __init__(self, limit, capacity=None, recovery=30.0):
+        self.limit = float(limit)
+        self.capacity = float(capacity if capacity is not None else max(1.0, limit))
+        self.recovery = recovery
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._slowed_rate = self.limit
+        self._slowed_at = None
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return '<%s %s limit=%r, rate=%.2f, tokens=%.1f>' % (self.__class__.__name__, id(self), self.limit, self.rate(), self._tokens)
+
+    def rate(self, now=None):
+        """
+        Returns:
+            float:  The number of requests per second currently allowed
+        """
+        if self._slowed_at is None:
+            return self.limit
+        now = time.monotonic() if now is None else now
+        progress = min(1.0, (now - self._slowed_at) / self.recovery) if self.recovery else 1.0
+        return self._slowed_rate + (self.limit - self._slowed_rate) * progress
+
+    def reserve(self, tokens=1.0):
+        """
+        Takes tokens from the bucket, reserving those which are not available yet
+
+        Parameters:
+            tokens (float):  The number of tokens to take
+
+        Returns:
+            float:  The number of seconds the caller must wait before sending its requests
+        """
+        with self._lock:
+            now = time.monotonic()
+            rate = self.rate(now)
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * rate)
+            self._updated_at = now
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / rate
+
+    def slow_down(self, factor=0.5, minimum=1.0):
+        """
+        Reduces the rate after the API endpoint throttled a request
+
+        Parameters:
+            factor (float):  The fraction of the current rate to keep
+            minimum (float):  The lowest rate, in requests per second
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._slowed_rate = max(min(minimum, self.limit), self.rate(now) * factor)
+            self._slowed_at = now
+            self._tokens = min(self._tokens, 0.0)
+
+
+class RateLimiter(object):
+    """
+    Paces the requests to the API endpoint below its throttling limits, with a TokenBucket per endpoint family
+
+    The family of a request is the first segment of its path (users, groups, sites,
+    bookingBusinesses under solutions, and so on), except that every request to a
+    drive (such as users/{id}/drive/root/children) belongs to the drives family.  A
+    JSON batch takes a token from the family of each of its requests.  Families
+    without a rate in rates are paced to default_rate, or not at all when
+    default_rate is None.
+
+    With adaptive enabled, a throttled response halves the rate of its family,
+    which then recovers to its limit over recovery seconds.  The Retry-After of
+    throttled responses remains enforced by msgraph.retry.RetryScheduler.
+
+    A limiter is safe to share between threads and asyncio tasks, and
+    RateLimiter.for_tenant shares one between every GraphAPI of a tenant.
+
+    Attributes:
+        rates (dict):  The number of requests per second allowed for each family
+        default_rate (float):  The number of requests per second allowed for other families, None for no limit
+        burst (float):  The number of seconds of requests which can be sent in a burst
+        adaptive (bool):  Slow a family down when its requests are throttled
+        recovery (float):  The number of seconds a family takes to recover from being slowed down
+
+    Example:
+        from msgraph import api, ratelimit
+
+        limiter = ratelimit.RateLimiter.for_tenant(tenant, rates=dict(users=200, sites=50, drives=50, bookingBusinesses=5), default_rate=100)
+        api_instance = api.GraphAPI.from_certificate(authority_host_uri, tenant, resource_uri, client_id, client_certificate, client_thumbprint, rate_limiter=limiter)
+    """
+    _registry = dict()
+    _registry_lock = threading.Lock()
+    drive_segments = ('drive', 'drives')
+    container_segments = ('solutions', 'admin', 'education', 'communications', 'security')
+
+    def __init__(self, rates=None, default_rate=None, burst=1.0, adaptive=True, recovery=30.0):
+        self.rates = dict(rates or dict())
+        self.default_rate = default_rate
+        self.burst = burst
+        self.adaptive = adaptive
+        self.recovery = recovery
+        self._buckets = dict()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return '<%s %s rates=%r, default_rate=%r>' % (self.__class__.__name__, id(self), self.rates, self.default_rate)
+
+    @classmethod
+    def for_tenant(cls, tenant, **kwargs):
+        """
+        Fetches the limiter shared by every GraphAPI instance of a tenant, creating it with the given keyword arguments
+
+        The limiter is configured by the first call for the tenant.  Later calls
+        fetch it without keyword arguments, or with the same keyword arguments.
+
+        Parameters:
+            tenant (str): The tenant ID of the instance
+
+        Returns:
+            RateLimiter:  The limiter of the tenant
+
+        Raises:
+            ValueError:  The limiter of the tenant was created with other keyword arguments
+        """
+        with cls._registry_lock:
+            entry = cls._registry.get(tenant)
+            if entry is None:
+                entry = cls._registry[tenant] = (cls(**kwargs), kwargs)
+            limiter, configuration = entry
+            if kwargs and kwargs != configuration:
+                raise ValueError('The rate limiter of tenant %r was created with %r, not %r' % (tenant, configuration, kwargs))
+            return limiter
+
+    @classmethod
+    def family(cls, url):
+        """
+        Finds the endpoint family of a request
+
+        Parameters:
+            url (str):  The URL of the request, absolute or relative to the API version
+
+        Returns:
+            str:  The family, such as users, sites, drives or bookingBusinesses
+        """
+        segments = [segment for segment in urlparse(url).path.split('/') if segment]
+        if segments and segments[0] in ('v1.0', 'beta'):
+            segments = segments[1:]
+        elif segments and segments[0] == '_api':
+            segments = segments[2:]
+        for segment in segments:
+            if segment.split(':', 1)[0] in cls.drive_segments:
+                return 'drives'
+        while len(segments) > 1 and segments[0] in cls.container_segments:
+            segments = segments[1:]
+        if not segments:
+            return ''
+        family = segments[0].split('(', 1)[0].split(':', 1)[0]
+        return 'users' if family == 'me' else family
+
+    def bucket(self, family):
+        """
+        Fetches the bucket pacing a family
+
+        Parameters:
+            family (str):  The endpoint family
+
+        Returns:
+            TokenBucket|None:  The bucket of the family, None if the family is not paced
+        """
+        bucket = self._buckets.get(family)
+        if bucket is not None:
+            return bucket
+        rate = self.rates.get(family, self.default_rate)
+        if rate is None:
+            return None
+        with self._lock:
+            bucket = self._buckets.get(family)
+            if bucket is None:
+                bucket = self._buckets[family] = TokenBucket(rate, capacity=max(1.0, rate * self.burst), recovery=self.recovery)
+            return bucket
+
+    def reserve(self, url, body=None):
+        """
+        Takes a token for a request, or for each request of a JSON batch
+
+        Parameters:
+            url (str):  The URL of the request
+            body (object, optional):  The JSON payload of the request
+
+        Returns:
+            float:  The number of seconds to wait before sending the request
+        """
+        if isinstance(body, dict) and isinstance(body.get('requests'), list) and url.rstrip('/').endswith('$batch'):
+            counts = dict()
+            for request in body['requests']:
+                family = self.family(request.get('url', ''))
+                counts[family] = counts.get(family, 0) + 1
+        else:
+            counts = {self.family(url): 1}
+        delay = 0.0
+        for family, count in counts.items():
+            bucket = self.bucket(family)
+            if bucket is not None:
+                delay = max(delay, bucket.reserve(count))
+        return delay
+
+    def wait(self, url, body=None):
+        """
+        Blocks until a request may be sent
+
+        Parameters:
+            url (str):  The URL of the request
+            body (object, optional):  The JSON payload of the request
+        """
+        delay = self.reserve(url, body)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def wait_async(self, url, body=None):
+        """
+        Waits, without blocking the event loop, until a request may be sent
+
+        Parameters:
+            url (str):  The URL of the request
+            body (object, optional):  The JSON payload of the request
+        """
+        delay = self.reserve(url, body)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def throttled(self, url):
+        """
+        Records that the API endpoint throttled a request, slowing down its family when adaptive
+
+        Parameters:
+            url (str):  The URL of the request
+        """
+        if not self.adaptive:
+            return
+        family = self.family(url)
+        bucket = self.bucket(family)
+        if bucket is not None:
+            bucket.slow_down()
+            logger.warning('Requests to %s were throttled, slowing down to %.2f requests per second', family or 'the API endpoint', bucket.rate())
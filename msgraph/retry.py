@@ -0,0 +1,275 @@
+import email.utils
+import logging
+import random
+import threading
+import time
+
+
+logger = logging.getLogger(__name__)
+
+
+class RetryPolicy(object):
+    """
+    Describes how requests receiving a given HTTP status code are retried
+
+    The delay before each retry grows exponentially with the number of attempts,
+    is randomized by the jitter, and is never shorter than the Retry-After header
+    of the response when respect_retry_after is enabled.
+
+    Attributes:
+        max_retries (int):  The maximum number of times a request is retried
+        backoff_factor (float):  The delay (in seconds) before the first retry
+        max_backoff (float):  The upper bound (in seconds) of the computed delay
+        jitter (float):  The fraction of the delay which is randomized, between 0 and 1
+        respect_retry_after (bool):  Wait at least as long as the Retry-After header of the response
+        throttle (bool):  Indicates the status code denotes throttling, which defers every request to the tenant
+        methods (tuple):  The HTTP methods of the requests which are retried, None to retry every method
+    """
+    __slots__ = ('max_retries', 'backoff_factor', 'max_backoff', 'jitter', 'respect_retry_after', 'throttle', 'methods')
+    idempotent_methods = ('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE')
+
+    def __init__(self, max_retries=5, backoff_factor=1.0, max_backoff=60.0, jitter=0.5, respect_retry_after=True, throttle=False, methods=None):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.respect_retry_after = respect_retry_after
+        self.throttle = throttle
+        self.methods = methods
+
+    def allows(self, method):
+        """
+        Indicates if requests with an HTTP method are retried
+
+        Parameters:
+            method (str):  The HTTP method of the request, None if unknown
+
+        Returns:
+            bool:  True if the request may be retried
+        """
+        return self.methods is None or method is None or method.upper() in self.methods
+
+    def __repr__(self):
+        return '<%s %s max_retries=%r, backoff_factor=%r, max_backoff=%r, jitter=%r>' % (self.__class__.__name__, id(self), self.max_retries, self.backoff_factor, self.max_backoff, self.jitter)
+
+    def delay(self, attempt, retry_after=None):
+        """
+        Computes the time to wait before retrying a request
+
+        Parameters:
+            attempt (int):  The number of times the request has already been retried
+            retry_after (float, optional):  The delay requested by the Retry-After header of the response
+
+        Returns:
+            float:  The number of seconds to wait before retrying the request
+        """
+        backoff = min(self.max_backoff, self.backoff_factor * (2 ** attempt))
+        backoff -= backoff * self.jitter * random.random()
+        if self.respect_retry_after and retry_after is not None:
+            backoff = max(backoff, retry_after)
+        return backoff
+
+
+class RetryBudget(object):
+    """
+    Limits the number of retries to a fraction of the requests made
+
+    Every request deposits `ratio` tokens into the budget (up to `capacity`) and
+    every retry withdraws one, so a sustained outage cannot multiply the load sent
+    to the API endpoint.
+
+    Attributes:
+        ratio (float):  The number of retries earned by each request
+        capacity (float):  The maximum number of retries which can be saved up
+    """
+
+    def __init__(self, ratio=0.2, capacity=100.0, initial=10.0):
+        self.ratio = ratio
+        self.capacity = capacity
+        self._tokens = min(initial, capacity)
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return '<%s %s ratio=%r, capacity=%r, tokens=%.1f>' % (self.__class__.__name__, id(self), self.ratio, self.capacity, self._tokens)
+
+    def deposit(self):
+        """
+        Records a request made to the API endpoint
+        """
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + self.ratio)
+
+    def withdraw(self):
+        """
+        Attempts to spend a retry from the budget
+
+        Returns:
+            bool:  True if the retry is allowed, False if the budget is exhausted
+        """
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+class BackoffGate(object):
+    """
+    A deadline shared by every request to a tenant, before which no request is sent
+
+    Once a request is throttled the gate is closed until its Retry-After delay
+    elapses, so concurrent callers wait instead of adding to the throttling.
+    """
+    _registry = dict()
+    _registry_lock = threading.Lock()
+
+    def __init__(self):
+        self._until = 0.0
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return '<%s %s remaining=%.2f>' % (self.__class__.__name__, id(self), self.remaining())
+
+    @classmethod
+    def for_tenant(cls, tenant):
+        """
+        Fetches the gate shared by every GraphAPI instance of a tenant
+
+        Parameters:
+            tenant (str): The tenant ID of the instance
+
+        Returns:
+            BackoffGate:  The gate of the tenant
+        """
+        with cls._registry_lock:
+            gate = cls._registry.get(tenant)
+            if gate is None:
+                gate = cls._registry[tenant] = cls()
+            return gate
+
+    def remaining(self):
+        """
+        Returns:
+            float:  The number of seconds until the gate opens
+        """
+        return max(0.0, self._until - time.time())
+
+    def defer(self, seconds):
+        """
+        Closes the gate for at least the given number of seconds
+
+        Parameters:
+            seconds (float):  The minimum time to keep the gate closed
+        """
+        with self._lock:
+            self._until = max(self._until, time.time() + seconds)
+
+    def wait(self):
+        """
+        Blocks until the gate is open
+        """
+        remaining = self.remaining()
+        while remaining > 0:
+            time.sleep(remaining)
+            remaining = self.remaining()
+
+
+class RetryScheduler(object):
+    """
+    Decides if and when a request to the API endpoint is retried
+
+    Attributes:
+        policies (dict):  RetryPolicy instances keyed by the HTTP status code they apply to
+        budget (RetryBudget):  The budget limiting the number of retries, None for no limit
+        gate (BackoffGate):  The gate shared by the requests to a tenant, None to not share throttling
+    """
+
+    def __init__(self, policies=None, budget=None, gate=None):
+        if policies is None:
+            policies = self.default_policies()
+        self.policies = policies
+        self.budget = budget
+        self.gate = gate
+
+    def __repr__(self):
+        return '<%s %s statuses=%r, budget=%r, gate=%r>' % (self.__class__.__name__, id(self), sorted(self.policies), self.budget, self.gate)
+
+    @staticmethod
+    def default_policies():
+        """
+        The retry policies recommended by the Microsoft Graph throttling guidance
+
+        Throttled requests (429 and 503) were not processed, so they are retried
+        whatever their method.  A request which timed out at the gateway (504) may
+        already have been applied, so only idempotent requests are retried.
+
+        For more information see: https://docs.microsoft.com/en-us/graph/throttling
+
+        Returns:
+            dict:  RetryPolicy instances keyed by HTTP status code
+        """
+        return {
+            429: RetryPolicy(max_retries=8, backoff_factor=2.0, throttle=True),
+            503: RetryPolicy(max_retries=5, backoff_factor=2.0, throttle=True),
+            504: RetryPolicy(max_retries=3, backoff_factor=1.0, methods=RetryPolicy.idempotent_methods)
+        }
+
+    @staticmethod
+    def parse_retry_after(value):
+        """
+        Parses the value of a Retry-After header
+
+        Parameters:
+            value (str):  Either a number of seconds, or an HTTP date
+
+        Returns:
+            float|None:  The number of seconds to wait, None if the value could not be parsed
+        """
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        parsed = email.utils.parsedate_tz(value)
+        if parsed is None:
+            return None
+        return max(0.0, email.utils.mktime_tz(parsed) - time.time())
+
+    def before_request(self):
+        """
+        Waits for the shared gate and records the request in the budget
+        """
+        if self.gate:
+            self.gate.wait()
+        if self.budget:
+            self.budget.deposit()
+
+    def delay(self, status, headers, attempt, method=None):
+        """
+        Computes the delay before retrying a response
+
+        Parameters:
+            status (int):  The HTTP status code of the response
+            headers (dict):  The headers of the response
+            attempt (int):  The number of times the request has already been retried
+            method (str, optional):  The HTTP method of the request, which the policy of the status code may not retry
+
+        Returns:
+            float|None:  The number of seconds to wait before retrying, None if the request should not be retried
+        """
+        policy = self.policies.get(status)
+        if policy is None or attempt >= policy.max_retries or not policy.allows(method):
+            return None
+        if self.budget and not self.budget.withdraw():
+            logger.warning('Retry budget exhausted, not retrying %s response', status)
+            return None
+        retry_after = None
+        for key, value in (headers or dict()).items():
+            if key.lower() == 'retry-after':
+                retry_after = self.parse_retry_after(value)
+                break
+        seconds = policy.delay(attempt, retry_after)
+        if policy.throttle and self.gate:
+            self.gate.defer(seconds)
+        return seconds
@@ -1,5 +1,5 @@
 import logging
-from msgraph import base
+from msgraph import aio, base, batch, paging
 
 
 logger = logging.getLogger(__name__)
@@ -7,6 +7,19 @@ logger = logging.getLogger(__name__)
 
 class Site(base.Base):
     __slots__ = ('id', 'name', 'display_name', 'description', 'etag', 'root', 'sharepoint_ids', 'site_collection', 'web_url', 'created_datetime', 'last_modified_datetime')
+    api_fields = {
+        'id': ('id', None),
+        'name': ('name', None),
+        'display_name': ('displayName', None),
+        'description': ('description', None),
+        'etag': ('eTag', None),
+        'root': ('root', None),
+        'sharepoint_ids': ('sharepointIds', None),
+        'site_collection': ('siteCollection', None),
+        'web_url': ('webUrl', None),
+        'created_datetime': ('createdDateTime', None),
+        'last_modified_datetime': ('lastModifiedDateTime', None)
+    }
 
     def __init__(self, id, name, display_name, description, etag, root, sharepoint_ids, site_collection, web_url, created_datetime, last_modified_datetime):
         self.id = id
@@ -36,38 +49,47 @@ class Site(base.Base):
 
         Keyword Arguments:
             page_size (int):  The number of items to include in each page, default: 100
+            fields (list):  The attributes (or Graph properties) to fetch, default: every attribute
+            max_items (int):  The maximum number of instances to fetch, default: None
+            prefetch (bool):  Request the next page in the background while the current page is processed, default: False
+            as_list (bool):  Fetch every page up front and return a list, default: False
+            lazy (bool):  Decode the attributes of each instance on first access, default: False
 
         Returns:
-            list: Site instances
+            (PageIterator|list): Site instances, fetched lazily unless as_list is True
         """
+        cls = self.__class__
         uri = 'sites/%s/sites' % self.id
-        params = {
+        params = cls.select_params({
             '$top': kwargs.get('page_size', 100)
-        }
-        cls = self.__class__
-        data = api.request(uri, params=params)
-        output = [cls.from_api(row) for row in data.get('value', [])]
-        while data.get("@odata.nextLink"):
-            uri = data.get("@odata.nextLink")
-            data = api.request(uri)
-            output += [cls.from_api(row) for row in data.get('value', [])]
-        return output
+        }, **kwargs)
+        return paging.paginate(api, uri, cls.factory(**kwargs), params=params, **kwargs)
 
     @classmethod
     def from_api(cls, data):
-        id = data['id']
-        name = data['name']
-        display_name = data['displayName']
+        id = data.get('id')
+        name = data.get('name')
+        display_name = data.get('displayName')
         description = data.get('description')
         etag = data.get('eTag')
         root = data.get('root')
         sharepoint_ids = data.get('sharepointIds')
         site_collection = data.get('siteCollection')
-        web_url = data['webUrl']
-        created_datetime = data['createdDateTime']
-        last_modified_datetime = data['lastModifiedDateTime']
+        web_url = data.get('webUrl')
+        created_datetime = data.get('createdDateTime')
+        last_modified_datetime = data.get('lastModifiedDateTime')
         return cls(id, name, display_name, description, etag, root, sharepoint_ids, site_collection, web_url, created_datetime, last_modified_datetime)
 
+    @classmethod
+    def _get_uri(cls, **kwargs):
+        site = kwargs.get('site')
+
+        if site:
+            uri = 'sites/%s' % site
+        else:
+            uri = 'sites/root'
+        return uri
+
     @classmethod
     def get(cls, api, **kwargs):
         """
@@ -81,21 +103,38 @@ class Site(base.Base):
         Keyword Arguments:
             site (Site|str):  The number of items to include in each page, default: None
             page_size (int):  The number of items to include in each page, default: 100
+            fields (list):  The attributes (or Graph properties) to fetch, default: every attribute
 
         Returns:
             Site: instance of the requested site
         """
-        site = kwargs.get('site')
+        uri = cls._get_uri(**kwargs)
+        data = api.request(uri, params=cls.select_params(**kwargs))
+        return cls.from_api(data)
 
-        if site:
-            uri = 'sites/%s' % site
-        else:
-            uri = 'sites/root'
-        data = api.request(uri)
+    @classmethod
+    async def get_async(cls, api, **kwargs):
+        """
+        Fetches a given Site by id of the site from an asynchronous API endpoint
+
+        If a site id is not provided, the root SharePoint site within the tenant will be fetched
+
+        Parameters:
+            api (msgraph.aio.AsyncGraphAPI):  The endpoint from which to fetch data
+
+        Keyword Arguments:
+            site (Site|str):  The site (or site ID) to fetch, default: None
+            fields (list):  The attributes (or Graph properties) to fetch, default: every attribute
+
+        Returns:
+            Site: instance of the requested site
+        """
+        uri = cls._get_uri(**kwargs)
+        data = await api.request(uri, params=cls.select_params(**kwargs))
         return cls.from_api(data)
 
     @classmethod
-    def by_group(cls, api, group):
+    def by_group(cls, api, group, **kwargs):
         """
         Fetches the team SharePoint site for a given group from the Microsoft Graph instance
 
@@ -103,15 +142,18 @@ class Site(base.Base):
             api (msgraph.api.GraphAPI):  The endpoint from which to fetch data
             group (Group|str): The group (or group ID) whose site is being fetched
 
+        Keyword Arguments:
+            fields (list):  The attributes (or Graph properties) to fetch, default: every attribute
+
         Returns:
             Site: team site for the given group
         """
         uri = 'groups/%s/sites/root' % group
-        data = api.request(uri)
+        data = api.request(uri, params=cls.select_params(**kwargs))
         return cls.from_api(data)
 
     @classmethod
-    def by_relative_url(cls, api, host_name, path):
+    def by_relative_url(cls, api, host_name, path, **kwargs):
         """
         Fetches a Site instance by the server-relative URL of the site
 
@@ -120,11 +162,14 @@ class Site(base.Base):
             host_name (str): The host name of the site
             path (str):  The server-relative URL of the site
 
+        Keyword Arguments:
+            fields (list):  The attributes (or Graph properties) to fetch, default: every attribute
+
         Returns:
             Site: Site instance specified by the relative URL
         """
         uri = 'sites/%s:/%s' % (host_name, path)
-        data = api.request(uri)
+        data = api.request(uri, params=cls.select_params(**kwargs))
         return cls.from_api(data)
 
     @classmethod
@@ -138,26 +183,38 @@ class Site(base.Base):
 
         Keyword Arguments:
             page_size (int):  The number of items to include in each page, default: 100
+            fields (list):  The attributes (or Graph properties) to fetch, default: every attribute
+            max_items (int):  The maximum number of instances to fetch, default: None
+            prefetch (bool):  Request the next page in the background while the current page is processed, default: False
+            as_list (bool):  Fetch every page up front and return a list, default: False
+            lazy (bool):  Decode the attributes of each instance on first access, default: False
 
         Returns:
-            list: Site instances matching the provided query
+            (PageIterator|list): Site instances matching the provided query, fetched lazily unless as_list is True
         """
-        params = {
+        params = cls.select_params({
             'search': query,
             '$top': kwargs.get('page_size', 100)
-        }
+        }, **kwargs)
         uri = 'sites'
-        data = api.request(uri, params=params)
-        output = [cls.from_api(row) for row in data.get('value', [])]
-        while data.get("@odata.nextLink"):
-            uri = data.get("@odata.nextLink")
-            data = api.request(uri)
-            output += [cls.from_api(row) for row in data.get('value', [])]
-        return output
+        return paging.paginate(api, uri, cls.factory(**kwargs), params=params, **kwargs)
 
 
 class SiteList(base.Base):
     __slots__ = ('id', 'name', 'display_name', 'description', 'list_instance', 'parent_reference', 'web_url', 'created_datetime', 'created_by', 'last_modified_datetime', 'last_modified_by')
+    api_fields = {
+        'id': ('id', None),
+        'name': ('name', None),
+        'display_name': ('displayName', None),
+        'description': ('description', None),
+        'list_instance': ('list', None),
+        'parent_reference': ('parentReference', None),
+        'web_url': ('webUrl', None),
+        'created_datetime': ('createdDateTime', None),
+        'created_by': ('createdBy', None),
+        'last_modified_datetime': ('lastModifiedDateTime', None),
+        'last_modified_by': ('lastModifiedBy', None)
+    }
 
     def __init__(self, id, name, display_name, description, list_instance, parent_reference, web_url, created_datetime, created_by, last_modified_datetime, last_modified_by):
         self.id = id
@@ -180,19 +237,31 @@ class SiteList(base.Base):
 
     @classmethod
     def from_api(cls, data):
-        id = data['id']
-        name = data['name']
-        display_name = data['displayName']
-        description = data['description']
-        list_instance = data['list']
-        parent_reference = data['parentReference']
-        web_url = data['webUrl']
-        created_datetime = data['createdDateTime']
-        created_by = data['createdBy']
-        last_modified_datetime = data['lastModifiedDateTime']
+        id = data.get('id')
+        name = data.get('name')
+        display_name = data.get('displayName')
+        description = data.get('description')
+        list_instance = data.get('list')
+        parent_reference = data.get('parentReference')
+        web_url = data.get('webUrl')
+        created_datetime = data.get('createdDateTime')
+        created_by = data.get('createdBy')
+        last_modified_datetime = data.get('lastModifiedDateTime')
         last_modified_by = data.get('lastModifiedBy')
         return cls(id, name, display_name, description, list_instance, parent_reference, web_url, created_datetime, created_by, last_modified_datetime, last_modified_by)
 
+    @classmethod
+    def _get_request(cls, site, **kwargs):
+        list_instance = kwargs.get('list_instance')
+        uri = 'sites/%s/lists' % site
+        if list_instance:
+            uri += '/%s' % list_instance
+
+        params = cls.select_params({
+            '$top': kwargs.get('page_size', 100)
+        }, **kwargs)
+        return uri, params
+
     @classmethod
     def get(cls, api, site, **kwargs):
         """
@@ -207,28 +276,45 @@ class SiteList(base.Base):
         Keyword Arguments:
             list_instance (List|str): A given SiteList (or list ID) to fetch
             page_size (int):  The number of items to include in each page, default: 100
+            fields (list):  The attributes (or Graph properties) to fetch, default: every attribute
+            max_items (int):  The maximum number of instances to fetch, default: None
+            prefetch (bool):  Request the next page in the background while the current page is processed, default: False
+            as_list (bool):  Fetch every page up front and return a list, default: False
+            lazy (bool):  Decode the attributes of each instance on first access, default: False
 
         Returns:
-            (SiteList|list): If a list_instance is provided, the single SiteList instance, list of all Site lists otherwise
+            (SiteList|PageIterator|list): If a list_instance is provided, the single SiteList instance, otherwise the lists of the Site, fetched lazily unless as_list is True
         """
-        list_instance = kwargs.pop('list_instance', None)
-        uri = 'sites/%s/lists' % site
-        if list_instance:
-            uri += '/%s' % list_instance
+        uri, params = cls._get_request(site, **kwargs)
+        if kwargs.get('list_instance'):
+            data = api.request(uri, params=params)
+            return cls.from_api(data)
+        return paging.paginate(api, uri, cls.factory(**kwargs), params=params, **kwargs)
 
-        params = {
-            '$top': kwargs.get('page_size', 100)
-        }
+    @classmethod
+    async def get_async(cls, api, site, **kwargs):
+        """
+        Fetches lists for a given SharePoint site from an asynchronous API endpoint
 
-        data = api.request(uri, params=params)
-        if list_instance:
+        If a list_instance is provided, only that list will be fetched
+
+        Parameters:
+            api (msgraph.aio.AsyncGraphAPI):  The endpoint from which to fetch data
+            site (Site|str): The SharePoint site (or site ID of the Site) to fetch lists for
+
+        Keyword Arguments:
+            list_instance (List|str): A given SiteList (or list ID) to fetch
+            page_size (int):  The number of items to include in each page, default: 100
+            fields (list):  The attributes (or Graph properties) to fetch, default: every attribute
+
+        Returns:
+            (SiteList|list): If a list_instance is provided, the single SiteList instance, list of all Site lists otherwise
+        """
+        uri, params = cls._get_request(site, **kwargs)
+        if kwargs.get('list_instance'):
+            data = await api.request(uri, params=params)
             return cls.from_api(data)
-        output = [cls.from_api(row) for row in data.get('value', [])]
-        while data.get("@odata.nextLink"):
-            uri = data.get("@odata.nextLink")
-            data = api.request(uri)
-            output += [cls.from_api(row) for row in data.get('value', [])]
-        return output
+        return await aio.collect(api, uri, cls.factory(**kwargs), params=params, **kwargs)
 
     @classmethod
     def create(cls, api, site, display_name, template, columns):
@@ -254,6 +340,19 @@ class SiteList(base.Base):
 
 class ListItem(base.Base):
     __slots__ = ('id', 'etag', 'content_type', 'parent_reference', 'name', 'description', 'fields', 'created_datetime', 'created_by', 'last_modified_datetime', 'last_modified_by', '_dirty_fields')
+    api_fields = {
+        'id': ('id', None),
+        'etag': ('eTag', None),
+        'content_type': ('contentType', None),
+        'parent_reference': ('parentReference', None),
+        'name': ('name', None),
+        'description': ('description', None),
+        'fields': ('fields', None),
+        'created_datetime': ('createdDateTime', None),
+        'created_by': ('createdBy', None),
+        'last_modified_datetime': ('lastModifiedDateTime', None),
+        'last_modified_by': ('lastModifiedBy', None)
+    }
 
     def __init__(self, id, etag, content_type, parent_reference, name, description, fields, created_datetime, created_by, last_modified_datetime, last_modified_by):
         self.id = id
@@ -317,7 +416,7 @@ class ListItem(base.Base):
         Updates the ListItem fields in the Microsoft Graph instance
 
         Parameters:
-            api (msgraph.api.GraphAPI):  The endpoint from which to save data
+            api (msgraph.api.GraphAPI|msgraph.batch.Batch):  The endpoint from which to save data
             site (Site|str): The SharePoint site (or site ID of the Site) the ListItem is associated with
             list_instance (SiteList|str):  The SiteList (or list ID) the ListItem is associated with
 
@@ -329,10 +428,17 @@ class ListItem(base.Base):
             fields = self._dirty_fields
         uri = 'sites/%s/lists/%s/items/%s/fields' % (site, list_instance, self.id)
         data = api.request(uri, json=fields, method='PATCH')
-        self.fields.update(data)
+        if isinstance(data, batch.BatchRequest):
+            data.add_done_callback(self._apply_fields)
+        else:
+            self.fields.update(data)
         self._dirty_fields = dict()
         logger.info('Updated %i fields of %r instance %r', len(fields), self.__class__.__name__, self.name)
 
+    def _apply_fields(self, batch_request):
+        if not batch_request.exception():
+            self.fields.update(batch_request.result())
+
     def delete(self, api, site, list_instance):
         """
         Deletes the ListItem fields from the Microsoft Graph instance
@@ -369,19 +475,25 @@ class ListItem(base.Base):
 
     @classmethod
     def from_api(cls, data):
-        id = data['id']
+        id = data.get('id')
         etag = data.get('eTag')
-        content_type = data.get('content_type')
+        content_type = data.get('contentType')
         parent_reference = data.get('parentReference')
         name = data.get('name')
         description = data.get('description')
-        fields = data['fields']
+        fields = data.get('fields')
         created_datetime = data.get('createdDateTime')
         created_by = data.get('createdBy')
         last_modified_datetime = data.get('lastModifiedDateTime')
         last_modified_by = data.get('lastModifiedBy')
         return cls(id, etag, content_type, parent_reference, name, description, fields, created_datetime, created_by, last_modified_datetime, last_modified_by)
 
+    @classmethod
+    def lazy_from_api(cls, data):
+        instance = super(ListItem, cls).lazy_from_api(data)
+        instance._dirty_fields = dict()
+        return instance
+
     @classmethod
     def get(cls, api, site, site_list, **kwargs):
         """
@@ -392,18 +504,40 @@ class ListItem(base.Base):
             site (Site|str): The SharePoint site (or site ID of the Site) the ListItems are associated with
             list_instance (SiteList|str):  The SiteList (or list ID) the ListItems are associated with
 
+        Keyword Arguments:
+            fields (list):  The attributes (or Graph properties) to fetch, default: every attribute
+            max_items (int):  The maximum number of instances to fetch, default: None
+            prefetch (bool):  Request the next page in the background while the current page is processed, default: False
+            as_list (bool):  Fetch every page up front and return a list, default: False
+            lazy (bool):  Decode the attributes of each instance on first access, default: False
+
+        Returns:
+            (PageIterator|list): The ListItem instances associated with the Site and List, fetched lazily unless as_list is True
+        """
+        uri = 'sites/%s/lists/%s/items' % (site, site_list)
+        params = cls.select_params(dict(expand='fields'), **kwargs)
+        return paging.paginate(api, uri, cls.factory(**kwargs), params=params, **kwargs)
+
+    @classmethod
+    async def get_async(cls, api, site, site_list, **kwargs):
+        """
+        Fetches ListItem instances from an asynchronous API endpoint
+
+        Parameters:
+            api (msgraph.aio.AsyncGraphAPI):  The endpoint from which to fetch data
+            site (Site|str): The SharePoint site (or site ID of the Site) the ListItems are associated with
+            list_instance (SiteList|str):  The SiteList (or list ID) the ListItems are associated with
+
+        Keyword Arguments:
+            fields (list):  The attributes (or Graph properties) to fetch, default: every attribute
+            lazy (bool):  Decode the attributes of each instance on first access, default: False
+
         Returns:
             list: The ListItem instances associated with the Site and List
         """
         uri = 'sites/%s/lists/%s/items' % (site, site_list)
-        params = dict(expand='fields')
-        data = api.request(uri, params=params)
-        output = [cls.from_api(row) for row in data.get('value', [])]
-        while data.get("@odata.nextLink"):
-            uri = data.get("@odata.nextLink")
-            data = api.request(uri)
-            output += [cls.from_api(row) for row in data.get('value', [])]
-        return output
+        params = cls.select_params(dict(expand='fields'), **kwargs)
+        return await aio.collect(api, uri, cls.factory(**kwargs), params=params, **kwargs)
 
     @classmethod
     def create(cls, api, site, list_instance, fields):
@@ -437,8 +571,8 @@ class Analytics(base.Base):
 
     @classmethod
     def from_api(cls, data):
-        all_time = data['allTime']
-        last_seven_days = data['lastSevenDays']
+        all_time = data.get('allTime')
+        last_seven_days = data.get('lastSevenDays')
         return cls(all_time, last_seven_days)
 
     @classmethod
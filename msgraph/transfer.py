@@ -0,0 +1,311 @@
+import logging
+import time
+from concurrent import futures
+from urllib.parse import urlparse
+from msgraph import batch, exception, paths
+
+
+logger = logging.getLogger(__name__)
+
+
+class TransferOperation(object):
+    """
+    A copy or move of a single DriveItem, submitted as part of a BulkTransfer
+
+    Attributes:
+        kind (str):  Either copy or move
+        item (str):  The ID of the item to copy or move
+        parent (str):  The ID of the destination folder
+        name (str):  The new name of the item, None to keep its name
+        drive (str):  The ID of the destination drive, None for the drive of the item
+        status (str):  One of pending, notStarted, inProgress, completed or failed
+        percentage (float):  The progress of the operation reported by the API endpoint, between 0 and 100
+        resource_id (str):  The ID of the copied or moved item, None until the operation completed
+        monitor_url (str):  The URL reporting the progress of a copy, None for moves
+        error (MicrosoftException):  Why the operation failed, None unless it failed
+        polls (int):  The number of times the progress of the operation was requested
+        poll_errors (int):  The number of consecutive polls which failed
+    """
+    __slots__ = ('kind', 'item', 'parent', 'name', 'drive', 'status', 'percentage', 'resource_id', 'monitor_url', 'error', 'polls', 'poll_errors', '_interval', '_poll_at')
+    failed_statuses = ('failed', 'deleteFailed', 'cancelled')
+
+    def __init__(self, kind, item, parent, name=None, drive=None):
+        self.kind = kind
+        self.item = item
+        self.parent = parent
+        self.name = name
+        self.drive = drive
+        self.status = 'pending'
+        self.percentage = 0.0
+        self.resource_id = None
+        self.monitor_url = None
+        self.error = None
+        self.polls = 0
+        self.poll_errors = 0
+        self._interval = None
+        self._poll_at = None
+
+    def __repr__(self):
+        return '<%s %s kind=%r, item=%r, parent=%r, status=%r, percentage=%r>' % (self.__class__.__name__, id(self), self.kind, self.item, self.parent, self.status, self.percentage)
+
+    def done(self):
+        """
+        Returns:
+            bool:  True once the operation completed or failed
+        """
+        return self.status in ('completed', 'failed')
+
+    def _complete(self, resource_id):
+        self.status = 'completed'
+        self.percentage = 100.0
+        self.resource_id = resource_id
+
+    def _fail(self, error):
+        self.status = 'failed'
+        self.error = error
+
+
+class BulkTransfer(object):
+    """
+    Copies and moves many DriveItem instances concurrently, tracking copies until they complete
+
+    Operations are submitted in JSON batches of up to 20 requests, with up to
+    max_workers batches in flight at a time.  Moves complete with their batch, while
+    copies run in the background of the API endpoint and are followed through the
+    monitor URL returned for each copy.  Each monitor is polled every
+    initial_interval seconds, an interval which doubles (up to max_interval) each
+    time the copy has not progressed and halves again once it does.  A poll which
+    fails is retried on the same schedule, as the copy keeps running on the server:
+    a copy only fails after max_poll_errors consecutive polls failed, or once the
+    monitor reports that it failed.
+
+    For more information see: https://docs.microsoft.com/en-us/graph/api/driveitem-copy
+
+    Attributes:
+        api (msgraph.api.GraphAPI):  The endpoint to which operations are submitted
+        drive_uri (str):  The endpoint of the drive of the items, such as drives/{drive-id}
+        max_workers (int):  The maximum number of batches submitted, or monitors polled, concurrently
+        initial_interval (float):  The number of seconds before a copy is first polled
+        max_interval (float):  The longest number of seconds between two polls of a copy
+        max_poll_errors (int):  The number of consecutive polls of a copy which may fail before the copy is failed
+        conflict_behavior (str):  What to do if a copy already exists at the destination, one of fail, replace or rename, None for the default of the API
+        operations (list):  The TransferOperation of each submitted copy or move
+        elapsed (float):  The number of seconds spent executing the operations
+
+    Example:
+        from msgraph import files
+
+        transfer = files.DriveItem.transfer(api_instance, drive=drive_id)
+        for item in items:
+            transfer.copy(item.id, archive_folder_id)
+        transfer.move(report_id, reports_folder_id, name='2020 summary.xlsx')
+        transfer.execute(progress=lambda transfer: print(transfer.percentage))
+        for operation in transfer.failed():
+            print(operation.item, operation.error)
+    """
+
+    def __init__(self, api, drive_uri, **kwargs):
+        self.api = api
+        self.drive_uri = drive_uri
+        self.max_workers = kwargs.get('max_workers', 4)
+        self.initial_interval = kwargs.get('initial_interval', 1.0)
+        self.max_interval = kwargs.get('max_interval', 30.0)
+        self.max_poll_errors = kwargs.get('max_poll_errors', 5)
+        self.conflict_behavior = kwargs.get('conflict_behavior')
+        self.path_cache = kwargs.get('path_cache', paths.PathCache.for_drive(api, drive_uri))
+        self.operations = []
+        self.elapsed = 0.0
+
+    def __repr__(self):
+        return '<%s %s drive_uri=%r, operations=%i, completed=%i, failed=%i>' % (self.__class__.__name__, id(self), self.drive_uri, len(self.operations), len(self.completed()), len(self.failed()))
+
+    @property
+    def percentage(self):
+        """
+        Returns:
+            float:  The average progress of the operations, between 0 and 100
+        """
+        if not self.operations:
+            return 100.0
+        return sum(100.0 if operation.done() else operation.percentage for operation in self.operations) / len(self.operations)
+
+    def completed(self):
+        """
+        Returns:
+            list:  The TransferOperation instances which completed successfully
+        """
+        return [operation for operation in self.operations if operation.status == 'completed']
+
+    def failed(self):
+        """
+        Returns:
+            list:  The TransferOperation instances which failed
+        """
+        return [operation for operation in self.operations if operation.status == 'failed']
+
+    def pending(self):
+        """
+        Returns:
+            list:  The TransferOperation instances which have not completed or failed yet
+        """
+        return [operation for operation in self.operations if not operation.done()]
+
+    def copy(self, item, parent, name=None, drive=None):
+        """
+        Queues a copy of an item
+
+        Parameters:
+            item (str):  The ID of the item to copy
+            parent (str):  The ID of the destination folder
+            name (str, optional):  The name of the copy, default: the name of the item
+            drive (str, optional):  The ID of the destination drive, default: the drive of the item
+
+        Returns:
+            TransferOperation:  The queued operation
+        """
+        operation = TransferOperation('copy', str(item), str(parent), name, drive)
+        self.operations.append(operation)
+        return operation
+
+    def move(self, item, parent, name=None):
+        """
+        Queues a move of an item to another folder of its drive
+
+        Parameters:
+            item (str):  The ID of the item to move
+            parent (str):  The ID of the destination folder
+            name (str, optional):  The new name of the item, default: the name of the item
+
+        Returns:
+            TransferOperation:  The queued operation
+        """
+        operation = TransferOperation('move', str(item), str(parent), name)
+        self.operations.append(operation)
+        return operation
+
+    def execute(self, progress=None, wait=True):
+        """
+        Submits the queued operations, then polls the copies until they complete
+
+        Parameters:
+            progress (callable, optional):  Called with this BulkTransfer after each batch is submitted, and after each round of polling
+            wait (bool):  Poll the copies until every operation completed or failed, default: True
+
+        Returns:
+            BulkTransfer:  This transfer, summarizing the result of every operation
+        """
+        started_at = time.time()
+        queued = [operation for operation in self.operations if operation.status == 'pending']
+        chunks = [queued[start:start + batch.Batch.limit] for start in range(0, len(queued), batch.Batch.limit)]
+        with futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for _ in executor.map(self._submit, chunks):
+                if progress:
+                    progress(self)
+            if wait:
+                self._wait(executor, progress)
+        self.elapsed += time.time() - started_at
+        logger.info('Transferred %i items in %.2f seconds, %i failed, %i pending', len(self.completed()), self.elapsed, len(self.failed()), len(self.pending()))
+        return self
+
+    def poll(self):
+        """
+        Requests the progress of every copy which is still running, once
+
+        Returns:
+            list:  The TransferOperation instances which are still running
+        """
+        running = [operation for operation in self.operations if operation.monitor_url and not operation.done()]
+        for operation in running:
+            self._poll(operation)
+        return [operation for operation in running if not operation.done()]
+
+    def _submit(self, operations):
+        requests = []
+        with batch.Batch(self.api) as queue:
+            for operation in operations:
+                requests.append((operation, self._queue(queue, operation)))
+        for operation, batch_request in requests:
+            error = batch_request.exception()
+            if error:
+                logger.warning('Failed to %s %r: %s', operation.kind, operation.item, error)
+                operation._fail(error)
+            elif operation.kind == 'move':
+                if self.path_cache is not None:
+                    self.path_cache.invalidate_item(operation.item)
+                operation._complete((batch_request.result() or dict()).get('id', operation.item))
+            else:
+                headers = dict((key.lower(), value) for key, value in (batch_request.response_headers or dict()).items())
+                operation.monitor_url = headers.get('location')
+                operation.status = 'notStarted'
+                operation._interval = self.initial_interval
+                operation._poll_at = time.time() + self.initial_interval
+                if not operation.monitor_url:
+                    operation._fail(exception.MicrosoftException(batch_request.status, 'No monitor URL was returned for the copy of %s' % operation.item))
+
+    def _queue(self, queue, operation):
+        uri = '%s/items/%s' % (self.drive_uri, operation.item)
+        parent_reference = dict(id=operation.parent)
+        if operation.drive:
+            parent_reference['driveId'] = operation.drive
+        body = dict(parentReference=parent_reference)
+        if operation.name:
+            body['name'] = operation.name
+        if operation.kind == 'move':
+            return queue.request(uri, json=body, method='PATCH')
+        params = None
+        if self.conflict_behavior:
+            params = {'@microsoft.graph.conflictBehavior': self.conflict_behavior}
+        return queue.request(uri + '/copy', json=body, method='POST', params=params)
+
+    def _wait(self, executor, progress):
+        while True:
+            running = [operation for operation in self.operations if operation.monitor_url and not operation.done()]
+            if not running:
+                return
+            now = time.time()
+            due = [operation for operation in running if operation._poll_at <= now]
+            if due:
+                list(executor.map(self._poll, due))
+                if progress:
+                    progress(self)
+                continue
+            time.sleep(max(0.0, min(operation._poll_at for operation in running) - now))
+
+    def _poll(self, operation):
+        operation.polls += 1
+        previous = operation.percentage
+        try:
+            response = self.api.request(operation.monitor_url, authenticate=False, allow_redirects=False, stream=True)
+            with response:
+                if response.status_code in (302, 303):
+                    resource_id = urlparse(response.headers.get('Location', '')).path.rstrip('/').rpartition('/')[2]
+                    data = dict(status='completed', resourceId=resource_id or None)
+                else:
+                    data = response.json()
+        except (exception.MicrosoftException, ValueError) as e:
+            operation.poll_errors += 1
+            if operation.poll_errors >= self.max_poll_errors:
+                logger.error('Failed to poll the copy of %r %i times, giving up: %s', operation.item, operation.poll_errors, e)
+                operation._fail(e)
+                return
+            operation._interval = min(self.max_interval, operation._interval * 2)
+            operation._poll_at = time.time() + operation._interval
+            logger.warning('Failed to poll the copy of %r, polling again in %.1f seconds: %s', operation.item, operation._interval, e)
+            return
+        operation.poll_errors = 0
+        status = data.get('status')
+        if status == 'completed':
+            operation._complete(data.get('resourceId'))
+            logger.debug('Copied %r to %r', operation.item, operation.resource_id)
+            return
+        if status in operation.failed_statuses:
+            error = data.get('error') or dict()
+            operation._fail(exception.MicrosoftException(error.get('code', status), error.get('message', 'The copy of %s %s' % (operation.item, status))))
+            return
+        operation.status = status or operation.status
+        operation.percentage = float(data.get('percentageComplete') or previous)
+        if operation.percentage > previous:
+            operation._interval = max(self.initial_interval, operation._interval / 2)
+        else:
+            operation._interval = min(self.max_interval, operation._interval * 2)
+        operation._poll_at = time.time() + operation._interval
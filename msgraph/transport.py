@@ -0,0 +1,391 @@
+import base64
+import collections
+import json
+import os
+import threading
+import requests
+from requests import adapters, structures
+
+
+class Transport(object):
+    """
+    Sends the HTTP requests of a GraphAPI, standing in for its requests.Session
+
+    Subclasses implement send, which receives the prepared method, URL, headers and
+    body of each request and returns the status code, headers and content of the
+    response.  The response is handed back to the GraphAPI as a requests.Response
+    whose content has already been read, so streaming, retries and error handling
+    behave as they do over the network.
+    """
+
+    def request(self, method, url, **kwargs):
+        """
+        Sends a request, with the signature of requests.Session.request
+
+        Parameters:
+            method (str):  The HTTP method of the request
+            url (str):  The absolute URL of the request
+
+        Returns:
+            requests.Response:  The response
+        """
+        prepared = requests.Request(method, url, headers=kwargs.get('headers'), params=kwargs.get('params'), data=kwargs.get('data'), json=kwargs.get('json')).prepare()
+        body = prepared.body
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        elif body is not None and not isinstance(body, bytes):
+            body = body.read() if hasattr(body, 'read') else b''.join(body)
+        status, headers, content = self.send(prepared.method, prepared.url, dict(prepared.headers), body or b'')
+        return build_response(prepared, status, headers, content)
+
+    def send(self, method, url, headers, body):
+        """
+        Answers a single request
+
+        Parameters:
+            method (str):  The HTTP method of the request
+            url (str):  The absolute URL of the request, including its query string
+            headers (dict):  The headers of the request
+            body (bytes):  The payload of the request
+
+        Returns:
+            tuple:  The status code, headers and content of the response
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """
+        Releases the resources of the transport
+        """
+        pass
+
+
+class PoolAdapter(adapters.HTTPAdapter):
+    """
+    An HTTPAdapter keeping connections alive in a pool per host, and reporting how saturated its pools are
+
+    When more requests are sent concurrently than pool_maxsize, each extra request
+    either waits for a pooled connection (with pool_block) or opens a connection
+    which is closed afterwards, paying a new TCP and TLS handshake.  Such requests
+    are counted as saturated, a sign that pool_maxsize should match the number of
+    threads sharing the session.
+
+    Attributes:
+        pool_maxsize (int):  The maximum number of connections kept alive per host
+        pool_block (bool):  Wait for a pooled connection rather than opening an extra one
+        in_flight (int):  The number of requests being sent
+        peak_in_flight (int):  The largest number of requests sent concurrently
+        saturated (int):  The number of requests sent while every pooled connection was in use
+        requests (int):  The number of requests sent
+    """
+
+    def __init__(self, pool_connections=10, pool_maxsize=10, pool_block=False, max_retries=0):
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.saturated = 0
+        self.requests = 0
+        self._stats_lock = threading.Lock()
+        super(PoolAdapter, self).__init__(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=max_retries, pool_block=pool_block)
+
+    def __repr__(self):
+        return '<%s %s pool_maxsize=%i, in_flight=%i, peak_in_flight=%i, saturated=%i>' % (self.__class__.__name__, id(self), self.pool_maxsize, self.in_flight, self.peak_in_flight, self.saturated)
+
+    def send(self, request, **kwargs):
+        with self._stats_lock:
+            self.requests += 1
+            if self.in_flight >= self.pool_maxsize:
+                self.saturated += 1
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            return super(PoolAdapter, self).send(request, **kwargs)
+        finally:
+            with self._stats_lock:
+                self.in_flight -= 1
+
+    def stats(self):
+        """
+        Reports the usage of the connection pools
+
+        Returns:
+            dict:  The requests sent, in flight, at the peak and saturated, with the connections opened and idle in each pool, keyed by host
+        """
+        pools = dict()
+        for key in list(self.poolmanager.pools.keys()):
+            pool = self.poolmanager.pools.get(key)
+            if pool is None:
+                continue
+            idle = pool.pool.qsize() if pool.pool is not None else 0
+            pools['%s://%s:%s' % (pool.scheme, pool.host, pool.port)] = dict(opened=pool.num_connections, idle=idle, requests=pool.num_requests)
+        with self._stats_lock:
+            return dict(requests=self.requests, in_flight=self.in_flight, peak_in_flight=self.peak_in_flight, saturated=self.saturated, pool_maxsize=self.pool_maxsize, pools=pools)
+
+
+def create_session(**kwargs):
+    """
+    Creates a requests.Session whose connections are pooled and kept alive, for a GraphAPI shared by many threads
+
+    Keyword Arguments:
+        pool_connections (int):  The number of hosts for which a pool is kept, default: 10
+        pool_maxsize (int):  The maximum number of connections kept alive per host, match it to the number of threads sharing the session, default: 10
+        pool_block (bool):  Wait for a pooled connection rather than opening an extra one when every connection is in use, default: False
+        keep_alive (bool):  Reuse connections (and their TLS sessions) between requests, default: True
+        proxies (dict):  The proxy URL of each scheme, such as {'https': 'http://proxy:3128'}, default: from the environment
+        verify (bool|str):  Verify the certificate of the API endpoint, or the path of a CA bundle, default: True
+        cert (str|tuple):  The client certificate presented to the API endpoint, default: None
+        adapter (PoolAdapter):  The adapter to mount, shared with other sessions, default: a new PoolAdapter configured by the keyword arguments above
+
+    Returns:
+        requests.Session:  The session, with a PoolAdapter mounted for http:// and https://
+    """
+    session = requests.Session()
+    adapter = kwargs.get('adapter') or PoolAdapter(pool_connections=kwargs.get('pool_connections', 10), pool_maxsize=kwargs.get('pool_maxsize', 10), pool_block=kwargs.get('pool_block', False))
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    if not kwargs.get('keep_alive', True):
+        session.headers['Connection'] = 'close'
+    if kwargs.get('proxies'):
+        session.proxies.update(kwargs['proxies'])
+    if 'verify' in kwargs:
+        session.verify = kwargs['verify']
+    if kwargs.get('cert'):
+        session.cert = kwargs['cert']
+    return session
+
+
+class ThreadLocalSession(object):
+    """
+    Gives each thread its own requests.Session, while every session shares the connections of a single PoolAdapter
+
+    A requests.Session shared between threads is safe for the requests of a GraphAPI,
+    which neither store cookies nor change the session once it is created.  Use a
+    session per thread when hooks, cookies or other state of the session must not be
+    seen by other threads: each thread then configures its own session without
+    opening its own connections.
+
+    Attributes:
+        adapter (PoolAdapter):  The adapter pooling the connections of every session
+        sessions (int):  The number of sessions created, one per thread which sent a request
+
+    Example:
+        from msgraph import api
+
+        api_instance = api.GraphAPI.from_certificate(authority_host_uri, tenant, resource_uri, client_id, client_certificate, client_thumbprint, session_per_thread=True, pool_maxsize=100)
+    """
+
+    def __init__(self, **kwargs):
+        self.adapter = kwargs.pop('adapter', None) or PoolAdapter(pool_connections=kwargs.get('pool_connections', 10), pool_maxsize=kwargs.get('pool_maxsize', 10), pool_block=kwargs.get('pool_block', False))
+        self.sessions = 0
+        self._options = kwargs
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return '<%s %s sessions=%i>' % (self.__class__.__name__, id(self), self.sessions)
+
+    @property
+    def session(self):
+        """
+        The requests.Session of the calling thread, created on its first request
+        """
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = create_session(adapter=self.adapter, **self._options)
+            with self._lock:
+                self.sessions += 1
+        return session
+
+    def request(self, method, url, **kwargs):
+        """
+        Sends a request through the session of the calling thread, with the signature of requests.Session.request
+
+        Parameters:
+            method (str):  The HTTP method of the request
+            url (str):  The absolute URL of the request
+
+        Returns:
+            requests.Response:  The response
+        """
+        return self.session.request(method, url, **kwargs)
+
+    def get_adapter(self, url):
+        """
+        Returns:
+            PoolAdapter:  The adapter shared by every session
+        """
+        return self.adapter
+
+    def close(self):
+        """
+        Closes the pooled connections of every session
+        """
+        self.adapter.close()
+
+
+def build_response(request, status, headers, content):
+    """
+    Builds a requests.Response from a response which has already been read
+
+    Parameters:
+        request (requests.PreparedRequest):  The request which was answered
+        status (int):  The status code of the response
+        headers (dict):  The headers of the response
+        content (bytes):  The body of the response
+
+    Returns:
+        requests.Response:  The response
+    """
+    response = requests.Response()
+    response.status_code = status
+    response.headers = structures.CaseInsensitiveDict(headers or dict())
+    response.headers.setdefault('Content-Length', str(len(content)))
+    response._content = content
+    response._content_consumed = True
+    response.url = request.url
+    response.request = request
+    response.encoding = 'utf-8'
+    response.reason = ''
+    return response
+
+
+class RecordingTransport(object):
+    """
+    Sends requests through another transport, recording each exchange to a cassette file which a ReplayTransport answers from later
+
+    The Authorization header is never recorded.  Bodies are recorded as JSON when
+    they parse as JSON, and as base64 otherwise.  Streamed responses are read in
+    full before they are recorded.  The cassette is written once, when the recorder
+    (or the GraphAPI using it) is closed, or whenever save is called.
+
+    Attributes:
+        transport (requests.Session):  Sends the requests, default: a new requests.Session
+        path (str):  The cassette file
+        interactions (list):  The recorded exchanges
+
+    Example:
+        from msgraph import api, transport, user
+
+        with transport.RecordingTransport('users.json') as recorder:
+            api_instance = api.GraphAPI.from_certificate(authority_host_uri, tenant, resource_uri, client_id, client_certificate, client_thumbprint, transport=recorder)
+            users = user.User.get(api_instance, as_list=True)
+    """
+
+    def __init__(self, path, transport=None):
+        self.path = path
+        self.transport = transport or requests.Session()
+        self.interactions = []
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return '<%s %s path=%r, interactions=%i>' % (self.__class__.__name__, id(self), self.path, len(self.interactions))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def request(self, method, url, **kwargs):
+        response = self.transport.request(method, url, **kwargs)
+        content = response.content
+        prepared = response.request
+        body = prepared.body if prepared is not None else None
+        if hasattr(body, 'read'):
+            body = None
+        interaction = dict(
+            request=dict(method=method.upper(), url=prepared.url if prepared is not None else url, body=_encode_body(body)),
+            response=dict(status=response.status_code, headers=dict(response.headers), body=_encode_body(content))
+        )
+        interaction['response']['headers'].pop('Content-Encoding', None)
+        interaction['response']['headers']['Content-Length'] = str(len(content))
+        with self._lock:
+            self.interactions.append(interaction)
+        return response
+
+    def save(self):
+        """
+        Writes the recorded exchanges to the cassette file
+        """
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            with open(self.path, 'w') as output_file:
+                json.dump(dict(interactions=self.interactions), output_file, indent=2)
+
+    def close(self):
+        """
+        Writes the cassette file, and closes the connections of the transport
+        """
+        self.save()
+        self.transport.close()
+
+
+class ReplayTransport(Transport):
+    """
+    Answers requests from a cassette file written by a RecordingTransport, without a network
+
+    Each request is answered by the first recorded exchange with the same method and
+    URL which has not been replayed yet, so repeated requests replay in the order
+    they were recorded.  Once every matching exchange was replayed, the last one is
+    replayed again.
+
+    Attributes:
+        path (str):  The cassette file
+        interactions (list):  The recorded exchanges
+
+    Example:
+        from msgraph import api, transport, user
+
+        api_instance = api.GraphAPI(None, tenant, resource_uri, None, 'token', transport=transport.ReplayTransport('users.json'), retry=None)
+        users = user.User.get(api_instance, as_list=True)
+
+    Raises:
+        LookupError:  A request was not recorded
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path) as input_file:
+            self.interactions = json.load(input_file)['interactions']
+        self._queues = collections.defaultdict(collections.deque)
+        self._last = dict()
+        for interaction in self.interactions:
+            request = interaction['request']
+            self._queues[(request['method'], request['url'])].append(interaction['response'])
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return '<%s %s path=%r, interactions=%i>' % (self.__class__.__name__, id(self), self.path, len(self.interactions))
+
+    def send(self, method, url, headers, body):
+        key = (method.upper(), url)
+        with self._lock:
+            queue = self._queues.get(key)
+            if queue:
+                response = self._last[key] = queue.popleft()
+            else:
+                response = self._last.get(key)
+        if response is None:
+            raise LookupError('%s %r was not recorded in %r' % (method, url, self.path))
+        return response['status'], response['headers'], _decode_body(response['body'])
+
+
+def _encode_body(body):
+    if body is None or body == b'':
+        return None
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    try:
+        return dict(json=json.loads(body.decode('utf-8')))
+    except ValueError:
+        return dict(base64=base64.b64encode(body).decode('ascii'))
+
+
+def _decode_body(body):
+    if body is None:
+        return b''
+    if 'json' in body:
+        return json.dumps(body['json']).encode('utf-8')
+    return base64.b64decode(body['base64'])
@@ -0,0 +1,238 @@
+import logging
+import os
+import time
+from msgraph import base, exception, retry
+
+
+logger = logging.getLogger(__name__)
+
+
+class UploadSession(object):
+    """
+    Uploads content to a DriveItem in chunks through an upload session
+
+    The content is streamed from a file object (or the path of a file) one chunk
+    at a time, so only a single chunk is held in memory.  When a chunk fails, the
+    ranges still expected by the server are requested and the upload resumes from
+    there.  An upload interrupted by the process exiting can be resumed by creating
+    an UploadSession with the same upload_url.
+
+    For more information see: https://docs.microsoft.com/en-us/graph/api/driveitem-createuploadsession
+
+    Attributes:
+        api (msgraph.api.GraphAPI):  The endpoint the session was created with
+        upload_url (str):  The pre-authenticated URL receiving the chunks
+        expires_at (datetime):  When the session expires, None if unknown
+        next_expected_ranges (list):  The byte ranges the server has yet to receive, such as ["26-"]
+        chunk_size (int):  The number of bytes sent in each request, a multiple of 320 KiB
+        retry_policy (msgraph.retry.RetryPolicy):  Decides how many times, and after how long, a failed chunk is resumed
+        total_size (int):  The size of the content, None until the upload starts
+        bytes_sent (int):  The number of bytes sent by this session
+        elapsed (float):  The number of seconds spent sending chunks
+
+    Example:
+        from msgraph import files
+
+        session = files.DriveItem.create_upload_session(api_instance, drive=drive_id, parent=folder_id, file_name='export.csv')
+        data = session.upload('/tmp/export.csv', progress=lambda session: print(session.throughput))
+        item = files.DriveItem.from_api(data)
+    """
+    chunk_multiple = 327680
+    default_chunk_size = 32 * chunk_multiple
+
+    def __init__(self, api, upload_url, **kwargs):
+        self.api = api
+        self.upload_url = upload_url
+        self.expires_at = kwargs.get('expires_at')
+        self.next_expected_ranges = kwargs.get('next_expected_ranges', ['0-'])
+        chunk_size = kwargs.get('chunk_size', self.default_chunk_size)
+        self.chunk_size = max(self.chunk_multiple, chunk_size - chunk_size % self.chunk_multiple)
+        self.retry_policy = kwargs.get('retry_policy', retry.RetryPolicy(max_retries=5, backoff_factor=1.0, max_backoff=30.0))
+        self.total_size = None
+        self.bytes_sent = 0
+        self.elapsed = 0.0
+
+    def __repr__(self):
+        return '<%s %s next_expected_ranges=%r, total_size=%r, bytes_sent=%i>' % (self.__class__.__name__, id(self), self.next_expected_ranges, self.total_size, self.bytes_sent)
+
+    @property
+    def throughput(self):
+        """
+        Returns:
+            float:  The average number of bytes sent per second
+        """
+        if not self.elapsed:
+            return 0.0
+        return self.bytes_sent / self.elapsed
+
+    @classmethod
+    def from_api(cls, api, data, **kwargs):
+        """
+        Builds an UploadSession from the response of createUploadSession
+
+        Parameters:
+            api (msgraph.api.GraphAPI):  The endpoint the session was created with
+            data (dict):  raw data returned from the API
+
+        Returns:
+            UploadSession:  the session built from the provided data
+        """
+        expires_at = data.get('expirationDateTime')
+        if expires_at:
+            expires_at = base.Base.parse_date_time(expires_at)
+        next_expected_ranges = data.get('nextExpectedRanges') or ['0-']
+        return cls(api, data['uploadUrl'], expires_at=expires_at, next_expected_ranges=next_expected_ranges, **kwargs)
+
+    @classmethod
+    def create(cls, api, uri, **kwargs):
+        """
+        Creates an upload session at the API endpoint
+
+        Parameters:
+            api (msgraph.api.GraphAPI):  The endpoint in which to create the session
+            uri (str):  The createUploadSession endpoint of the item
+
+        Keyword Arguments:
+            conflict_behavior (str):  What to do if the item already exists, one of fail, replace or rename, default: replace
+            chunk_size (int):  The number of bytes sent in each request, rounded down to a multiple of 320 KiB, default: 10 MiB
+            retry_policy (msgraph.retry.RetryPolicy):  Decides how many times, and after how long, a failed chunk is resumed
+
+        Returns:
+            UploadSession:  The created session
+        """
+        item = {
+            '@microsoft.graph.conflictBehavior': kwargs.pop('conflict_behavior', 'replace')
+        }
+        data = api.request(uri, json=dict(item=item), method='POST')
+        session = cls.from_api(api, data, **kwargs)
+        logger.debug('Created %r', session)
+        return session
+
+    def status(self):
+        """
+        Fetches the ranges the server has yet to receive
+
+        Returns:
+            list:  The byte ranges still expected, such as ["26-"]
+        """
+        data = self.api.request(self.upload_url, authenticate=False)
+        self._update(data)
+        return self.next_expected_ranges
+
+    def cancel(self):
+        """
+        Cancels the upload session, discarding the bytes uploaded so far
+        """
+        self.api.request(self.upload_url, method='DELETE', authenticate=False)
+        logger.info('Cancelled %r', self)
+
+    def upload(self, content, **kwargs):
+        """
+        Uploads the content, starting from the first range expected by the server
+
+        Parameters:
+            content (file|str):  A binary file object, or the path of the file to upload
+
+        Keyword Arguments:
+            size (int):  The size of the content, required when the file object is not seekable
+            progress (callable):  Called with the UploadSession after each chunk is accepted
+
+        Returns:
+            dict:  The DriveItem created by the upload, as returned by the API
+        """
+        if isinstance(content, str):
+            with open(content, 'rb') as input_file:
+                return self.upload(input_file, **kwargs)
+
+        progress = kwargs.get('progress')
+        self.total_size = kwargs.get('size')
+        if self.total_size is None:
+            self.total_size = self._size(content)
+        position = content.tell() if self._seekable(content) else 0
+        failures = 0
+        while True:
+            start, end = self._next_range()
+            try:
+                position = self._seek(content, position, start)
+                chunk = content.read(end - start)
+                position += len(chunk)
+                if len(chunk) != end - start:
+                    raise ValueError('Expected %i bytes of content at offset %i, read %i' % (end - start, start, len(chunk)))
+                data = self._send(chunk, start, end)
+            except exception.MicrosoftException as e:
+                if failures >= self.retry_policy.max_retries:
+                    raise
+                delay = self.retry_policy.delay(failures)
+                logger.warning('Uploading bytes %i-%i failed (%s), resuming in %.2f seconds', start, end - 1, e, delay)
+                time.sleep(delay)
+                failures += 1
+                self.status()
+                continue
+            failures = 0
+            if 'id' in data:
+                logger.info('Uploaded %i bytes in %.2f seconds (%.0f bytes/second)', self.total_size, self.elapsed, self.throughput)
+                return data
+            self._update(data)
+            if progress:
+                progress(self)
+
+    def _send(self, chunk, start, end):
+        headers = {
+            'Content-Range': 'bytes %i-%i/%i' % (start, end - 1, self.total_size)
+        }
+        started_at = time.time()
+        data = self.api.request(self.upload_url, data=chunk, headers=headers, content_type='application/octet-stream', method='PUT', authenticate=False)
+        self.elapsed += time.time() - started_at
+        self.bytes_sent += len(chunk)
+        logger.debug('Uploaded bytes %i-%i of %i', start, end - 1, self.total_size)
+        return data if isinstance(data, dict) else dict()
+
+    def _update(self, data):
+        next_expected_ranges = data.get('nextExpectedRanges')
+        if next_expected_ranges:
+            self.next_expected_ranges = next_expected_ranges
+        expires_at = data.get('expirationDateTime')
+        if expires_at:
+            self.expires_at = base.Base.parse_date_time(expires_at)
+
+    def _next_range(self):
+        first_range = self.next_expected_ranges[0]
+        raw_start, _, raw_end = first_range.partition('-')
+        start = int(raw_start)
+        end = min(start + self.chunk_size, self.total_size)
+        if raw_end:
+            end = min(end, int(raw_end) + 1)
+        return start, end
+
+    @staticmethod
+    def _seekable(content):
+        seekable = getattr(content, 'seekable', None)
+        return bool(seekable and seekable())
+
+    @classmethod
+    def _size(cls, content):
+        if not cls._seekable(content):
+            raise ValueError('The size of a stream which is not seekable must be provided')
+        try:
+            return os.fstat(content.fileno()).st_size
+        except (AttributeError, OSError, ValueError):
+            position = content.tell()
+            size = content.seek(0, os.SEEK_END)
+            content.seek(position)
+            return size
+
+    @classmethod
+    def _seek(cls, content, position, offset):
+        if position == offset:
+            return position
+        if cls._seekable(content):
+            content.seek(offset)
+            return offset
+        if offset < position:
+            raise ValueError('Cannot rewind a stream which is not seekable from %i to %i' % (position, offset))
+        while position < offset:
+            skipped = content.read(min(offset - position, cls.chunk_multiple))
+            if not skipped:
+                raise ValueError('The stream ended at %i before offset %i' % (position, offset))
+            position += len(skipped)
+        return position
@@ -1,5 +1,5 @@
 import logging
-from msgraph import base
+from msgraph import aio, base, paging
 
 
 logger = logging.getLogger(__name__)
@@ -30,6 +30,24 @@ class User(base.Base):
         removed (dict|None):  Used in delta API calls, denoted if a user is new/changed
     """
     __slots__ = ('id', 'display_name', 'email_address', 'preferred_language', 'user_principal_name', 'office_location', 'job_title', 'given_name', 'surname', 'mobile_phone', 'business_phones', 'mail_nickname', 'account_enabled', 'password_profile', 'created_at', 'removed')
+    api_fields = {
+        'id': ('id', None),
+        'display_name': ('displayName', None),
+        'email_address': ('mail', None),
+        'preferred_language': ('preferredLanguage', None),
+        'user_principal_name': ('userPrincipalName', None),
+        'office_location': ('officeLocation', None),
+        'job_title': ('jobTitle', None),
+        'given_name': ('givenName', None),
+        'surname': ('surname', None),
+        'mobile_phone': ('mobilePhone', None),
+        'business_phones': ('businessPhones', None),
+        'mail_nickname': ('mailNickname', None),
+        'account_enabled': ('accountEnabled', None),
+        'password_profile': ('passwordProfile', None),
+        'created_at': ('createdDateTime', base.Base.parse_date_time),
+        'removed': ('@removed', None)
+    }
 
     def __init__(self, id, display_name, email_address, preferred_language, user_principal_name, office_location, job_title, given_name, surname, mobile_phone, business_phones, mail_nickname, account_enabled, password_profile, created_at, removed):
         self.id = id
@@ -60,10 +78,10 @@ class User(base.Base):
         Updates the User in the given API endpoint
 
         Parameters:
-            api (msgraph.api.GraphAPI):  The endpoint at which to save the User
+            api (msgraph.api.GraphAPI|msgraph.batch.Batch):  The endpoint at which to save the User
         """
         uri = 'users/%s' % self.id
-        data = dict(displayName=self.display_name, mail=self.mail, preferredLanguage=self.preferred_language, officeLocation=self.office_location, jobTitle=self.job_title, givenName=self.given_name, surname=self.surname, mobilePhone=self.mobile_phone, businessPhones=self.business_phones)
+        data = dict(displayName=self.display_name, mail=self.email_address, preferredLanguage=self.preferred_language, officeLocation=self.office_location, jobTitle=self.job_title, givenName=self.given_name, surname=self.surname, mobilePhone=self.mobile_phone, businessPhones=self.business_phones)
         api.request(uri, json=data, method='PATCH')
 
     @classmethod
@@ -98,18 +116,21 @@ class User(base.Base):
         return cls(id, display_name, email_address, preferred_language, user_principal_name, office_location, job_title, given_name, surname, mobile_phone, business_phones, mail_nickname, account_enabled, password_profile, created_at, removed)
 
     @classmethod
-    def me(cls, api):
+    def me(cls, api, **kwargs):
         """
         Fetches the User instance of the user currently logged in
 
         Parameters:
             api (msgraph.api.GraphAPI):  The endpoint from which to fetch data
 
+        Keyword Arguments:
+            fields (list):  The attributes (or Graph properties) to fetch, default: every attribute
+
         Returns:
             User: the User instance of the user currently logged in
         """
         uri = 'users/me'
-        data = api.request(uri)
+        data = api.request(uri, params=cls.select_params(**kwargs))
         return cls.from_api(data)
 
     @classmethod
@@ -120,7 +141,8 @@ class User(base.Base):
         If a uri is not specified, will return a list users created since the beginning of time.
         The process will return a list of User instances along with a deltaLink.  The deltaLink
         should be used during the next execution to fetch all User instances that were created/updated
-        since the previous execution when the deltaLink was obtained.
+        since the previous execution when the deltaLink was obtained.  To have the deltaLink persisted
+        between executions, see msgraph.delta.sync.
 
         For more information see: https://docs.microsoft.com/en-us/graph/delta-query-users
 
@@ -139,23 +161,36 @@ class User(base.Base):
             # at some point in the future, fetch Users created/updated since the delta method was last executed
             new_updated_users, delta_link = user.User.delta(api_instance, delta_link)
         """
-        fields = kwargs.get('fields', ['id', 'displayName', 'mail', 'preferredLanguage', 'userPrincipalName', 'officeLocation', 'jobTitle', 'givenName', 'surname', 'mobilePhone', 'businessPhones', 'mailNickname', 'accountEnabled', 'passwordProfile', 'createdDateTime'])
         if uri:
-            data = api.request(uri)
+            params = None
         else:
-            uri = 'users/delta'
-            params = {
-                '$select': ','.join(fields)
-            }
-            data = api.request(uri, params=params)
+            uri, params = cls._delta_request(**kwargs)
 
-        output = [cls.from_api(row) for row in data.get('value', [])]
-        while data.get("@odata.nextLink"):
-            uri = data.get("@odata.nextLink")
-            data = api.request(uri)
-            output += [cls.from_api(row) for row in data.get('value', [])]
-        delta_link = data['@odata.deltaLink']
-        return output, delta_link
+        iterator = paging.PageIterator(api, uri, cls.factory(**kwargs), params=params, prefetch=kwargs.get('prefetch', False))
+        output = list(iterator)
+        return output, iterator.delta_link
+
+    @classmethod
+    def _delta_request(cls, **kwargs):
+        fields = kwargs.get('fields', ['id', 'displayName', 'mail', 'preferredLanguage', 'userPrincipalName', 'officeLocation', 'jobTitle', 'givenName', 'surname', 'mobilePhone', 'businessPhones', 'mailNickname', 'accountEnabled', 'passwordProfile', 'createdDateTime'])
+        params = {
+            '$select': cls.select(fields)
+        }
+        return 'users/delta', params
+
+    @classmethod
+    def _get_request(cls, user=None, **kwargs):
+        fields = kwargs.get('fields', ['id', 'displayName', 'mail', 'preferredLanguage', 'userPrincipalName', 'officeLocation', 'jobTitle', 'givenName', 'surname', 'mobilePhone', 'businessPhones', 'mailNickname', 'accountEnabled', 'passwordProfile', 'createdDateTime'])
+        if user:
+            uri = 'users/%s' % user
+        else:
+            uri = 'users'
+
+        params = {
+            '$top': kwargs.get('page_size', 100),
+            '$select': cls.select(fields)
+        }
+        return uri, params
 
     @classmethod
     def get(cls, api, user=None, **kwargs):
@@ -168,30 +203,60 @@ class User(base.Base):
 
         Keyword Arguments:
             page_size (int):  The number of User instances to include in each page, default: 100
+            fields (list):  The attributes (or Graph properties) to fetch, default: the standard User attributes
+            max_items (int):  The maximum number of instances to fetch, default: None
+            prefetch (bool):  Request the next page in the background while the current page is processed, default: False
+            as_list (bool):  Fetch every page up front and return a list, default: False
+            lazy (bool):  Decode the attributes of each instance on first access, default: False
 
         Returns:
-            (list|User):  If a user specified, the requested User instance, otherwise a list of User instances
+            (PageIterator|list|User):  If a user specified, the requested User instance, otherwise the User instances, fetched lazily unless as_list is True
         """
-        fields = kwargs.get('fields', ['id', 'displayName', 'mail', 'preferredLanguage', 'userPrincipalName', 'officeLocation', 'jobTitle', 'givenName', 'surname', 'mobilePhone', 'businessPhones', 'mailNickname', 'accountEnabled', 'passwordProfile', 'createdDateTime'])
+        uri, params = cls._get_request(user, **kwargs)
         if user:
-            uri = 'users/%s' % user
-        else:
-            uri = 'users'
+            data = api.request(uri, params=params)
+            return cls.from_api(data)
+        return paging.paginate(api, uri, cls.factory(**kwargs), params=params, **kwargs)
 
-        params = {
-            '$top': kwargs.get('page_size', 100),
-            '$select': ','.join(fields)
-        }
-        data = api.request(uri, params=params)
+    @classmethod
+    async def get_async(cls, api, user=None, **kwargs):
+        """
+        Fetches User instances from an asynchronous API endpoint
+
+        Parameters:
+            api (msgraph.aio.AsyncGraphAPI):  The endpoint from which to fetch data
+            user (str, optional):  The User Principal Name for which to fetch data
+
+        Keyword Arguments:
+            page_size (int):  The number of User instances to include in each page, default: 100
+            fields (list):  The attributes (or Graph properties) to fetch, default: the standard User attributes
+            lazy (bool):  Decode the attributes of each instance on first access, default: False
+
+        Returns:
+            (list|User):  If a user specified, the requested User instance, otherwise a list of User instances
+        """
+        uri, params = cls._get_request(user, **kwargs)
         if user:
-            output = cls.from_api(data)
-        else:
-            output = []
-            while data.get("@odata.nextLink"):
-                uri = data.get("@odata.nextLink")
-                data = api.request(uri)
-                output += [cls.from_api(row) for row in data.get('value', [])]
-        return output
+            data = await api.request(uri, params=params)
+            return cls.from_api(data)
+        return await aio.collect(api, uri, cls.factory(**kwargs), params=params, **kwargs)
+
+    @classmethod
+    async def me_async(cls, api, **kwargs):
+        """
+        Fetches the User instance of the user currently logged in from an asynchronous API endpoint
+
+        Parameters:
+            api (msgraph.aio.AsyncGraphAPI):  The endpoint from which to fetch data
+
+        Keyword Arguments:
+            fields (list):  The attributes (or Graph properties) to fetch, default: every attribute
+
+        Returns:
+            User: the User instance of the user currently logged in
+        """
+        data = await api.request('users/me', params=cls.select_params(**kwargs))
+        return cls.from_api(data)
 
     @classmethod
     def create(cls, api, display_name, user_principal_name, mail_nickname, password_profile, **kwargs):
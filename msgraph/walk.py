@@ -0,0 +1,98 @@
+import collections
+import logging
+from concurrent import futures
+from msgraph import paging
+
+
+logger = logging.getLogger(__name__)
+
+
+class TreeWalker(object):
+    """
+    Recursively iterates over the items of a drive, listing folders concurrently
+
+    Folders are listed breadth-first by a pool of worker threads, so up to
+    max_workers folders are being fetched from the API endpoint at any time.  Items
+    are yielded a page at a time as each folder is listed, together with their path
+    relative to the folder the walk started from, so a folder with many children is
+    never held in memory whole.  Folders for which prune returns True are yielded,
+    but their children are not listed.
+
+    Attributes:
+        api (msgraph.api.GraphAPI):  The endpoint from which to fetch data
+        drive_uri (str):  The endpoint of the drive, such as drives/{drive-id}
+        factory (callable):  Builds an instance from each row of a folder
+        root (str):  The ID of the folder from which to start, None for the root of the drive
+        params (dict):  The query parameters of the request listing each folder
+        max_workers (int):  The maximum number of folders listed concurrently
+        max_depth (int):  The deepest level to list, 1 for only the children of root, None for no limit
+        prune (callable):  Called with the path and instance of each folder, returns True to skip its children
+        folder_count (int):  The number of folders listed so far
+        item_count (int):  The number of items yielded so far
+
+    Example:
+        from msgraph import files
+
+        for path, item in files.DriveItem.walk(api_instance, drive=drive_id, max_workers=8):
+            print(path, item.size)
+
+        walker = files.DriveItem.walk(api_instance, drive=drive_id, max_depth=3, prune=lambda path, item: item.name == 'Archive')
+    """
+
+    def __init__(self, api, drive_uri, factory, **kwargs):
+        self.api = api
+        self.drive_uri = drive_uri
+        self.factory = factory
+        self.root = kwargs.get('root')
+        self.params = kwargs.get('params')
+        self.max_workers = kwargs.get('max_workers', 4)
+        self.max_depth = kwargs.get('max_depth')
+        self.prune = kwargs.get('prune')
+        self.folder_count = 0
+        self.item_count = 0
+
+    def __repr__(self):
+        return '<%s %s drive_uri=%r, root=%r, max_workers=%r, folder_count=%i, item_count=%i>' % (self.__class__.__name__, id(self), self.drive_uri, self.root, self.max_workers, self.folder_count, self.item_count)
+
+    def __iter__(self):
+        pending = collections.deque([(self.root, '', 1)])
+        running = dict()
+        executor = futures.ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            while pending or running:
+                while pending and len(running) < self.max_workers:
+                    folder, path, depth = pending.popleft()
+                    pages = self._list(folder)
+                    running[executor.submit(next, pages, None)] = (pages, path, depth)
+                done, _ = futures.wait(running, return_when=futures.FIRST_COMPLETED)
+                for future in done:
+                    pages, path, depth = running.pop(future)
+                    rows = future.result()
+                    if rows is None:
+                        self.folder_count += 1
+                        continue
+                    # fetch the next page of the folder while this one is consumed
+                    running[executor.submit(next, pages, None)] = (pages, path, depth)
+                    for row in rows:
+                        instance = self.factory(row)
+                        item_path = '%s/%s' % (path, row['name']) if path else row['name']
+                        self.item_count += 1
+                        yield item_path, instance
+                        if 'folder' not in row or (self.max_depth is not None and depth >= self.max_depth):
+                            continue
+                        if self.prune and self.prune(item_path, instance):
+                            logger.debug('Pruned %r', item_path)
+                            continue
+                        pending.append((row['id'], item_path, depth + 1))
+        finally:
+            for future in running:
+                future.cancel()
+            executor.shutdown(wait=False)
+        logger.info('Walked %i items in %i folders of %r', self.item_count, self.folder_count, self.drive_uri)
+
+    def _list(self, folder):
+        if folder:
+            uri = '%s/items/%s/children' % (self.drive_uri, folder)
+        else:
+            uri = '%s/root/children' % self.drive_uri
+        return paging.PageIterator(self.api, uri, dict, params=self.params).pages()
@@ -21,10 +21,9 @@ setup(
         'Source': 'https://github.com/WMInfoTech/python-msgraph',
         'Tracker': 'https://github.com/WMInfoTech/python-msgraph/issues'
     },
+    python_requires='>=3.7',
     install_requires=['adal>=1.2.2', 'requests>=2.12.0'],
-    options={
-        'bdist_wheel': {
-            'universal': True
-        }
+    extras_require={
+        'async': ['aiohttp>=3.0']
     }
 )
@@ -0,0 +1,63 @@
+import pytest
+from msgraph import exception, fake, retry, user
+
+
+def test_batch_results():
+    graph = fake.FakeGraph()
+    rows = graph.add_many('users', [dict(displayName='User %i' % index) for index in range(45)])
+    api_instance = graph.api()
+    with api_instance.batch() as batch:
+        requests = [batch.request('users/%s' % row['id']) for row in rows]
+        missing = batch.request('users/missing')
+    assert [request.result()['id'] for request in requests] == [row['id'] for row in rows]
+    # 46 requests are sent in 3 batches of up to 20
+    assert graph.request_count == 3
+    with pytest.raises(exception.MicrosoftException):
+        missing.result()
+    assert missing.status == 404
+
+
+def test_batch_updates():
+    graph = fake.FakeGraph()
+    row = graph.add('users', displayName='Before')
+    api_instance = graph.api()
+    with api_instance.batch() as batch:
+        batch.request('users/%s' % row['id'], method='PATCH', json=dict(displayName='After'))
+    assert user.User.get(api_instance, user=row['id']).display_name == 'After'
+
+
+def test_batch_dependencies():
+    graph = fake.FakeGraph()
+    row = graph.add('users', displayName='Before')
+    api_instance = graph.api()
+    batch = api_instance.batch()
+    update = batch.request('users/%s' % row['id'], method='PATCH', json=dict(displayName='After'))
+    fetch = batch.request('users/%s' % row['id'], depends_on=[update])
+    failed = batch.request('users/missing', method='PATCH', json=dict(displayName='After'))
+    batch.execute()
+    assert fetch.result()['displayName'] == 'After'
+    skipped = batch.request('users/%s' % row['id'], depends_on=[failed])
+    batch.execute()
+    with pytest.raises(exception.MicrosoftException):
+        skipped.result()
+    assert skipped.status == 424
+
+
+def test_batch_retries_throttled_requests():
+    graph = fake.FakeGraph()
+    rows = graph.add_many('users', [dict(displayName='User %i' % index) for index in range(4)])
+    answer = graph._answer
+    throttled = set()
+
+    def throttling(method, url, headers, body):
+        if '/users/' in url and url not in throttled:
+            throttled.add(url)
+            return graph._error(429, 'TooManyRequests', 'The request was throttled', {'Retry-After': '0'})
+        return answer(method, url, headers, body)
+
+    graph._answer = throttling
+    api_instance = graph.api(retry=retry.RetryScheduler(policies={429: retry.RetryPolicy(backoff_factor=0.01, max_backoff=0.01)}))
+    with api_instance.batch() as batch:
+        requests = [batch.request('users/%s' % row['id']) for row in rows]
+    assert [request.result()['id'] for request in requests] == [row['id'] for row in rows]
+    assert graph.request_count == 2
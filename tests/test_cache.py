@@ -0,0 +1,112 @@
+import base64
+import json
+from msgraph import api, cache, fake
+
+
+def jwt(**claims):
+    payload = base64.urlsafe_b64encode(json.dumps(claims).encode('utf-8')).decode('ascii').rstrip('=')
+    return api.Token('3600', None, 'fake', 'Bearer', 'header.%s.signature' % payload)
+
+
+def counting_graph(**kwargs):
+    graph = fake.FakeGraph(**kwargs)
+    graph.requests = []
+    handle = graph.handle
+
+    def counted(method, url, headers, body):
+        graph.requests.append((method, url))
+        return handle(method, url, headers, body)
+
+    graph.handle = counted
+    return graph
+
+
+def test_cached_until_written():
+    graph = counting_graph()
+    row = graph.add('users', displayName='Before')
+    api_instance = graph.api(cache=cache.ResponseCache(max_age=60))
+    assert api_instance.request('users/%s' % row['id'])['displayName'] == 'Before'
+    assert api_instance.request('users/%s' % row['id'])['displayName'] == 'Before'
+    assert len(graph.requests) == 1
+    api_instance.request('users/%s' % row['id'], method='PATCH', json=dict(displayName='After'))
+    assert api_instance.request('users/%s' % row['id'])['displayName'] == 'After'
+
+
+def test_invalidated_after_write():
+    graph = counting_graph()
+    row = graph.add('users', displayName='Before')
+    response_cache = cache.ResponseCache(max_age=60)
+    api_instance = graph.api(cache=response_cache)
+    api_instance.request('users/%s' % row['id'])
+    handle = graph.handle
+
+    def racing(method, url, headers, body):
+        # a read racing the write, answered before the write completes, must not outlive it
+        if method == 'PATCH':
+            api_instance.request('users/%s' % row['id'])
+        return handle(method, url, headers, body)
+
+    graph.handle = racing
+    response_cache.clear()
+    api_instance.request('users/%s' % row['id'], method='PATCH', json=dict(displayName='After'))
+    graph.handle = handle
+    assert api_instance.request('users/%s' % row['id'])['displayName'] == 'After'
+
+
+def test_invalidated_after_failed_write():
+    graph = counting_graph()
+    row = graph.add('users', displayName='Before')
+    response_cache = cache.ResponseCache(max_age=60)
+    api_instance = graph.api(cache=response_cache)
+    api_instance.request('users/%s' % row['id'])
+    assert len(response_cache) == 1
+    try:
+        api_instance.request('users/%s/missing' % row['id'], method='POST', json={})
+    except Exception:
+        pass
+    assert len(response_cache) == 0
+
+
+def test_delta_and_next_links_not_cached():
+    graph = counting_graph(page_size=2)
+    graph.add_many('users', [dict(displayName='User %i' % index) for index in range(3)])
+    response_cache = cache.ResponseCache(max_age=60)
+    api_instance = graph.api(cache=response_cache)
+    first = api_instance.request('users')
+    api_instance.request(first['@odata.nextLink'])
+    delta = api_instance.request('users/delta')
+    api_instance.request('users/delta', params={'$skiptoken': '2'})
+    assert '@odata.nextLink' in delta
+    assert len(response_cache) == 1
+    assert not cache.cacheable('users/delta')
+    assert not cache.cacheable('users', {'$deltatoken': '1'})
+    assert not cache.cacheable('drives/1/root/delta()?token=abc')
+    assert cache.cacheable('users/delta-user')
+
+
+def test_unauthenticated_not_cached():
+    graph = counting_graph()
+    row = graph.add('users', displayName='Anonymous')
+    response_cache = cache.ResponseCache(max_age=60)
+    api_instance = graph.api(cache=response_cache)
+    api_instance.request('users/%s' % row['id'], authenticate=False)
+    assert len(response_cache) == 0
+
+
+def test_scoped_by_principal():
+    graph = counting_graph()
+    row = graph.add('users', displayName='Shared')
+    response_cache = cache.ResponseCache(max_age=60)
+    alice = graph.api(cache=response_cache)
+    alice.set_access_token(jwt(oid='alice', tid='contoso'))
+    bob = graph.api(cache=response_cache)
+    bob.set_access_token(jwt(oid='bob', tid='contoso'))
+    alice.request('users/%s' % row['id'])
+    bob.request('users/%s' % row['id'])
+    alice.request('users/%s' % row['id'])
+    assert len(graph.requests) == 2
+    assert len(response_cache) == 2
+    bob.request('users/%s' % row['id'], method='PATCH', json=dict(displayName='Changed'))
+    assert len(response_cache) == 0
+    assert cache.token_scope('tenant', jwt(oid='alice', tid='contoso')) == 'contoso/alice'
+    assert cache.token_scope('tenant', 'Bearer opaque') == 'tenant/Bearer opaque'
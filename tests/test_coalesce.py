@@ -0,0 +1,69 @@
+import threading
+import pytest
+from concurrent import futures
+from msgraph import coalesce, exception, fake
+
+
+def test_single_flight_shares_call():
+    flight = coalesce.SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def call():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return dict(value=[1, 2, 3])
+
+    with futures.ThreadPoolExecutor(max_workers=8) as executor:
+        leader = executor.submit(flight.do, 'key', call)
+        started.wait(5)
+        followers = [executor.submit(flight.do, 'key', call) for index in range(7)]
+        while flight.shared < 7:
+            release.wait(0.001)
+        release.set()
+        results = [leader.result()] + [follower.result() for follower in followers]
+    assert len(calls) == 1
+    assert flight.executed == 1 and flight.shared == 7
+    assert all(result == dict(value=[1, 2, 3]) for result in results)
+    # every caller receives its own copy
+    assert len(set(id(result) for result in results)) == 8
+    assert flight.do('key', lambda: 'again') == 'again'
+
+
+def test_single_flight_shares_error():
+    flight = coalesce.SingleFlight()
+    release = threading.Event()
+
+    def fail():
+        release.wait(5)
+        raise exception.MicrosoftException('itemNotFound', 'Missing')
+
+    with futures.ThreadPoolExecutor(max_workers=4) as executor:
+        calls = [executor.submit(flight.do, 'key', fail) for index in range(4)]
+        while flight.executed + flight.shared < 4:
+            release.wait(0.001)
+        release.set()
+        for call in calls:
+            with pytest.raises(exception.MicrosoftException):
+                call.result()
+    assert flight.executed == 1
+
+
+def test_key_ignores_dict_order():
+    assert coalesce.SingleFlight.key('users', params={'$top': 1, '$select': 'id'}) == coalesce.SingleFlight.key('users', params={'$select': 'id', '$top': 1})
+    assert coalesce.SingleFlight.key('users', params={'$top': 1}) != coalesce.SingleFlight.key('users', params={'$top': 2})
+
+
+def test_graph_api_coalesces_gets():
+    graph = fake.FakeGraph(latency=0.05)
+    row = graph.add('users', displayName='Shared')
+    flight = coalesce.SingleFlight()
+    api_instance = graph.api(single_flight=flight)
+    with futures.ThreadPoolExecutor(max_workers=16) as executor:
+        results = list(executor.map(lambda index: api_instance.request('users/%s' % row['id']), range(16)))
+    assert all(result['id'] == row['id'] for result in results)
+    assert graph.request_count < 16
+    assert flight.executed == graph.request_count
+    assert flight.executed + flight.shared == 16
@@ -0,0 +1,70 @@
+from msgraph import delta, fake, files, user
+
+
+def test_sync_fetches_changes():
+    graph = fake.FakeGraph(page_size=3)
+    rows = graph.add_many('users', [dict(displayName='User %i' % index) for index in range(5)])
+    api_instance = graph.api()
+    store = delta.DeltaStore()
+    first = delta.sync(api_instance, user.User, store, as_list=True)
+    assert sorted(instance.id for instance in first) == sorted(row['id'] for row in rows)
+    assert store.load('users/delta', delta.sync(api_instance, user.User, store).scope).complete
+
+    assert delta.sync(api_instance, user.User, store, as_list=True) == []
+
+    api_instance.request('users/%s' % rows[0]['id'], method='PATCH', json=dict(displayName='Renamed'))
+    graph.remove('users', rows[1]['id'])
+    added = graph.add('users', displayName='New')
+    changed = dict((instance.id, instance) for instance in delta.sync(api_instance, user.User, store, as_list=True))
+    assert set(changed) == set([rows[0]['id'], rows[1]['id'], added['id']])
+    assert changed[rows[0]['id']].display_name == 'Renamed'
+    assert changed[rows[1]['id']].removed is not None
+    assert changed[added['id']].removed is None
+
+
+def test_sync_resumes_interrupted(tmp_path):
+    graph = fake.FakeGraph(page_size=2)
+    rows = graph.add_many('users', [dict(displayName='User %i' % index) for index in range(6)])
+    api_instance = graph.api()
+    store = delta.SQLiteDeltaStore(str(tmp_path / 'delta.sqlite3'))
+    seen = []
+    for index, page in enumerate(delta.sync(api_instance, user.User, store).pages()):
+        seen += [instance.id for instance in page]
+        if index == 1:
+            break
+    # the first page was processed, so the sync resumes from the second
+    for page in delta.sync(api_instance, user.User, store).pages():
+        seen += [instance.id for instance in page]
+    assert set(seen) == set(row['id'] for row in rows)
+    assert len(seen) == len(rows) + 2
+
+
+def test_sync_restarts_expired_state():
+    graph = fake.FakeGraph()
+    rows = graph.add_many('users', [dict(displayName='User %i' % index) for index in range(3)])
+    api_instance = graph.api()
+    store = delta.DeltaStore()
+    delta.sync(api_instance, user.User, store, as_list=True)
+    handle = graph.handle
+
+    def expired(method, url, headers, body):
+        if '%24deltatoken' in url:
+            return graph._error(410, 'syncStateNotFound', 'The delta token expired')
+        return handle(method, url, headers, body)
+
+    graph.handle = expired
+    resynced = delta.sync(api_instance, user.User, store, as_list=True)
+    assert sorted(instance.id for instance in resynced) == sorted(row['id'] for row in rows)
+
+
+def test_drive_delta():
+    graph = fake.FakeGraph()
+    drive = graph.drive()
+    drive.add_file('Reports/a.txt', b'one')
+    api_instance = graph.api()
+    items, delta_link = files.DriveItem.delta(api_instance)
+    assert set(item.name for item in items) >= set(['Reports', 'a.txt'])
+    drive.add_file('Reports/b.txt', b'two')
+    items, delta_link = files.DriveItem.delta(api_instance, delta_link)
+    assert 'b.txt' in [item.name for item in items]
+    assert 'a.txt' not in [item.name for item in items]
@@ -0,0 +1,46 @@
+from msgraph import fake, paging, user
+
+
+def populated(count, **kwargs):
+    graph = fake.FakeGraph(**kwargs)
+    rows = graph.add_many('users', [dict(displayName='User %i' % index, userPrincipalName='user%i@example.com' % index) for index in range(count)])
+    return graph, rows
+
+
+def test_page_iterator_follows_next_links():
+    graph, rows = populated(25, page_size=10)
+    iterator = paging.PageIterator(graph.api(), 'users', dict)
+    pages = list(iterator.pages())
+    assert [len(page) for page in pages] == [10, 10, 5]
+    assert [row['id'] for page in pages for row in page] == [row['id'] for row in rows]
+    assert iterator.page_count == 3
+    assert iterator.next_link is None
+
+
+def test_page_iterator_is_lazy():
+    graph, rows = populated(25, page_size=10)
+    iterator = paging.PageIterator(graph.api(), 'users', dict)
+    assert graph.request_count == 0
+    first = next(iter(iterator))
+    assert first['id'] == rows[0]['id']
+    assert graph.request_count == 1
+
+
+def test_max_items():
+    graph, rows = populated(25, page_size=10)
+    instances = list(paging.PageIterator(graph.api(), 'users', dict, max_items=12))
+    assert [row['id'] for row in instances] == [row['id'] for row in rows[:12]]
+    assert graph.request_count == 2
+
+
+def test_prefetch():
+    graph, rows = populated(25, page_size=10)
+    instances = list(paging.PageIterator(graph.api(), 'users', dict, prefetch=True))
+    assert [row['id'] for row in instances] == [row['id'] for row in rows]
+
+
+def test_paginate_models():
+    graph, rows = populated(25)
+    users = user.User.get(graph.api(), page_size=7, as_list=True)
+    assert [instance.user_principal_name for instance in users] == [row['userPrincipalName'] for row in rows]
+    assert isinstance(user.User.get(graph.api(), page_size=7), paging.PageIterator)
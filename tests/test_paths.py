@@ -0,0 +1,54 @@
+from msgraph import fake, files, paths
+
+
+def counting_graph():
+    graph = fake.FakeGraph()
+    graph.requests = []
+    handle = graph.handle
+
+    def counted(method, url, headers, body):
+        graph.requests.append((method, url))
+        return handle(method, url, headers, body)
+
+    graph.handle = counted
+    return graph
+
+
+def test_get_by_path_trusts_fresh_entries():
+    graph = counting_graph()
+    drive = graph.drive()
+    first = drive.add_file('docs/a.txt', b'one')
+    api_instance = graph.api()
+    path_cache = paths.PathCache(ttl=300)
+    assert files.DriveItem.get_by_path(api_instance, 'docs/a.txt', path_cache=path_cache).id == first['id']
+    del graph.requests[:]
+    item = files.DriveItem.get_by_path(api_instance, 'docs/a.txt', path_cache=path_cache, fields=['id', 'size'])
+    assert item.id == first['id'] and item.size == 3
+    assert len(graph.requests) == 1
+    assert '/items/%s' % first['id'] in graph.requests[0][1]
+
+
+def test_get_by_path_falls_back_when_missing():
+    graph = counting_graph()
+    drive = graph.drive()
+    first = drive.add_file('docs/a.txt', b'one')
+    api_instance = graph.api()
+    path_cache = paths.PathCache(ttl=300)
+    files.DriveItem.get_by_path(api_instance, 'docs/a.txt', path_cache=path_cache)
+    api_instance.request('me/drive/items/%s' % first['id'], method='DELETE')
+    second = drive.add_file('docs/a.txt', b'second')
+    assert files.DriveItem.get_by_path(api_instance, 'docs/a.txt', path_cache=path_cache).id == second['id']
+    assert path_cache.get('docs/a.txt').id == second['id']
+
+
+def test_get_by_path_revalidates_stale_entries():
+    graph = counting_graph()
+    drive = graph.drive()
+    first = drive.add_file('docs/a.txt', b'one')
+    api_instance = graph.api()
+    path_cache = paths.PathCache(ttl=0)
+    files.DriveItem.get_by_path(api_instance, 'docs/a.txt', path_cache=path_cache)
+    api_instance.request('me/drive/items/%s' % first['id'], method='PATCH', json=dict(name='b.txt'))
+    second = drive.add_file('docs/a.txt', b'second')
+    item = files.DriveItem.get_by_path(api_instance, 'docs/a.txt', path_cache=path_cache, fields=['id', 'size'])
+    assert item.id == second['id'] and item.size == 6
@@ -0,0 +1,87 @@
+import pytest
+from msgraph import fake, ratelimit, retry
+
+
+def fast_retry():
+    return retry.RetryScheduler(policies={429: retry.RetryPolicy(backoff_factor=0.01, max_backoff=0.01)})
+
+
+class RecordingLimiter(ratelimit.RateLimiter):
+
+    def __init__(self, **kwargs):
+        super(RecordingLimiter, self).__init__(**kwargs)
+        self.throttled_urls = []
+
+    def throttled(self, url):
+        self.throttled_urls.append(url)
+        super(RecordingLimiter, self).throttled(url)
+
+
+def test_batch_throttled_requests_slow_down():
+    graph = fake.FakeGraph()
+    rows = graph.add_many('users', [dict(displayName='User %i' % index) for index in range(3)])
+    answer = graph._answer
+    throttled = set()
+
+    def throttling(method, url, headers, body):
+        # the first attempt of every request to groups is throttled
+        if '/groups' in url and url not in throttled:
+            throttled.add(url)
+            return graph._error(429, 'TooManyRequests', 'The request was throttled', {'Retry-After': '0'})
+        return answer(method, url, headers, body)
+
+    graph._answer = throttling
+    limiter = RecordingLimiter(rates=dict(groups=1000.0, users=1000.0))
+    api_instance = graph.api(rate_limiter=limiter, retry=fast_retry())
+    with api_instance.batch() as batch:
+        users = [batch.request('users/%s' % row['id']) for row in rows]
+        groups = batch.request('groups')
+    assert [user.result()['id'] for user in users] == [row['id'] for row in rows]
+    assert groups.result()['value'] == []
+    assert limiter.throttled_urls == ['/groups']
+    assert limiter.bucket('groups').rate() < 1000.0
+    assert limiter.bucket('users').rate() == 1000.0
+
+
+def test_for_tenant_conflicting_configuration():
+    limiter = ratelimit.RateLimiter.for_tenant('tenant-conflict', rates=dict(users=10.0))
+    assert ratelimit.RateLimiter.for_tenant('tenant-conflict') is limiter
+    assert ratelimit.RateLimiter.for_tenant('tenant-conflict', rates=dict(users=10.0)) is limiter
+    with pytest.raises(ValueError):
+        ratelimit.RateLimiter.for_tenant('tenant-conflict', rates=dict(users=20.0))
+
+
+def test_family():
+    assert ratelimit.RateLimiter.family('https://graph.microsoft.com/v1.0/users/1/events') == 'users'
+    assert ratelimit.RateLimiter.family('me/drive/root/children') == 'drives'
+    assert ratelimit.RateLimiter.family('/sites/1/lists') == 'sites'
+    assert ratelimit.RateLimiter.family('solutions/bookingBusinesses/1') == 'bookingBusinesses'
+
+
+def test_bucket_paces_requests():
+    bucket = ratelimit.TokenBucket(10.0, capacity=2.0)
+    assert bucket.reserve(1) == 0.0
+    assert bucket.reserve(1) == 0.0
+    assert bucket.reserve(1) == pytest.approx(0.1, abs=0.02)
+    assert bucket.reserve(1) == pytest.approx(0.2, abs=0.02)
+
+
+def test_batch_takes_a_token_per_request():
+    limiter = ratelimit.RateLimiter(rates=dict(users=10.0, groups=10.0), burst=0.5)
+    body = dict(requests=[dict(id=str(index), method='GET', url='/users/%i' % index) for index in range(6)] + [dict(id='7', method='GET', url='/groups')])
+    assert limiter.reserve('https://graph.fake/v1.0/$batch', body) == pytest.approx(0.1, abs=0.02)
+    assert limiter.reserve('https://graph.fake/v1.0/groups') == pytest.approx(0.0, abs=0.02)
+    assert limiter.bucket('sites') is None
+
+
+def test_throttled_responses_slow_down():
+    graph = fake.FakeGraph(throttle_every=2)
+    rows = graph.add_many('users', [dict(displayName='User %i' % index) for index in range(4)])
+    limiter = ratelimit.RateLimiter(rates=dict(users=100.0), recovery=60.0)
+    api_instance = graph.api(rate_limiter=limiter, retry=fast_retry())
+    for row in rows:
+        assert api_instance.request('users/%s' % row['id'])['id'] == row['id']
+    assert limiter.bucket('users').rate() < 50.0
+    fixed = ratelimit.RateLimiter(rates=dict(users=100.0), adaptive=False)
+    fixed.throttled('users')
+    assert fixed.bucket('users').rate() == 100.0
@@ -0,0 +1,25 @@
+from msgraph import fake, sites
+
+
+def test_subsites():
+    graph = fake.FakeGraph(page_size=2)
+    parent = graph.add('sites', displayName='Parent', name='parent')
+    graph.add_many('sites/%s/sites' % parent['id'], [dict(displayName='Child %i' % index, name='child%i' % index) for index in range(5)])
+    site = sites.Site.from_api(parent)
+
+    subsites = site.subsites(graph.api(), as_list=True)
+
+    assert [subsite.display_name for subsite in subsites] == ['Child %i' % index for index in range(5)]
+    assert all(isinstance(subsite, sites.Site) for subsite in subsites)
+
+
+def test_subsites_fields():
+    graph = fake.FakeGraph()
+    parent = graph.add('sites', displayName='Parent', name='parent')
+    graph.add('sites/%s/sites' % parent['id'], displayName='Child', name='child', description='Not selected')
+
+    subsites = list(sites.Site.from_api(parent).subsites(graph.api(), fields=['id', 'display_name']))
+
+    assert len(subsites) == 1
+    assert subsites[0].display_name == 'Child'
+    assert subsites[0].description is None
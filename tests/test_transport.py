@@ -0,0 +1,54 @@
+import threading
+import pytest
+from concurrent import futures
+from msgraph import fake, transport, user
+
+
+@pytest.fixture
+def served():
+    graph = fake.FakeGraph(latency=0.001)
+    graph.rows = graph.add_many('users', [dict(displayName='User %i' % index) for index in range(50)])
+    graph.serve()
+    yield graph
+    graph.shutdown()
+
+
+def fetch_concurrently(api_instance, ids, threads):
+    def get(id):
+        return user.User.get(api_instance, user=id).id
+
+    with futures.ThreadPoolExecutor(max_workers=threads) as executor:
+        return list(executor.map(get, ids))
+
+
+@pytest.mark.parametrize('session_per_thread', [False, True])
+def test_concurrent_requests(served, session_per_thread):
+    ids = [served.rows[index % len(served.rows)]['id'] for index in range(400)]
+    with served.api(transport=None, pool_maxsize=16, session_per_thread=session_per_thread) as api_instance:
+        if session_per_thread:
+            assert isinstance(api_instance.transport, transport.ThreadLocalSession)
+        assert fetch_concurrently(api_instance, ids, 16) == ids
+        stats = api_instance.pool_stats()
+    assert stats['requests'] == len(ids)
+    assert stats['in_flight'] == 0
+    assert 1 < stats['peak_in_flight'] <= 16
+    assert stats['saturated'] == 0
+
+
+def test_session_per_thread():
+    sessions = transport.ThreadLocalSession(pool_maxsize=4)
+    seen = []
+    lock = threading.Lock()
+
+    def record():
+        with lock:
+            seen.append(sessions.session)
+
+    threads = [threading.Thread(target=record) for index in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(set(id(session) for session in seen)) == sessions.sessions == 4
+    assert len(set(id(session.get_adapter('https://graph.fake/')) for session in seen)) == 1
+    sessions.close()
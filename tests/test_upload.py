@@ -0,0 +1,77 @@
+import io
+from msgraph import fake, files
+
+
+def recording_graph():
+    graph = fake.FakeGraph()
+    graph.requests = []
+    handle = graph.handle
+
+    def recorded(method, url, headers, body):
+        graph.requests.append((method, url, headers.get('Content-Range')))
+        return handle(method, url, headers, body)
+
+    graph.handle = recorded
+    return graph
+
+
+def sessions(graph):
+    return [url for method, url, content_range in graph.requests if 'createUploadSession' in url]
+
+
+def test_small_content_simple():
+    graph = recording_graph()
+    drive = graph.drive()
+    folder = drive.add_folder('Reports')
+    item = files.DriveItem.upload(graph.api(), 'café', parent=folder['id'], file_name='note.txt')
+    assert item.size == 5
+    assert drive.contents[item.id] == 'café'.encode('utf-8')
+    assert not sessions(graph)
+
+
+def test_str_measured_encoded(monkeypatch):
+    monkeypatch.setattr(files.DriveItem, 'simple_upload_limit', 4)
+    graph = recording_graph()
+    folder = graph.drive().add_folder('Reports')
+    # 4 characters, 5 bytes
+    files.DriveItem.upload(graph.api(), 'café', parent=folder['id'], file_name='note.txt')
+    assert len(sessions(graph)) == 1
+
+
+def test_empty_content_simple():
+    graph = recording_graph()
+    drive = graph.drive()
+    folder = drive.add_folder('Reports')
+    for content in (b'', '', io.BytesIO()):
+        item = files.DriveItem.upload(graph.api(), content, parent=folder['id'], file_name='empty.txt')
+        assert item.size == 0
+    item = files.DriveItem.upload_large(graph.api(), b'', parent=folder['id'], file_name='empty.txt')
+    assert item.size == 0
+    assert not sessions(graph)
+    assert all(content_range is None for method, url, content_range in graph.requests)
+
+
+def test_small_file_simple(tmp_path):
+    graph = recording_graph()
+    drive = graph.drive()
+    folder = drive.add_folder('Reports')
+    local = tmp_path / 'export.csv'
+    local.write_bytes(b'a,b\n1,2\n')
+    item = files.DriveItem.upload(graph.api(), path=str(local), parent=folder['id'], file_name='export.csv')
+    assert drive.contents[item.id] == b'a,b\n1,2\n'
+    with open(str(local), 'rb') as input_file:
+        item = files.DriveItem.upload(graph.api(), input_file, parent=folder['id'], file_name='copy.csv')
+    assert drive.contents[item.id] == b'a,b\n1,2\n'
+    assert not sessions(graph)
+
+
+def test_large_file_session(tmp_path, monkeypatch):
+    monkeypatch.setattr(files.DriveItem, 'simple_upload_limit', 4)
+    graph = recording_graph()
+    drive = graph.drive()
+    folder = drive.add_folder('Reports')
+    local = tmp_path / 'export.csv'
+    local.write_bytes(b'a,b\n1,2\n')
+    item = files.DriveItem.upload(graph.api(), path=str(local), parent=folder['id'], file_name='export.csv')
+    assert drive.contents[item.id] == b'a,b\n1,2\n'
+    assert len(sessions(graph)) == 1
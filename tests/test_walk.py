@@ -0,0 +1,38 @@
+from msgraph import fake, files
+
+
+def test_walk():
+    graph = fake.FakeGraph()
+    drive = graph.drive()
+    expected = set()
+    for folder in ('A', 'A/B', 'C'):
+        drive.add_folder(folder)
+        expected.add(folder)
+        for index in range(3):
+            drive.add_file('%s/%i.txt' % (folder, index), b'x')
+            expected.add('%s/%i.txt' % (folder, index))
+    walker = files.DriveItem.walk(graph.api(), max_workers=3, page_size=2)
+    assert set(path for path, item in walker) == expected
+    assert walker.folder_count == 4
+    assert walker.item_count == len(expected)
+
+
+def test_walk_streams_pages():
+    graph = fake.FakeGraph()
+    drive = graph.drive()
+    for index in range(10):
+        drive.add_file('%02i.txt' % index, b'x')
+    requests = []
+    handle = graph.handle
+
+    def counted(method, url, headers, body):
+        requests.append(url)
+        return handle(method, url, headers, body)
+
+    graph.handle = counted
+    walker = iter(files.DriveItem.walk(graph.api(), max_workers=1, page_size=2))
+    next(walker)
+    # the first page, and at most the page fetched ahead of it
+    assert len(requests) <= 2
+    assert len(list(walker)) == 9
+    assert len(requests) == 5